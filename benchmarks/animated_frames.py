@@ -0,0 +1,78 @@
+"""Check that `AnimatedGradient` holds its frame budget on wide terminals.
+
+Prints every frame of one cycle to a console of each width, first while \
+    the frames are computed and then again from the frame cache, and \
+    reports the 95th percentile frame time of each. With `--check`, exits \
+    with status 1 if that is over the budget of 30 frames per second.
+
+Run with `python benchmarks/animated_frames.py [--check]`.
+"""
+
+import io
+import sys
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from maxgradient.animated import ANIMATION_EFFECTS, AnimatedGradient
+
+WIDTHS = (80, 200, 400)
+LINES = 10
+COLORS = ["#ff00ff", "#5f00ff", "#00afff", "#00ff00"]
+FRAME_BUDGET_MS = 1000 / 30
+
+console = Console()
+
+
+class FrameClock:
+    """A clock that steps through the frames of a cycle one at a time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def frame_time(animation: AnimatedGradient, clock: FrameClock, output: Console):
+    """Print one cycle of frames and return the 95th percentile time in ms."""
+    times = []
+    for frame in range(animation.frames):
+        clock.now = (frame + 0.5) * animation.duration / animation.frames
+        start = time.perf_counter()
+        output.print(animation)
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times[int(len(times) * 0.95) - 1]
+
+
+def main(check: bool = False) -> int:
+    table = Table(
+        "Width",
+        "Effect",
+        "First cycle (ms)",
+        "Cached cycle (ms)",
+        title=f"95th percentile frame time, {LINES} lines",
+    )
+    over_budget = False
+    for width in WIDTHS:
+        line = ("Loading the splash screen... " * width)[:width]
+        text = "\n".join([line] * LINES)
+        for effect in ANIMATION_EFFECTS:
+            clock = FrameClock()
+            animation = AnimatedGradient(text, COLORS, effect=effect, clock=clock)
+            output = Console(file=io.StringIO(), width=width, color_system="truecolor")
+            first = frame_time(animation, clock, output)
+            cached = frame_time(animation, clock, output)
+            over_budget |= max(first, cached) > FRAME_BUDGET_MS
+            table.add_row(str(width), effect, f"{first:.2f}", f"{cached:.2f}")
+    console.print(table)
+    if check and over_budget:
+        console.print(f"[b red]Over budget:[/] {FRAME_BUDGET_MS:.1f} ms per frame.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(check="--check" in sys.argv))
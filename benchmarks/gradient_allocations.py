@@ -0,0 +1,87 @@
+"""Track the memory allocated while constructing a `Gradient`.
+
+Reports the peak traced memory, and the memory and number of memory \
+    blocks still allocated once construction finishes, per character of \
+    text. With `--check`, exits with status 1 if any exceeds its budget, so \
+    regressions in the construction path are caught.
+
+Run with `python benchmarks/gradient_allocations.py [--check]`.
+"""
+
+import sys
+import tracemalloc
+from typing import Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from maxgradient.gradient import Gradient
+
+TEXT_LENGTHS = (1_000, 10_000, 100_000, 1_000_000)
+COLORS = ["#ff00ff", "#5f00ff", "#00afff", "#00ff00"]
+PEAK_BYTES_PER_CHARACTER = 64
+RETAINED_BYTES_PER_CHARACTER = 32
+RETAINED_BLOCKS_PER_CHARACTER = 0.25
+
+console = Console()
+
+
+def trace_construction(text: str) -> Tuple[int, int, int]:
+    """Construct a gradient while tracing allocations.
+
+    Returns:
+        Tuple[int, int, int]: The peak traced bytes, and the bytes and the \
+            number of blocks retained once construction finishes.
+    """
+    # Construct once beforehand so shared caches are already warm
+    Gradient(text, colors=COLORS)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    gradient = Gradient(text, colors=COLORS)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    differences = after.compare_to(before, "filename")
+    retained_bytes = sum(stat.size_diff for stat in differences)
+    retained_blocks = sum(stat.count_diff for stat in differences)
+    del gradient
+    return peak, retained_bytes, retained_blocks
+
+
+def main(check: bool = False) -> int:
+    table = Table(
+        "Characters",
+        "Peak (bytes/char)",
+        "Retained (bytes/char)",
+        "Retained blocks/char",
+        title="Gradient construction allocations",
+    )
+    over_budget = False
+    for length in TEXT_LENGTHS:
+        text = ("The quick brown fox jumps over the lazy dog. " * length)[:length]
+        peak, retained_bytes, retained_blocks = trace_construction(text)
+        peak_per_character = peak / length
+        bytes_per_character = retained_bytes / length
+        blocks_per_character = retained_blocks / length
+        over_budget |= peak_per_character > PEAK_BYTES_PER_CHARACTER
+        over_budget |= bytes_per_character > RETAINED_BYTES_PER_CHARACTER
+        over_budget |= blocks_per_character > RETAINED_BLOCKS_PER_CHARACTER
+        table.add_row(
+            f"{length:,}",
+            f"{peak_per_character:.1f}",
+            f"{bytes_per_character:.1f}",
+            f"{blocks_per_character:.2f}",
+        )
+    console.print(table)
+    if check and over_budget:
+        console.print(
+            f"[b red]Over budget:[/] {PEAK_BYTES_PER_CHARACTER} bytes/char peak, "
+            f"{RETAINED_BYTES_PER_CHARACTER} retained bytes/char, "
+            f"{RETAINED_BLOCKS_PER_CHARACTER} retained blocks/char."
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(check="--check" in sys.argv))
@@ -0,0 +1,76 @@
+"""Benchmark joining many gradient fragments against appending them to a `Text`.
+
+Joins short gradients separated by styled text, as a log line or a banner \
+    is assembled, and reports the time of `Gradient.concat` next to calling \
+    `Text.append` once per fragment.
+
+Run with `python benchmarks/gradient_concat.py`.
+"""
+
+import timeit
+from typing import List, Tuple, Union
+
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+from maxgradient.gradient import Gradient
+
+FRAGMENT_COUNTS = (100, 1_000, 10_000)
+COLORS = ["#ff00ff", "#5f00ff", "#00afff", "#00ff00"]
+FRAGMENT = "a gradient fragment of forty characters "
+REPEAT = 3
+
+console = Console()
+
+Part = Union[Text, Tuple[str, str]]
+
+
+def fragments(count: int) -> List[Part]:
+    """Generate gradient fragments, each followed by a styled separator."""
+    parts: List[Part] = []
+    for _ in range(count):
+        parts.append(Gradient(FRAGMENT, colors=COLORS))
+        parts.append((" | ", "bold"))
+    return parts
+
+
+def append_all(parts: List[Part]) -> Text:
+    """Join the fragments with one `Text.append` each."""
+    text = Text()
+    for part in parts:
+        if isinstance(part, tuple):
+            text.append(*part)
+        else:
+            text.append(part)
+    return text
+
+
+def best(function) -> float:
+    """The fastest of a few runs, in milliseconds."""
+    return min(timeit.repeat(function, number=1, repeat=REPEAT)) * 1000
+
+
+def main() -> None:
+    table = Table(
+        "Fragments",
+        "Characters",
+        "Text.append (ms)",
+        "Gradient.concat (ms)",
+        title="Joining gradient fragments",
+    )
+    for count in FRAGMENT_COUNTS:
+        # Separate fragments, as appending turns each one's spans into a list
+        appended = fragments(count)
+        joined = fragments(count)
+        table.add_row(
+            f"{count:,}",
+            f"{count * (len(FRAGMENT) + 3):,}",
+            f"{best(lambda: append_all(appended)):.1f}",
+            f"{best(lambda: Gradient.concat(joined)):.1f}",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
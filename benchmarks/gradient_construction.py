@@ -0,0 +1,101 @@
+"""Benchmark the construction of `Gradient` against the original pipeline.
+
+The original pipeline split the text with `np.array_split`, built one \
+    `SimpleGradient` per pair of colors and joined them with `Text.append`. \
+    It is reproduced here so the single-pass engine can be compared to it.
+
+Run with `python benchmarks/gradient_construction.py`.
+"""
+
+import timeit
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+from rich.text import Span, Text
+
+from maxgradient._simple_gradient import SimpleGradient
+from maxgradient.color import Color
+from maxgradient.color_list import ColorList
+from maxgradient.gradient import Gradient
+from maxgradient.ramp import ramp_cache
+
+TEXT_LENGTH = 4096
+STOP_COUNTS = (2, 4, 8, 16, 32, 64)
+REPEAT = 5
+
+console = Console()
+
+
+def legacy_spans(text: str, colors: List[str]) -> List[Span]:
+    """Build the spans of a gradient the way the original pipeline did."""
+    validated = [Color(color) for color in colors]
+    indexes = np.array_split(np.arange(len(text)), len(validated) - 1)
+    substrings = [text[index[0] : index[-1] + 1] for index in indexes]
+    result = Text()
+    for index, substring in enumerate(substrings):
+        result.append(
+            SimpleGradient(
+                substring,
+                color1=validated[index].hex,
+                color2=validated[index + 1].hex,
+            )
+        )
+    return result.spans
+
+
+def engine_spans(text: str, colors: List[str]) -> List[Span]:
+    """Build the spans of a gradient with the single-pass engine."""
+    # Measure a cold construction rather than a hit in the ramp cache
+    ramp_cache.clear()
+    return Gradient(text, colors=colors).spans
+
+
+def measure(function: Callable[[], object]) -> Tuple[float, int]:
+    """Time a function and record its peak memory.
+
+    Returns:
+        Tuple[float, int]: The best time in milliseconds and the peak \
+            allocation in kibibytes.
+    """
+    seconds = min(timeit.repeat(function, number=1, repeat=REPEAT))
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds * 1000, peak // 1024
+
+
+def main() -> None:
+    text = ("The quick brown fox jumps over the lazy dog. " * TEXT_LENGTH)[
+        :TEXT_LENGTH
+    ]
+    palette = [color.hex for color in ColorList(max(STOP_COUNTS)).color_list]
+    table = Table(
+        "Stops",
+        "Pipeline (ms)",
+        "Engine (ms)",
+        "Speedup",
+        "Pipeline peak (KiB)",
+        "Engine peak (KiB)",
+        title=f"Gradient construction, {TEXT_LENGTH} characters",
+    )
+    for stops in STOP_COUNTS:
+        colors = palette[:stops]
+        legacy_time, legacy_peak = measure(lambda: legacy_spans(text, colors))
+        engine_time, engine_peak = measure(lambda: engine_spans(text, colors))
+        table.add_row(
+            str(stops),
+            f"{legacy_time:.2f}",
+            f"{engine_time:.2f}",
+            f"{legacy_time / engine_time:.1f}x",
+            str(legacy_peak),
+            str(engine_peak),
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
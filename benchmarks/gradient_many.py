@@ -0,0 +1,60 @@
+"""Benchmark `gradient_many` against a loop of `Gradient` constructors.
+
+Colors a column of table cells, as a `Table` with many gradient cells \
+    would, and reports the time per cell of each approach.
+
+Run with `python benchmarks/gradient_many.py`.
+"""
+
+import timeit
+
+from rich.console import Console
+from rich.table import Table
+
+from maxgradient.gradient import Gradient, gradient_many
+from maxgradient.ramp import ramp_cache
+
+CELL_COUNTS = (100, 1_000, 10_000)
+COLORS = ["#ff00ff", "#5f00ff", "#00afff", "#00ff00"]
+REPEAT = 3
+
+console = Console()
+
+
+def constructor_loop(texts):
+    """Color each text with its own `Gradient` constructor."""
+    ramp_cache.clear()
+    return [Gradient(text, colors=COLORS) for text in texts]
+
+
+def batch(texts):
+    """Color every text with a single `gradient_many` call."""
+    ramp_cache.clear()
+    return gradient_many(texts, colors=COLORS)
+
+
+def main() -> None:
+    table = Table(
+        "Cells",
+        "Loop (µs/cell)",
+        "gradient_many (µs/cell)",
+        "Speedup",
+        title="Coloring table cells",
+    )
+    for count in CELL_COUNTS:
+        texts = [f"Row {index}: value {index * 7 % 1000}" for index in range(count)]
+        loop_time = min(
+            timeit.repeat(lambda: constructor_loop(texts), number=1, repeat=REPEAT)
+        )
+        batch_time = min(timeit.repeat(lambda: batch(texts), number=1, repeat=REPEAT))
+        table.add_row(
+            f"{count:,}",
+            f"{loop_time / count * 1e6:.1f}",
+            f"{batch_time / count * 1e6:.1f}",
+            f"{loop_time / batch_time:.1f}x",
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark wrapping and slicing a gradient paragraph against `rich.text.Text`.
+
+Wraps a single paragraph, and text of many short paragraphs, with one span \
+    per character, as a gradient has, and reports the time of the indexed \
+    spans of `Gradient` next to the same text and spans in a plain `Text`.
+
+Run with `python benchmarks/gradient_wrap.py`.
+"""
+
+import os
+import timeit
+from random import Random
+
+from rich.console import Console
+from rich.table import Table
+
+from maxgradient.gradient import Gradient
+
+LENGTHS = (10_000, 100_000, 1_000_000)
+PARAGRAPH_COUNTS = (100, 1_000, 5_000)
+PARAGRAPH_LENGTH = 44
+COLORS = ["#ff00ff", "#5f00ff", "#00afff", "#00ff00"]
+WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing")
+WIDTH = 80
+REPEAT = 3
+
+console = Console()
+
+
+def paragraph(length: int) -> str:
+    """Generate a single paragraph of words."""
+    rng = Random(length)
+    words = [rng.choice(WORDS) for _ in range(length // 6 + 1)]
+    return " ".join(words)[:length]
+
+
+def paragraphs(count: int) -> str:
+    """Generate many short paragraphs, one per line."""
+    return "\n".join(paragraph(PARAGRAPH_LENGTH + index % 7) for index in range(count))
+
+
+def best(function) -> float:
+    """The fastest of a few runs, in milliseconds."""
+    return min(timeit.repeat(function, number=1, repeat=REPEAT)) * 1000
+
+
+def main() -> None:
+    with open(os.devnull, "w") as devnull:
+        output = Console(file=devnull, width=WIDTH)
+        table = Table(
+            "Characters",
+            "Text.wrap (ms)",
+            "Gradient.wrap (ms)",
+            "Text slice (ms)",
+            "Gradient slice (ms)",
+            title=f"Wrapping a paragraph at {WIDTH} columns",
+        )
+        for length in LENGTHS:
+            gradient = Gradient(paragraph(length), colors=COLORS)
+            text = gradient.as_text()
+            middle = slice(length // 4, length - length // 4)
+            table.add_row(
+                f"{length:,}",
+                f"{best(lambda: text.wrap(output, WIDTH)):.1f}",
+                f"{best(lambda: gradient.wrap(output, WIDTH)):.1f}",
+                f"{best(lambda: text[middle]):.1f}",
+                f"{best(lambda: gradient[middle]):.1f}",
+            )
+        console.print(table)
+
+        table = Table(
+            "Paragraphs",
+            "Characters",
+            "Text.wrap (ms)",
+            "Gradient.wrap (ms)",
+            title=f"Wrapping many paragraphs at {WIDTH} columns",
+        )
+        for count in PARAGRAPH_COUNTS:
+            gradient = Gradient(paragraphs(count), colors=COLORS)
+            text = gradient.as_text()
+            table.add_row(
+                f"{count:,}",
+                f"{len(text):,}",
+                f"{best(lambda: text.wrap(output, WIDTH)):.1f}",
+                f"{best(lambda: gradient.wrap(output, WIDTH)):.1f}",
+            )
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,20 +21,29 @@ from rich.progress import Progress, Task
 from rich.style import Style, StyleType
 from rich.text import Span, Text, TextType
 
+from maxgradient.animated import AnimatedGradient
 from maxgradient.color import Color
 from maxgradient.color_list import ColorList
-from maxgradient.gradient import Gradient
-from maxgradient.rule import GradientRule
+from maxgradient.filter import GradientFilter
+from maxgradient.gradient import Gradient, gradient_many
+from maxgradient.ramp import GradientRamp
+from maxgradient.rule import GradientRule, RuleCache
 from maxgradient.spectrum import Spectrum
+from maxgradient.streaming import GradientStream, stream
 from maxgradient.theme import GRADIENT_TERMINAL_THEME, GradientTheme
 
 __version__ = "0.3.1"
 
 __all__ = [
+    "AnimatedGradient",
     "Color",
     "ColorList",
     "Gradient",
+    "gradient_many",
+    "GradientFilter",
+    "GradientRamp",
     "GradientRule",
+    "GradientStream",
     "GRADIENT_TERMINAL_THEME",
     "GradientTheme",
     "Gradient",
@@ -47,9 +56,11 @@ __all__ = [
     "Progress",
     "RenderableType",
     "RenderResult",
+    "RuleCache",
     "Span",
     "Spectrum",
     "Style",
+    "stream",
     "StyleType",
     "Task",
     "Text",
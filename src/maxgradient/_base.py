@@ -0,0 +1,524 @@
+"""Rendering behaviour shared by the gradient classes."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from rich._pick import pick_bool
+from rich._wrap import divide_line
+from rich.cells import cell_len
+from rich.console import Console, ConsoleOptions, JustifyMethod, OverflowMethod
+from rich.containers import Lines
+from rich.control import strip_control_codes
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import StyleType
+from rich.text import Span, Text
+
+from maxgradient._spans import SpanArray
+
+DEFAULT_JUSTIFY: JustifyMethod = "default"
+DEFAULT_OVERFLOW: OverflowMethod = "fold"
+WRAP_CACHE_SIZE = 8
+WRAP_CACHE_SPANS = 4096
+"""The most spans of wrapped lines to cache when they are not in a `SpanArray`."""
+WrapKey = Tuple[int, JustifyMethod, OverflowMethod, int, bool]
+TEXT_SPANS = Text.__dict__["_spans"]
+"""The slot of `rich.text.Text` that holds its list of spans."""
+
+
+def measure_text(text: str) -> Measurement:
+    """Measure the minimum and maximum width of text in a single pass.
+
+    The minimum width is the widest word and the maximum width is the \
+        widest line, matching `rich.text.Text.__rich_measure__`.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        Measurement: The minimum and maximum cell width of the text.
+    """
+    max_line_width = 0
+    max_word_width = 0
+    has_words = False
+    for line in text.splitlines():
+        line_width = cell_len(line)
+        if line_width > max_line_width:
+            max_line_width = line_width
+        words = line.split()
+        if words:
+            has_words = True
+            # No word can be wider than the line that contains it
+            if line_width > max_word_width:
+                for word in words:
+                    word_width = cell_len(word)
+                    if word_width > max_word_width:
+                        max_word_width = word_width
+    if not has_words:
+        max_word_width = max_line_width
+    return Measurement(max_word_width, max_line_width)
+
+
+class BaseGradient(Text):
+    """Base class of the gradient `Text` subclasses.
+
+    Caches the measurement of the text, which rich requests again for \
+        every layout pass of a `Panel`, `Table` or `Columns`, and the wrapped \
+        lines of each width it is rendered at.
+
+    Generated spans are kept in a `SpanArray`, and only turned into the \
+        list of `Span` that `rich.text.Text` works with when `_spans` is \
+        first used. While the spans are sorted and disjoint, dividing, \
+        slicing and wrapping find the spans of each line by binary search \
+        instead of looking up every span.
+    """
+
+    __slots__ = (
+        "_measurement",
+        "_wrap_cache",
+        "_wrap_stamp",
+        "_span_index",
+        "_span_array",
+    )
+
+    _measurement: Optional[Tuple[str, Measurement]]
+    _wrap_cache: Dict[WrapKey, "BaseGradient"]
+    _wrap_stamp: Tuple[Any, ...]
+    _span_index: Tuple[Any, ...]
+    _span_array: Optional[SpanArray]
+
+    @property  # type: ignore[override]
+    def _spans(self) -> List[Span]:
+        """The list of spans, created from the span array on first use."""
+        try:
+            array = self._span_array
+        except AttributeError:
+            array = None
+        if array is not None:
+            spans = array.to_spans()
+            self._spans = spans
+            return spans
+        return TEXT_SPANS.__get__(self, Text)
+
+    @_spans.setter
+    def _spans(self, spans: List[Span]) -> None:
+        self._span_array = None
+        TEXT_SPANS.__set__(self, spans)
+
+    def set_span_array(self, spans: SpanArray) -> None:
+        """Replace the spans with a span array, without creating a list.
+
+        Args:
+            spans (SpanArray): The new spans.
+        """
+        self._span_array = spans
+        try:
+            TEXT_SPANS.__delete__(self)
+        except AttributeError:
+            pass
+
+    def stored_spans(self) -> Union[SpanArray, List[Span]]:
+        """Get the spans in the form they are stored in, without converting.
+
+        Returns:
+            SpanArray|List[Span]: The span array, or the list of spans once \
+                it has been created.
+        """
+        try:
+            array = self._span_array
+        except AttributeError:
+            array = None
+        if array is not None:
+            return array
+        return TEXT_SPANS.__get__(self, Text)
+
+    def copy_spans(self) -> List[Span]:
+        """Get a new list of the spans, leaving them stored as they are.
+
+        Returns:
+            List[Span]: The spans, in a list the caller may change.
+        """
+        spans = self.stored_spans()
+        if isinstance(spans, SpanArray):
+            return spans.to_spans()
+        return spans.copy()
+
+    @staticmethod
+    def concat(
+        parts: Iterable[Union[str, Text, Tuple[str, StyleType]]],
+        *,
+        style: StyleType = "",
+        justify: Optional[JustifyMethod] = None,
+        overflow: Optional[OverflowMethod] = None,
+        no_wrap: Optional[bool] = None,
+        end: str = "\n",
+        tab_size: Optional[int] = None,
+    ) -> "BaseGradient":
+        """Join text and gradients, as appending each part in turn would.
+
+        The offset of every part is known before any span is moved, so the \
+            spans of all the parts are shifted at once with array arithmetic \
+            and the text is joined once, instead of shifting the spans of \
+            each part one at a time with `Text.append`.
+
+        Args:
+            parts (Iterable[str|Text|Tuple[str, StyleType]]): The parts to \
+                join: strings, `Text` or gradients, or `(text, style)` pairs.
+            style (StyleType, optional): The base style. Defaults to "".
+            justify (JustifyMethod, optional): The justify method. Defaults \
+                to None.
+            overflow (OverflowMethod, optional): The overflow method. \
+                Defaults to None.
+            no_wrap (bool, optional): Disable wrapping. Defaults to None.
+            end (str, optional): The character to end the text with. \
+                Defaults to "\\\\n".
+            tab_size (int, optional): The tab size. Defaults to None.
+
+        Returns:
+            BaseGradient: The joined text, which keeps its spans as a `SpanArray` \
+                while they are sorted and disjoint, as a gradient does.
+        """
+        plains: List[str] = []
+        span_parts: List[Union[SpanArray, List[Span]]] = []
+        offsets: List[int] = []
+        offset = 0
+        for part in parts:
+            if isinstance(part, Text):
+                plain = part.plain
+                part_style = part.style
+            elif isinstance(part, str):
+                plain = strip_control_codes(part)
+                part_style = ""
+            else:
+                plain = strip_control_codes(part[0])
+                part_style = part[1]
+            if not plain:
+                continue
+            if part_style:
+                span_parts.append([Span(0, len(plain), part_style)])
+                offsets.append(offset)
+            if isinstance(part, BaseGradient):
+                span_parts.append(part.stored_spans())
+                offsets.append(offset)
+            elif isinstance(part, Text):
+                span_parts.append(part._spans)
+                offsets.append(offset)
+            plains.append(plain)
+            offset += len(plain)
+
+        joined = BaseGradient(
+            style=style,
+            justify=justify,
+            overflow=overflow,
+            no_wrap=no_wrap,
+            end=end,
+            tab_size=tab_size,
+        )
+        joined._text = ["".join(plains)]
+        joined._length = offset
+        array = SpanArray.concat(span_parts, offsets)
+        if array.is_disjoint():
+            joined.set_span_array(array)
+        else:
+            joined._spans = array.to_spans()
+        return joined
+
+    def _share_spans(self, plain: str, spans: SpanArray) -> "BaseGradient":
+        """Create text with the same settings that shares a span array.
+
+        The span array is read-only, so the text only gets a list of spans of \
+            its own, created from the array, once it is changed.
+
+        Args:
+            plain (str): The text, already free of control codes.
+            spans (SpanArray): The spans of the text.
+
+        Returns:
+            BaseGradient: The new text.
+        """
+        shared = BaseGradient(
+            style=self.style,
+            justify=self.justify,
+            overflow=self.overflow,
+            no_wrap=self.no_wrap,
+            end=self.end,
+            tab_size=self.tab_size,
+        )
+        shared._text = [plain]
+        shared._length = len(plain)
+        shared.set_span_array(spans)
+        return shared
+
+    def copy(self) -> Text:
+        """Return a copy of this instance.
+
+        While the spans are stored in a span array, the copy shares it \
+            instead of duplicating a span per character, and creates a list \
+            of its own only when it is changed, as by `stylize` or `append`.
+
+        Returns:
+            Text: The copy.
+        """
+        spans = self.stored_spans()
+        if not isinstance(spans, SpanArray):
+            return super().copy()
+        plain = self.plain
+        copied = self._share_spans(plain, spans)
+        try:
+            copied._measurement = self._measurement
+        except AttributeError:
+            pass
+        return copied
+
+    def __getitem__(self, index: Union[int, slice]) -> Text:
+        spans = self.indexed_spans()
+        if spans is None:
+            return super().__getitem__(index)
+        if isinstance(index, int):
+            if index < 0:
+                return super().__getitem__(index)
+            return Text(self.plain[index], spans=spans.clip(index, index + 1), end="")
+        start, stop, step = index.indices(len(self))
+        if step != 1 or stop < start:
+            return super().__getitem__(index)
+        sliced = self._share_spans(self.plain[start:stop], spans.crop(start, stop))
+        # Match the settings of the lines `Text.divide` slices with
+        sliced.no_wrap = None
+        sliced.end = "\n"
+        sliced.tab_size = None
+        return sliced
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterable[Segment]:
+        tab_size: int = console.tab_size if self.tab_size is None else self.tab_size
+        justify = self.justify or options.justify or DEFAULT_JUSTIFY
+        overflow = self.overflow or options.overflow or DEFAULT_OVERFLOW
+
+        all_lines = self.wrap_joined(
+            console,
+            options.max_width,
+            justify=justify,
+            overflow=overflow,
+            tab_size=tab_size or 8,
+            no_wrap=pick_bool(self.no_wrap, options.no_wrap, False),
+        )
+        yield from all_lines.render(console, end=self.end)
+
+    def wrap_joined(
+        self,
+        console: Console,
+        width: int,
+        *,
+        justify: JustifyMethod,
+        overflow: OverflowMethod,
+        tab_size: int,
+        no_wrap: bool,
+    ) -> Text:
+        """Word wrap the text and join the lines, reusing earlier results.
+
+        The joined lines are cached per width and wrapping options until the \
+            text, its spans or its style change. Their spans are cached as a \
+            `SpanArray`, and each call gets a copy that shares it, so that \
+            rendering the copy does not keep a `Span` per character in the \
+            cache. Lines whose spans overlap, as when the text has a style, \
+            are only cached while they have at most `WRAP_CACHE_SPANS` spans.
+
+        Args:
+            console (Console): Console instance.
+            width (int): Number of cells available per line.
+            justify (JustifyMethod): Justify method.
+            overflow (OverflowMethod): Overflow method.
+            tab_size (int): Size of tabs.
+            no_wrap (bool): Disable wrapping.
+
+        Returns:
+            Text: The wrapped lines joined with newlines.
+        """
+        plain = self.plain
+        spans = self.stored_spans()
+        style = self.style
+        try:
+            cache = self._wrap_cache
+            cached_plain, cached_spans, span_count, cached_style = self._wrap_stamp
+        except AttributeError:
+            cache = None
+        else:
+            if not (
+                cached_plain is plain
+                and cached_spans is spans
+                and span_count == len(spans)
+                and cached_style == style
+            ):
+                cache = None
+        if cache is None:
+            cache = self._wrap_cache = {}
+            self._wrap_stamp = (plain, spans, len(spans), style)
+
+        key: WrapKey = (width, justify, overflow, tab_size, no_wrap)
+        try:
+            return cache[key].copy()
+        except KeyError:
+            pass
+        lines = self.wrap(
+            console,
+            width,
+            justify=justify,
+            overflow=overflow,
+            tab_size=tab_size,
+            no_wrap=no_wrap,
+        )
+        parts: List[Union[str, Text]] = []
+        for line in lines:
+            parts.append(line)
+            parts.append("\n")
+        all_lines = self.concat(parts[:-1])
+        joined_spans = all_lines.stored_spans()
+        if isinstance(joined_spans, SpanArray) or len(joined_spans) <= WRAP_CACHE_SPANS:
+            if len(cache) >= WRAP_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = all_lines
+            return all_lines.copy()
+        return all_lines
+
+    def indexed_spans(self) -> Optional[SpanArray]:
+        """Get the spans as a sorted span array, to search by offset.
+
+        Returns:
+            Optional[SpanArray]: The stored span array, or one built from the \
+                list of spans again if they changed. None if the spans overlap \
+                or are out of order, such as after `stylize`.
+        """
+        plain = self.plain
+        spans = self.stored_spans()
+        if isinstance(spans, SpanArray):
+            # Generated span arrays are always sorted and disjoint
+            return spans
+        try:
+            indexed_plain, indexed_spans, span_count, index = self._span_index
+        except AttributeError:
+            pass
+        else:
+            if (
+                indexed_plain is plain
+                and indexed_spans is spans
+                and span_count == len(spans)
+            ):
+                return index
+        array: Optional[SpanArray] = SpanArray.from_spans(spans)
+        if not array.is_disjoint():  # type: ignore[union-attr]
+            array = None
+        self._span_index = (plain, spans, len(spans), array)
+        return array
+
+    def _divide_ranges(self, index: SpanArray, offsets: List[int]) -> Lines:
+        text = self.plain
+        style = self.style
+        justify = self.justify
+        overflow = self.overflow
+        _Text = Text
+        lines = []
+        for start, end, spans in zip(offsets, offsets[1:], index.divide(offsets)):
+            line = _Text(
+                text[start:end], style=style, justify=justify, overflow=overflow
+            )
+            line._spans = spans
+            lines.append(line)
+        return Lines(lines)
+
+    def divide(self, offsets: Iterable[int]) -> Lines:
+        """Divide text into a number of lines at given offsets.
+
+        Args:
+            offsets (Iterable[int]): Offsets used to divide text.
+
+        Returns:
+            Lines: New Text instances between offsets.
+        """
+        index = self.indexed_spans()
+        if index is None:
+            return super().divide(offsets)
+        _offsets = list(offsets)
+        if not _offsets:
+            return Lines([self.copy()])
+        return self._divide_ranges(index, [0, *_offsets, len(self.plain)])
+
+    def wrap(
+        self,
+        console: Console,
+        width: int,
+        *,
+        justify: Optional[JustifyMethod] = None,
+        overflow: Optional[OverflowMethod] = None,
+        tab_size: int = 8,
+        no_wrap: Optional[bool] = None,
+    ) -> Lines:
+        """Word wrap the text, as `rich.text.Text.wrap`.
+
+        Each paragraph is divided at its word wrap offsets straight from the \
+            indexed spans, rather than split into lines that are then divided \
+            again without the index.
+
+        Args:
+            console (Console): Console instance.
+            width (int): Number of cells available per line.
+            justify (str, optional): Justify method. Defaults to "default".
+            overflow (str, optional): Overflow method. Defaults to None.
+            tab_size (int, optional): Default tab size. Defaults to 8.
+            no_wrap (bool, optional): Disable wrapping. Defaults to False.
+
+        Returns:
+            Lines: Number of lines.
+        """
+        wrap_justify = justify or self.justify or DEFAULT_JUSTIFY
+        wrap_overflow = overflow or self.overflow or DEFAULT_OVERFLOW
+        text = self.plain
+        index = None
+        if not (pick_bool(no_wrap, self.no_wrap, False) or overflow == "ignore"):
+            if "\t" not in text:
+                index = self.indexed_spans()
+        if index is None:
+            return super().wrap(
+                console,
+                width,
+                justify=justify,
+                overflow=overflow,
+                tab_size=tab_size,
+                no_wrap=no_wrap,
+            )
+
+        fold = wrap_overflow == "fold"
+        lines = Lines()
+        start = 0
+        for paragraph in text.split("\n"):
+            end = start + len(paragraph)
+            offsets = [
+                start + offset for offset in divide_line(paragraph, width, fold=fold)
+            ]
+            new_lines = self._divide_ranges(index, [start, *offsets, end])
+            for line in new_lines:
+                line.rstrip_end(width)
+            if wrap_justify:
+                new_lines.justify(
+                    console, width, justify=wrap_justify, overflow=wrap_overflow
+                )
+            for line in new_lines:
+                line.truncate(width, overflow=wrap_overflow)
+            lines.extend(new_lines)
+            start = end + 1
+        return lines
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        text = self.plain
+        try:
+            measured_text, measurement = self._measurement  # type: ignore
+        except (AttributeError, TypeError):
+            pass
+        else:
+            # Strings are immutable, so the same object means the same text.
+            if measured_text is text:
+                return measurement
+        measurement = measure_text(text)
+        self._measurement = (text, measurement)
+        return measurement
@@ -0,0 +1,405 @@
+"""Vectorized color ramps shared by the gradient classes."""
+
+import math
+import re
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+from rich.cells import get_character_cell_size
+from rich.color import Color as RichColor
+from rich.color_triplet import ColorTriplet
+from rich.style import Style
+from rich.text import Span
+
+from maxgradient.color import Color
+
+WHITESPACE_RUN_REGEX = re.compile(r"\s+")
+STYLE_POOL_SIZE = 4096
+CELL_WIDTHS: Dict[int, int] = {}
+CELL_ASPECT = 2.0
+"""The height of a terminal cell relative to its width."""
+
+GradientMode = Literal["default", "vertical", "diagonal", "radial"]
+GRADIENT_MODES: Tuple[str, ...] = ("default", "vertical", "diagonal", "radial")
+RainbowStyle = Literal["hue", "sine"]
+RAINBOW_STYLES: Tuple[str, ...] = ("hue", "sine")
+SINE_PHASES = np.array([0.0, 2.0 * math.pi / 3.0, 4.0 * math.pi / 3.0])
+HUE_SECTORS = np.array([5.0, 3.0, 1.0])
+
+
+def stops_array(colors: Sequence[Color], *, cyclic: bool = False) -> np.ndarray:
+    """Convert the gradient's colors into an array of RGB stops.
+
+    Args:
+        colors (Sequence[Color]): The colors of the gradient.
+        cyclic (bool, optional): Whether to repeat the first color at the end \
+            so the ramp loops back on itself. Defaults to False.
+
+    Returns:
+        np.ndarray: A `(stops, 3)` float array of red, green and blue values.
+    """
+    triplets = [tuple(color.triplet) for color in colors]
+    if cyclic:
+        triplets.append(triplets[0])
+    return np.array(triplets, dtype=np.float64)
+
+
+def interpolate(stops: np.ndarray, blend: np.ndarray) -> np.ndarray:
+    """Blend between the stops of a ramp.
+
+    Args:
+        stops (np.ndarray): A `(stops, 3)` array of RGB stops.
+        blend (np.ndarray): The position of each character along the ramp, \
+            from `0.0` to `1.0`.
+
+    Returns:
+        np.ndarray: A `(len(blend), 3)` uint8 array of RGB values.
+    """
+    segments = len(stops) - 1
+    if segments < 1:
+        return np.repeat(stops[:1], len(blend), axis=0).astype(np.uint8)
+    scaled = np.clip(blend, 0.0, 1.0) * segments
+    index = np.minimum(scaled.astype(np.intp), segments - 1)
+    fraction = (scaled - index)[:, np.newaxis]
+    start = stops[index]
+    rgb = start + (stops[index + 1] - start) * fraction
+    return rgb.astype(np.uint8)
+
+
+def periodic_blend(positions: np.ndarray, period: int) -> np.ndarray:
+    """Blend values for absolute positions along a periodic ramp.
+
+    Args:
+        positions (np.ndarray): The absolute position of each character.
+        period (int): The number of characters in one cycle of the ramp.
+
+    Returns:
+        np.ndarray: The blend of each position.
+    """
+    return (positions % period) / period
+
+
+def visible_mask(text: str) -> np.ndarray:
+    """Flag the characters of the text that are not whitespace.
+
+    Args:
+        text (str): The text to scan.
+
+    Returns:
+        np.ndarray: A boolean array, `False` for each whitespace character.
+    """
+    mask = np.ones(len(text), dtype=np.bool_)
+    for match in WHITESPACE_RUN_REGEX.finditer(text):
+        mask[match.start() : match.end()] = False
+    return mask
+
+
+def character_width(codepoint: int) -> int:
+    """Get the cell width of a code point from the shared width table.
+
+    Args:
+        codepoint (int): The code point of the character.
+
+    Returns:
+        int: The number of cells (0, 1 or 2) the character occupies.
+    """
+    try:
+        return CELL_WIDTHS[codepoint]
+    except KeyError:
+        width = CELL_WIDTHS[codepoint] = get_character_cell_size(chr(codepoint))
+        return width
+
+
+def cell_widths(text: str) -> np.ndarray:
+    """Get the cell width of every character of the text.
+
+    Printable ASCII is one cell wide. Each other distinct code point is \
+        looked up once in the width table, so there is no per-character \
+        Python call.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        np.ndarray: The cell width of each character.
+    """
+    if text.isascii() and text.isprintable():
+        return np.ones(len(text), dtype=np.int64)
+    codepoints = np.frombuffer(
+        text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    widths = np.ones(len(codepoints), dtype=np.int64)
+    special = (codepoints < 0x20) | (codepoints >= 0x7F)
+    if special.any():
+        unique, inverse = np.unique(codepoints[special], return_inverse=True)
+        table = np.array(
+            [character_width(codepoint) for codepoint in unique.tolist()],
+            dtype=np.int64,
+        )
+        widths[special] = table[inverse.reshape(-1)]
+    return widths
+
+
+def ramp_columns(
+    text: str,
+    *,
+    skip_whitespace: bool = False,
+    advance_whitespace: bool = True,
+) -> Tuple[np.ndarray, Optional[np.ndarray], int]:
+    """Find the position along the ramp of each colored character.
+
+    Positions are the prefix sum of cell widths, so wide characters take up \
+        as much of the ramp as they do of the terminal.
+
+    Args:
+        text (str): The text to position.
+        skip_whitespace (bool, optional): Leave whitespace uncolored. \
+            Defaults to False.
+        advance_whitespace (bool, optional): Whether skipped whitespace still \
+            advances the ramp. Defaults to True.
+
+    Returns:
+        Tuple[np.ndarray, Optional[np.ndarray], int]: The cell column of each \
+            colored character, the offsets of the colored characters (None if \
+            every character is colored), and the number of cells the text \
+            advances the ramp by.
+    """
+    widths = cell_widths(text)
+    indexes = np.flatnonzero(visible_mask(text)) if skip_whitespace else None
+    if indexes is not None and not advance_whitespace:
+        widths = widths[indexes]
+    columns = np.cumsum(widths) - widths
+    if indexes is not None and advance_whitespace:
+        columns = columns[indexes]
+    return columns, indexes, int(widths.sum())
+
+
+def grid_positions(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the row and cell column of every character of multi-line text.
+
+    Args:
+        text (str): The text to position.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row and the column of each character.
+    """
+    if not text:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    widths = cell_widths(text)
+    newlines = np.frombuffer(
+        text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    ) == ord("\n")
+    rows = np.cumsum(newlines) - newlines
+    columns = np.cumsum(widths) - widths
+    line_starts = np.flatnonzero(np.concatenate(([True], newlines[:-1])))
+    columns = columns - columns[line_starts][rows]
+    return rows, columns
+
+
+def grid_blend(
+    rows: np.ndarray,
+    columns: np.ndarray,
+    mode: GradientMode,
+    angle: float = 45.0,
+) -> np.ndarray:
+    """Blend values of a two-dimensional gradient over a grid of cells.
+
+    Args:
+        rows (np.ndarray): The row of each character.
+        columns (np.ndarray): The cell column of each character.
+        mode (GradientMode): "vertical", "diagonal" or "radial".
+        angle (float, optional): The direction of a diagonal gradient in \
+            degrees, clockwise from left-to-right. Defaults to 45.0.
+
+    Returns:
+        np.ndarray: The blend of each character.
+    """
+    if not len(rows):
+        return np.zeros(0)
+    x = columns.astype(np.float64)
+    y = rows * CELL_ASPECT
+    if mode == "vertical":
+        distance = y
+    elif mode == "diagonal":
+        radians = math.radians(angle)
+        distance = x * math.cos(radians) + y * math.sin(radians)
+    elif mode == "radial":
+        distance = np.hypot(x - x.max() / 2, y - y.max() / 2)
+    else:
+        raise ValueError(f"Unknown gradient mode {mode!r}.")
+    distance = distance - distance.min()
+    extent = distance.max()
+    return distance / extent if extent else distance
+
+
+def rainbow_rgb(
+    rows: np.ndarray,
+    columns: np.ndarray,
+    style: RainbowStyle = "sine",
+    *,
+    frequency: float = 0.1,
+    spread: float = 3.0,
+    phase: float = 0.0,
+    line_offset: float = 1.0,
+) -> np.ndarray:
+    """Compute rainbow colors directly from character positions.
+
+    Each character's phase is `frequency * (phase + row * line_offset + \
+        column / spread)`, as in lolcat. "sine" sets each channel to a sine \
+        wave of the phase, a third of a turn apart. "hue" sweeps the hue of \
+        a fully saturated color through one turn of the phase.
+
+    Args:
+        rows (np.ndarray): The row of each character.
+        columns (np.ndarray): The cell column of each character.
+        style (RainbowStyle, optional): "sine" or "hue". Defaults to "sine".
+        frequency (float, optional): How quickly the colors change. \
+            Defaults to 0.1.
+        spread (float, optional): How many columns each step of the phase \
+            spreads across. Defaults to 3.0.
+        phase (float, optional): The phase of the first character, before \
+            it is scaled by `frequency`. Defaults to 0.0.
+        line_offset (float, optional): How far each line's phase is shifted \
+            from the line above. Defaults to 1.0.
+
+    Returns:
+        np.ndarray: A `(characters, 3)` uint8 array of RGB values.
+    """
+    if spread <= 0:
+        raise ValueError("Spread must be positive.")
+    phases = frequency * (phase + rows * line_offset + columns / spread)
+    if style == "sine":
+        rgb = np.sin(phases[:, np.newaxis] + SINE_PHASES) * 127.0 + 128.0
+        return rgb.astype(np.uint8)
+    if style != "hue":
+        raise ValueError(f"Unknown rainbow style {style!r}.")
+    sector = (phases / (2.0 * math.pi) % 1.0) * 6.0
+    # Each channel of a fully saturated hue, from the closed form of HSV
+    channel = (HUE_SECTORS + sector[:, np.newaxis]) % 6.0
+    rgb = 1.0 - np.clip(np.minimum(channel, 4.0 - channel), 0.0, 1.0)
+    return np.rint(rgb * 255.0).astype(np.uint8)
+
+
+def color_style(rgb: int, style: Style) -> Style:
+    """Combine a color with a base style.
+
+    Args:
+        rgb (int): The color packed as `0xRRGGBB`.
+        style (Style): The base style of the gradient.
+
+    Returns:
+        Style: The combined style.
+    """
+    triplet = ColorTriplet(rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
+    # `Style.from_color` skips the parsing done by `Style.__init__`
+    return Style.from_color(RichColor.from_triplet(triplet)) + style
+
+
+@lru_cache(maxsize=STYLE_POOL_SIZE)
+def pooled_style(rgb: int, style: Style) -> Style:
+    """Get the shared style of a color combined with a base style.
+
+    Every gradient that uses the same color and base style gets the same \
+        `Style` instance, so rich's own per-style caches get hits.
+
+    Args:
+        rgb (int): The color packed as `0xRRGGBB`.
+        style (Style): The base style of the gradient.
+
+    Returns:
+        Style: The combined style.
+    """
+    return color_style(rgb, style)
+
+
+def pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    """Pack an array of RGB values into `0xRRGGBB` integers.
+
+    Args:
+        rgb (np.ndarray): A `(characters, 3)` array of RGB values.
+
+    Returns:
+        np.ndarray: The packed colors.
+    """
+    channels = rgb.astype(np.uint32)
+    return (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+
+
+def palette_table(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the distinct colors of an array of RGB values.
+
+    Args:
+        rgb (np.ndarray): A `(characters, 3)` array of RGB values.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The distinct colors packed as \
+            `0xRRGGBB`, and the index into them of each character's color.
+    """
+    palette, color_ids = np.unique(pack_rgb(rgb), return_inverse=True)
+    return palette, color_ids.reshape(-1)
+
+
+def palette_styles(palette: np.ndarray, style: Style) -> List[Style]:
+    """Get the pooled style of each color of a palette.
+
+    Args:
+        palette (np.ndarray): Colors packed as `0xRRGGBB`.
+        style (Style): The style to combine with each color.
+
+    Returns:
+        List[Style]: One style per color.
+    """
+    return [pooled_style(color, style) for color in palette.tolist()]
+
+
+def style_table(rgb: np.ndarray, style: Style) -> Tuple[List[Style], np.ndarray]:
+    """Resolve an array of RGB values into a table of pooled styles.
+
+    Args:
+        rgb (np.ndarray): A `(characters, 3)` array of RGB values.
+        style (Style): The style to combine with each color.
+
+    Returns:
+        Tuple[List[Style], np.ndarray]: One style per distinct color, and the \
+            index into that table of each character's style.
+    """
+    palette, style_ids = palette_table(rgb)
+    return palette_styles(palette, style), style_ids
+
+
+def style_spans(
+    styles: Sequence[Style],
+    style_ids: np.ndarray,
+    offset: int = 0,
+    indexes: Optional[np.ndarray] = None,
+) -> List[Span]:
+    """Generate one span per character from indexes into a table of styles.
+
+    Args:
+        styles (Sequence[Style]): The table of styles.
+        style_ids (np.ndarray): The index of each character's style.
+        offset (int, optional): The offset of the first character. Defaults to 0.
+        indexes (np.ndarray, optional): The offset of each character, for \
+            ramps that skip characters. Defaults to consecutive offsets.
+
+    Returns:
+        List[Span]: The spans.
+    """
+    _Span = Span
+    if indexes is None:
+        # Adjacent spans share their boundary, so each offset is allocated
+        # once rather than once as an end and again as the next start.
+        bounds = list(range(offset, offset + len(style_ids) + 1))
+        return [
+            _Span(start, end, styles[style_id])
+            for start, end, style_id in zip(
+                bounds, islice(bounds, 1, None), style_ids.tolist()
+            )
+        ]
+    offsets = (indexes + offset).tolist()
+    return [
+        _Span(index, index + 1, styles[style_id])
+        for index, style_id in zip(offsets, style_ids.tolist())
+    ]
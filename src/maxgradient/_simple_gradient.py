@@ -8,15 +8,15 @@ from typing import Any, Dict, Generator, Iterable, List, Literal, Optional, Tupl
 import rich.style
 from cheap_repr import normal_repr, register_repr
 from rich._pick import pick_bool
-from rich.cells import cell_len
 from rich.console import Console, ConsoleOptions, JustifyMethod, OverflowMethod
 from rich.control import strip_control_codes
-from rich.measure import Measurement
 from rich.segment import Segment
 from rich.style import Style, StyleType
 from rich.text import Span, Text
 from rich.traceback import install as tr_install
 
+from maxgradient._base import BaseGradient
+from maxgradient._ramp import pooled_style
 from maxgradient.color import Color, PyColorType
 from maxgradient.theme import GradientTheme
 
@@ -30,7 +30,7 @@ tr_install(console=console, show_locals=True)
 VERBOSE: bool = False
 
 
-class SimpleGradient(Text):
+class SimpleGradient(BaseGradient):
     """
     Text with gradient with two colors.
 
@@ -43,6 +43,10 @@ class SimpleGradient(Text):
         no_wrap (bool, optional): Disable wrapping. Defaults to False.
         style (StyleType, optional): The style of the gradient text. Defaults to None.
         end (str, optional): The end character. Defaults to " ".
+        skip_whitespace (bool, optional): Leave whitespace characters without a \
+            color span. Defaults to False.
+        advance_whitespace (bool, optional): Whether skipped whitespace still \
+            advances the gradient. Defaults to True.
     """
 
     __slots__ = (
@@ -51,8 +55,9 @@ class SimpleGradient(Text):
         "_text",
         "_length",
         "_style",
-        "_spans",
         "end",
+        "skip_whitespace",
+        "advance_whitespace",
         "verbose",
     )
 
@@ -69,8 +74,12 @@ class SimpleGradient(Text):
         end: str = "",
         spans: Optional[List[Span]] = None,
         verbose: bool = False,
+        skip_whitespace: bool = False,
+        advance_whitespace: bool = True,
     ) -> None:
         self.verbose = verbose
+        self.skip_whitespace = skip_whitespace
+        self.advance_whitespace = advance_whitespace
         self.text = text  # type: ignore
         _style = Style.parse(style) if isinstance(style, str) else style
 
@@ -189,14 +198,25 @@ class SimpleGradient(Text):
         dg: int = g2 - g1
         db: int = b2 - b1
 
-        for index in range(self._length):
-            blend: float = index / self._length
+        text = self.plain
+        skip_whitespace = self.skip_whitespace
+        advance_whitespace = self.advance_whitespace
+        length = self._length
+        if skip_whitespace and not advance_whitespace:
+            length = sum(1 for character in text if not character.isspace()) or 1
+
+        position = 0
+        for index, character in enumerate(text):
+            if skip_whitespace and character.isspace():
+                if advance_whitespace:
+                    position += 1
+                continue
+            blend: float = position / length
+            position += 1
             red: int = int(r1 + (dr * blend))
             green: int = int(g1 + (dg * blend))
             blue: int = int(b1 + (db * blend))
-            hex_str: str = f"#{red:02X}{green:02X}{blue:02X}"
-            color = Color(hex_str)
-            style = color.style + self._style
+            style = pooled_style((red << 16) | (green << 8) | blue, self._style)
             yield Span(index, index + 1, style=style)
 
     def __rich_console__(
@@ -207,7 +227,7 @@ class SimpleGradient(Text):
 
         overflow = self.overflow or options.overflow or DEFAULT_OVERFLOW
 
-        lines = self.wrap(
+        all_lines = self.wrap_joined(
             console,
             options.max_width,
             justify=justify,
@@ -215,21 +235,8 @@ class SimpleGradient(Text):
             tab_size=tab_size or 8,
             no_wrap=pick_bool(self.no_wrap, options.no_wrap, False),  # type: ignore
         )
-        all_lines = Text("\n").join(lines)
         yield from all_lines.render(console, end=self.end)
 
-    def __rich_measure__(
-        self, console: "Console", options: "ConsoleOptions"
-    ) -> Measurement:
-        text: str = self.plain
-        lines: List[str] = text.splitlines()
-        max_text_width = max(cell_len(line) for line in lines) if lines else 0
-        words = text.split()
-        min_text_width = (
-            max(cell_len(word) for word in words) if words else max_text_width
-        )
-        return Measurement(min_text_width, max_text_width)
-
     def render(self, console: "Console", end: str = "") -> Iterable["Segment"]:
         """Render the text as Segments.
 
@@ -290,7 +297,7 @@ class SimpleGradient(Text):
             yield _Segment(end)
 
     def as_text(self, style: StyleType, end: str = "") -> Text:
-        return Text(self.plain, spans=self._spans, style=style, end=end)
+        return Text(self.plain, spans=self.copy_spans(), style=style, end=end)
 
 
 register_repr(SimpleGradient)(normal_repr)
@@ -0,0 +1,495 @@
+"""Merge, store and search the sorted, disjoint spans of a gradient."""
+
+from functools import partial
+from heapq import merge
+from itertools import chain, islice
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+
+import numpy as np
+from rich.errors import StyleSyntaxError
+from rich.style import Style
+from rich.text import Span
+
+INT32_MAX = 2**31 - 1
+new_span = partial(tuple.__new__, Span)
+"""Create a span from a `(start, end, style)` tuple, skipping the length \
+    check of `Span._make`, as the tuples always come from `zip`."""
+
+
+def resolve_style(style: Union[str, Style]) -> Optional[Style]:
+    """Resolve the style of a span without a console.
+
+    Args:
+        style (str|Style): The style of a span.
+
+    Returns:
+        Optional[Style]: The style, or None if it is the name of a theme \
+            style, which can only be resolved by a console.
+    """
+    if isinstance(style, Style):
+        return style
+    try:
+        return Style.parse(style)
+    except StyleSyntaxError:
+        return None
+
+
+def overlay_spans(spans: Sequence[Span], markup: Sequence[Span]) -> List[Span]:
+    """Overlay gradient spans onto styled spans, such as those of markup.
+
+    The boundaries of both lists are swept in order, so each run between \
+        two boundaries gets the combined styles of the markup that covers it \
+        beneath the gradient style. The gradient colors win, while bold, \
+        links and the other attributes of the markup are kept. That takes \
+        O((n+m) log m) time for n gradient spans and m markup spans, and \
+        returns sorted, disjoint spans after any kept markup spans.
+
+    Markup spans with the name of a theme style can only be resolved by the \
+        console. They are kept as they are, along with the markup before \
+        them in their original order, so the console layers them as \
+        `Text.render` would. Only the markup after the last of them is \
+        merged with the gradient.
+
+    Args:
+        spans (Sequence[Span]): Sorted, disjoint spans, such as those \
+            generated by a gradient.
+        markup (Sequence[Span]): Spans in any order beneath the gradient, \
+            with later spans taking precedence over earlier ones.
+
+    Returns:
+        List[Span]: The merged spans.
+    """
+    resolved: List[Tuple[Span, Style]] = []
+    deferred: List[Span] = []
+    for span in markup:
+        if span.end <= span.start:
+            continue
+        style = resolve_style(span.style)
+        if style is None:
+            # Keep the markup beneath a theme style in its original order
+            deferred.extend(resolved_span for resolved_span, _ in resolved)
+            deferred.append(span)
+            resolved.clear()
+        elif style:
+            resolved.append((span, style))
+    if not resolved:
+        return [*deferred, *spans]
+
+    # Ends sort before starts at the same offset, so touching spans never overlap
+    events = sorted(
+        chain(
+            ((span.start, 1, index) for index, (span, _) in enumerate(resolved)),
+            ((span.end, 0, index) for index, (span, _) in enumerate(resolved)),
+        )
+    )
+    cuts = sorted({offset for offset, _, _ in events})
+    bounds = merge(
+        chain.from_iterable((span.start, span.end) for span in spans), cuts
+    )
+
+    merged: List[Span] = deferred
+    active: Dict[int, Style] = {}
+    beneath: Optional[Style] = None
+    span_count = len(spans)
+    event_count = len(events)
+    span_index = event_index = 0
+    previous: Optional[int] = None
+    for bound in bounds:
+        if previous is not None and bound > previous:
+            while span_index < span_count and spans[span_index].end <= previous:
+                span_index += 1
+            gradient: Optional[Style] = None
+            if span_index < span_count and spans[span_index].start <= previous:
+                gradient = spans[span_index].style  # type: ignore
+            if gradient is None:
+                style = beneath
+            elif beneath is None:
+                style = gradient
+            else:
+                style = beneath + gradient
+            if style is not None:
+                merged.append(Span(previous, bound, style))
+        if bound != previous and event_index < event_count:
+            changed = False
+            while event_index < event_count and events[event_index][0] <= bound:
+                _, is_start, index = events[event_index]
+                if is_start:
+                    active[index] = resolved[index][1]
+                else:
+                    del active[index]
+                event_index += 1
+                changed = True
+            if changed:
+                beneath = (
+                    Style.combine(active[index] for index in sorted(active))
+                    if active
+                    else None
+                )
+        previous = bound
+    return merged
+
+
+class SpanArray(Sequence[Span]):
+    """Spans stored as columns of offsets and indexes into a table of styles.
+
+    A list of spans costs a `Span` tuple and its offsets for every character \
+        of a gradient, over 100 bytes each. The same spans as arrays cost \
+        ten bytes a character or less: two `int32` offsets and a small \
+        index into the distinct styles. A gradient keeps its spans in this \
+        form until code asks for a list, and searches the sorted offsets \
+        with binary search when dividing text into lines.
+
+    The arrays are read-only and a list of styles is never changed, so \
+        copies and crops of a gradient share them rather than copying them.
+
+    Args:
+        starts (np.ndarray): The start offset of each span.
+        ends (np.ndarray): The end offset of each span.
+        style_ids (np.ndarray): The index into `styles` of each span's style.
+        styles (Sequence[StyleType]): The styles the style ids index into.
+    """
+
+    __slots__ = ("starts", "ends", "style_ids", "styles")
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        style_ids: np.ndarray,
+        styles: Sequence[Union[str, Style]],
+    ) -> None:
+        self.starts = read_only(offset_array(starts))
+        self.ends = read_only(offset_array(ends))
+        self.style_ids = read_only(id_array(style_ids, len(styles)))
+        self.styles = styles if isinstance(styles, list) else list(styles)
+
+    @classmethod
+    def from_table(
+        cls,
+        styles: Sequence[Style],
+        style_ids: np.ndarray,
+        offset: int = 0,
+        indexes: Optional[np.ndarray] = None,
+    ) -> "SpanArray":
+        """Store one span per character from indexes into a table of styles.
+
+        Args:
+            styles (Sequence[Style]): The table of styles.
+            style_ids (np.ndarray): The index of each character's style.
+            offset (int, optional): The offset of the first character. \
+                Defaults to 0.
+            indexes (np.ndarray, optional): The offset of each character, for \
+                ramps that skip characters. Defaults to consecutive offsets.
+
+        Returns:
+            SpanArray: The spans.
+        """
+        if indexes is None:
+            starts = np.arange(offset, offset + len(style_ids), dtype=np.int64)
+        else:
+            starts = indexes.astype(np.int64) + offset
+        return cls(starts, starts + 1, style_ids, styles)
+
+    @classmethod
+    def from_spans(cls, spans: Sequence[Span]) -> "SpanArray":
+        """Store a list of spans.
+
+        Args:
+            spans (Sequence[Span]): The spans, in any order.
+
+        Returns:
+            SpanArray: The spans.
+        """
+        count = len(spans)
+        table: Dict[Union[str, Style], int] = {}
+        style_ids = np.fromiter(
+            (table.setdefault(span.style, len(table)) for span in spans),
+            np.int64,
+            count,
+        )
+        starts = np.fromiter((span.start for span in spans), np.int64, count)
+        ends = np.fromiter((span.end for span in spans), np.int64, count)
+        return cls(starts, ends, style_ids, list(table))
+
+    @classmethod
+    def concat(
+        cls,
+        parts: Sequence[Union["SpanArray", Sequence[Span]]],
+        offsets: Sequence[int],
+    ) -> "SpanArray":
+        """Join the spans of consecutive parts of a text.
+
+        The columns of the span arrays are joined and then shifted by the \
+            offset of their part all at once with array arithmetic, so each \
+            part costs a few list appends rather than a new `Span` for each \
+            of its spans. Lists of spans, such as the few of a plain `Text`, \
+            are shifted as they are read. Styles are not compared, only tables \
+            shared by several span arrays are stored once.
+
+        Args:
+            parts (Sequence[SpanArray|Sequence[Span]]): The spans of each \
+                part, relative to its start.
+            offsets (Sequence[int]): The offset of each part.
+
+        Returns:
+            SpanArray: The spans of all the parts, in order.
+        """
+        styles: List[Union[str, Style]] = []
+        bases: Dict[int, int] = {}
+        # Each chunk is a span array, or a range of the spans read from lists
+        chunks: List[Union[SpanArray, slice]] = []
+        offset_shifts: List[int] = []
+        id_shifts: List[int] = []
+        list_starts: List[int] = []
+        list_ends: List[int] = []
+        list_ids: List[int] = []
+        for spans, offset in zip(parts, offsets):
+            if isinstance(spans, SpanArray):
+                if not len(spans):
+                    continue
+                base = bases.get(id(spans.styles))
+                if base is None:
+                    base = bases[id(spans.styles)] = len(styles)
+                    styles.extend(spans.styles)
+                chunks.append(spans)
+                offset_shifts.append(offset)
+                id_shifts.append(base)
+            elif spans:
+                begin = len(list_starts)
+                for start, end, style in spans:
+                    list_starts.append(start + offset)
+                    list_ends.append(end + offset)
+                    list_ids.append(len(styles))
+                    styles.append(style)
+                chunks.append(slice(begin, len(list_starts)))
+                offset_shifts.append(0)
+                id_shifts.append(0)
+
+        listed = (
+            np.array(list_starts, np.int64),
+            np.array(list_ends, np.int64),
+            np.array(list_ids, np.int64),
+        )
+        columns: Tuple[List[np.ndarray], ...] = ([], [], [])
+        for chunk in chunks:
+            if isinstance(chunk, slice):
+                arrays = tuple(column[chunk] for column in listed)
+            else:
+                arrays = (chunk.starts, chunk.ends, chunk.style_ids)
+            for column, array in zip(columns, arrays):
+                column.append(array)
+        if not chunks:
+            return cls(*listed, styles)
+        counts = [len(array) for array in columns[0]]
+        offset_shift = np.repeat(np.array(offset_shifts, np.int64), counts)
+        id_shift = np.repeat(np.array(id_shifts, np.int64), counts)
+        starts, ends, style_ids = (
+            np.concatenate(column).astype(np.int64) for column in columns
+        )
+        return cls(
+            starts + offset_shift, ends + offset_shift, style_ids + id_shift, styles
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self, index: int) -> Span:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Span]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Span, List[Span]]:
+        if isinstance(index, slice):
+            return self.to_spans()[index]
+        return Span(
+            int(self.starts[index]),
+            int(self.ends[index]),
+            self.styles[self.style_ids[index]],
+        )
+
+    def __iter__(self) -> Iterator[Span]:
+        return iter(self.to_spans())
+
+    def __repr__(self) -> str:
+        return f"<SpanArray of {len(self)} spans in {len(self.styles)} styles>"
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the offset and style id arrays."""
+        return self.starts.nbytes + self.ends.nbytes + self.style_ids.nbytes
+
+    def to_spans(self) -> List[Span]:
+        """Create the list of spans.
+
+        Returns:
+            List[Span]: One span per entry, in order.
+        """
+        styles = map(self.styles.__getitem__, self.style_ids.tolist())
+        starts = self.starts.tolist()
+        if len(starts) and np.array_equal(self.starts[1:], self.ends[:-1]):
+            # Adjacent spans share their boundary, so each offset is allocated
+            # once rather than once as an end and again as the next start.
+            starts.append(int(self.ends[-1]))
+            return list(map(new_span, zip(starts, islice(starts, 1, None), styles)))
+        return list(map(new_span, zip(starts, self.ends.tolist(), styles)))
+
+    def is_disjoint(self) -> bool:
+        """Check that the spans are sorted, have a length and do not overlap."""
+        return bool(
+            np.all(self.starts < self.ends)
+            and np.all(self.ends[:-1] <= self.starts[1:])
+        )
+
+    def search(self, start: int, end: int) -> Tuple[int, int]:
+        """Find the spans that overlap a range of the text.
+
+        The spans must be disjoint, so two binary searches find them.
+
+        Args:
+            start (int): The offset of the start of the range.
+            end (int): The offset of the end of the range.
+
+        Returns:
+            Tuple[int, int]: The index of the first span in the range, and \
+                one past the index of the last.
+        """
+        # Search with the dtype of the offsets, or numpy converts every offset
+        offset_type = self.starts.dtype.type
+        low = int(np.searchsorted(self.ends, offset_type(start), "right"))
+        high = int(np.searchsorted(self.starts, offset_type(end), "left"))
+        return low, max(low, high)
+
+    def clip(self, start: int, end: int) -> List[Span]:
+        """Get the spans of a range of the text, relative to its start.
+
+        The spans must be disjoint. Only the spans of the range are created.
+
+        Args:
+            start (int): The offset of the start of the range.
+            end (int): The offset of the end of the range.
+
+        Returns:
+            List[Span]: The spans within the range, cropped to it.
+        """
+        low, high = self.search(start, end)
+        if low == high:
+            return []
+        starts = (self.starts[low:high] - start).tolist()
+        ends = (self.ends[low:high] - start).tolist()
+        if starts[0] < 0:
+            starts[0] = 0
+        if ends[-1] > end - start:
+            ends[-1] = end - start
+        styles = map(self.styles.__getitem__, self.style_ids[low:high].tolist())
+        return list(map(new_span, zip(starts, ends, styles)))
+
+    def crop(self, start: int, end: int) -> "SpanArray":
+        """Get the spans of a range of the text as a span array, as `clip`.
+
+        The style ids and the table of styles are shared with this array, \
+            only the offsets of the range are shifted into new arrays.
+
+        Args:
+            start (int): The offset of the start of the range.
+            end (int): The offset of the end of the range.
+
+        Returns:
+            SpanArray: The spans within the range, cropped to it.
+        """
+        low, high = self.search(start, end)
+        starts = self.starts[low:high] - start
+        ends = self.ends[low:high] - start
+        if low < high:
+            starts[0] = max(starts[0], 0)
+            ends[-1] = min(ends[-1], end - start)
+        return SpanArray(starts, ends, self.style_ids[low:high], self.styles)
+
+    def divide(self, offsets: Sequence[int]) -> List[List[Span]]:
+        """Get the spans of consecutive ranges of the text, as `clip` would.
+
+        The ranges of all lines are searched at once, and only the offsets \
+            and styles of the spans between the first and the last range are \
+            converted to Python objects, once, so the cost of a call is that \
+            of the spans it returns, however long the rest of the text is.
+
+        Args:
+            offsets (Sequence[int]): The increasing offsets between ranges, \
+                including the start of the first and the end of the last.
+
+        Returns:
+            List[List[Span]]: The spans of each range, relative to its start.
+        """
+        if len(offsets) < 2:
+            return []
+        bounds = np.asarray(offsets, dtype=self.starts.dtype)
+        lows = np.searchsorted(self.ends, bounds[:-1], "right")
+        highs = np.searchsorted(self.starts, bounds[1:], "left")
+        first = int(lows[0])
+        last = max(int(highs[-1]), first)
+        span_starts = self.starts[first:last].tolist()
+        span_ends = self.ends[first:last].tolist()
+        span_styles = list(
+            map(self.styles.__getitem__, self.style_ids[first:last].tolist())
+        )
+        divided: List[List[Span]] = []
+        ranges = zip(
+            offsets,
+            islice(offsets, 1, None),
+            (lows - first).tolist(),
+            (highs - first).tolist(),
+        )
+        for start, end, low, high in ranges:
+            if low >= high:
+                divided.append([])
+                continue
+            starts = [offset - start for offset in span_starts[low:high]]
+            ends = [offset - start for offset in span_ends[low:high]]
+            if starts[0] < 0:
+                starts[0] = 0
+            if ends[-1] > end - start:
+                ends[-1] = end - start
+            styles = span_styles[low:high]
+            divided.append(list(map(new_span, zip(starts, ends, styles))))
+        return divided
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    """Get a read-only view of an array, leaving the array itself writable."""
+    view = array.view()
+    view.setflags(write=False)
+    return view
+
+
+def offset_array(offsets: np.ndarray) -> np.ndarray:
+    """Store offsets as `int32`, unless they are too large for it."""
+    offsets = np.asarray(offsets)
+    if len(offsets) and (offsets.max() > INT32_MAX or offsets.min() < -INT32_MAX):
+        return offsets.astype(np.int64, copy=False)
+    return offsets.astype(np.int32, copy=False)
+
+
+def id_dtype(style_count: int) -> Type[np.unsignedinteger]:
+    """The smallest unsigned type that indexes a table of `style_count` styles."""
+    if style_count <= 0x100:
+        return np.uint8
+    if style_count <= 0x10000:
+        return np.uint16
+    return np.uint32
+
+
+def id_array(style_ids: np.ndarray, style_count: int) -> np.ndarray:
+    """Store indexes into a table of styles in the smallest unsigned type."""
+    return np.asarray(style_ids).astype(id_dtype(style_count), copy=False)
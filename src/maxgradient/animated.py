@@ -0,0 +1,375 @@
+"""Animated gradients for status lines and splash screens."""
+
+import colorsys
+import math
+import time
+from typing import Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from rich._pick import pick_bool
+from rich.console import (
+    Console,
+    ConsoleOptions,
+    JustifyMethod,
+    OverflowMethod,
+    RenderResult,
+)
+from rich.control import strip_control_codes
+from rich.live import Live
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style, StyleType
+from rich.text import Text
+
+from maxgradient._base import DEFAULT_JUSTIFY, DEFAULT_OVERFLOW, measure_text
+from maxgradient._ramp import (
+    color_style,
+    interpolate,
+    palette_styles,
+    palette_table,
+    periodic_blend,
+    ramp_columns,
+    stops_array,
+    style_spans,
+)
+from maxgradient.color import Color, ColorType
+from maxgradient.color_list import ColorList
+from maxgradient.easing import Easing, get_easing
+
+AnimationEffect = Literal["shift", "hue", "pulse"]
+ANIMATION_EFFECTS: Tuple[str, ...] = ("shift", "hue", "pulse")
+DEFAULT_FPS = 30
+FrameKey = Tuple[int, int, JustifyMethod, OverflowMethod, bool]
+NEWLINE = -1
+PALETTE_SIZE = 256
+"""The most distinct colors in one cycle, which bounds the work per frame."""
+
+
+class AnimatedGradient:
+    """A gradient that moves over time.
+
+    "shift" scrolls the colors along the text, "hue" rotates every color \
+        around the hue circle and "pulse" dims and brightens the colors. The \
+        colors of one whole cycle are computed once: each frame of "shift" \
+        is a slice of one cycle of the ramp tiled, and "hue" and "pulse" recolor the \
+        palette while every character keeps its index into it. Rendered \
+        frames are cached, so after the first cycle a frame costs no more \
+        than yielding its segments.
+
+    Render it with `rich.live.Live`, or use `AnimatedGradient.live`, which \
+        refreshes at 30 frames per second.
+
+    Args:
+        text (str): The text to animate.
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+            Four random adjacent colors if None.
+        effect (AnimationEffect, optional): "shift", "hue" or "pulse". \
+            Defaults to "shift".
+        frames (int, optional): The number of frames in one cycle. Defaults \
+            to 60.
+        duration (float, optional): The number of seconds one cycle takes. \
+            Defaults to 2.0.
+        period (int, optional): The number of cells in one cycle of a \
+            "shift" gradient. Defaults to the width of the text.
+        depth (float, optional): How far "pulse" dims the colors, from 0.0 \
+            to 1.0. Defaults to 0.5.
+        style (StyleType, optional): The base style. Defaults to None.
+        easing (str|EasingFunction, optional): The easing curve of the \
+            gradient. Defaults to None (linear).
+        justify (JustifyMethod, optional): Justify method. Defaults to None.
+        overflow (OverflowMethod, optional): Overflow method. Defaults to None.
+        no_wrap (bool, optional): Disable text wrapping. Defaults to None.
+        end (str, optional): Character to end text with. Defaults to "\\\\n".
+        clock (Callable[[], float], optional): The clock that selects the \
+            frame. Defaults to `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        colors: Optional[Sequence[ColorType]] = None,
+        *,
+        effect: AnimationEffect = "shift",
+        frames: int = 60,
+        duration: float = 2.0,
+        period: Optional[int] = None,
+        depth: float = 0.5,
+        style: Optional[StyleType] = None,
+        easing: Optional[Easing] = None,
+        justify: Optional[JustifyMethod] = None,
+        overflow: Optional[OverflowMethod] = None,
+        no_wrap: Optional[bool] = None,
+        end: str = "\n",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if effect not in ANIMATION_EFFECTS:
+            raise ValueError(
+                f"Effect must be one of {', '.join(ANIMATION_EFFECTS)}, "
+                f"not {effect!r}."
+            )
+        if frames < 1:
+            raise ValueError("An animation must have at least one frame.")
+        if duration <= 0:
+            raise ValueError("Duration must be positive.")
+        if period is not None and period < 1:
+            raise ValueError("Period must be a positive integer.")
+        if not 0.0 <= depth <= 1.0:
+            raise ValueError("Depth must be between 0.0 and 1.0.")
+        if not colors:
+            colors = ColorList(4).color_list
+        self.colors = [
+            color if isinstance(color, Color) else Color(color) for color in colors
+        ]
+        if len(self.colors) < 2:
+            raise ValueError("Gradient must have at least two colors.")
+        self.text = strip_control_codes(text)
+        self.effect: AnimationEffect = effect
+        self.frames = frames
+        self.duration = duration
+        self.depth = depth
+        if style is None:
+            self.style = Style.null()
+        elif isinstance(style, str):
+            self.style = Style.parse(style)
+        else:
+            self.style = style
+        self.easing = None if easing is None else get_easing(easing)
+        self.justify = justify
+        self.overflow = overflow
+        self.no_wrap = no_wrap
+        self.end = end
+        self.clock = clock
+        self._start = clock()
+        self._frame_styles: Dict[int, List[Style]] = {}
+        self._frame_cache: Dict[FrameKey, List[Segment]] = {}
+        self._measurement: Optional[Measurement] = None
+        self._newlines: Optional[np.ndarray] = None
+
+        columns, _, cells = ramp_columns(self.text)
+        # When every character is one cell wide, a frame is a plain slice
+        self._contiguous = bool(np.array_equal(columns, np.arange(len(self.text))))
+        if effect == "shift":
+            self.period = period or max(cells, 1)
+            steps = min(self.period, PALETTE_SIZE)
+            blend = periodic_blend(np.arange(self.period), self.period)
+            blend = np.floor(blend * steps) / steps
+            stops = stops_array(self.colors, cyclic=True)
+        else:
+            self.period = max(cells, 1)
+            steps = max(min(self.period, PALETTE_SIZE) - 1, 1)
+            blend = np.arange(self.period) / max(self.period - 1, 1)
+            blend = np.rint(blend * steps) / steps
+            stops = stops_array(self.colors)
+        # Zero-width characters at the end sit on the last column
+        self._columns = (
+            columns if effect == "shift" else np.minimum(columns, self.period - 1)
+        )
+        if self.easing is not None:
+            blend = self.easing(blend)
+        palette, ramp_ids = palette_table(interpolate(stops, blend))
+        self._palette = palette
+        # Enough cycles back to back that every shift of the ramp is one slice
+        self._tiled_ids = np.tile(ramp_ids, 2 + cells // self.period)
+        self._tiled_ids.flags.writeable = False
+        self._base_styles = palette_styles(palette, self.style)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield from self.render_frame(self.current_frame(), console, options)
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        if self._measurement is None:
+            self._measurement = measure_text(self.text)
+        return self._measurement
+
+    def current_frame(self) -> int:
+        """Get the index of the frame to show now."""
+        elapsed = self.clock() - self._start
+        return int(elapsed / self.duration * self.frames) % self.frames
+
+    def frame_ids(self, frame: int) -> np.ndarray:
+        """Get the index into the palette of each character in a frame.
+
+        Args:
+            frame (int): The index of the frame.
+
+        Returns:
+            np.ndarray: The palette index of each character. For "shift" \
+                gradients of single-width characters this is a view of the \
+                precomputed ramp, not a copy.
+        """
+        shift = 0
+        if self.effect == "shift":
+            shift = (frame % self.frames) * self.period // self.frames
+        if self._contiguous:
+            return self._tiled_ids[shift : shift + len(self.text)]
+        return self._tiled_ids[shift + self._columns]
+
+    def frame_styles(self, frame: int) -> List[Style]:
+        """Get the palette of styles of a frame.
+
+        "hue" and "pulse" frames recolor the palette. Each frame's palette \
+            is computed once and kept for later cycles.
+
+        Args:
+            frame (int): The index of the frame.
+
+        Returns:
+            List[Style]: One style per color of the palette.
+        """
+        if self.effect == "shift":
+            return self._base_styles
+        frame %= self.frames
+        try:
+            return self._frame_styles[frame]
+        except KeyError:
+            pass
+        progress = frame / self.frames
+        palette = self._palette
+        rgb = np.stack(
+            [(palette >> 16) & 0xFF, (palette >> 8) & 0xFF, palette & 0xFF], axis=1
+        ) / 255.0
+        if self.effect == "hue":
+            rotated = []
+            for red, green, blue in rgb.tolist():
+                hue, lightness, saturation = colorsys.rgb_to_hls(red, green, blue)
+                rotated.append(
+                    colorsys.hls_to_rgb((hue + progress) % 1.0, lightness, saturation)
+                )
+            rgb = np.array(rotated, dtype=np.float64).reshape(-1, 3)
+        else:
+            dimming = (1.0 - math.cos(2.0 * math.pi * progress)) / 2.0
+            rgb = rgb * (1.0 - self.depth * dimming)
+        channels = np.rint(rgb * 255.0).astype(np.uint32)
+        palette = (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+        # Kept out of the shared style pool, which they would flush
+        styles = [color_style(color, self.style) for color in palette.tolist()]
+        self._frame_styles[frame] = styles
+        return styles
+
+    def frame(self, frame: int) -> Text:
+        """Get the text of a frame.
+
+        Args:
+            frame (int): The index of the frame.
+
+        Returns:
+            Text: The frame as a `rich.text.Text`.
+        """
+        spans = style_spans(self.frame_styles(frame), self.frame_ids(frame))
+        return Text(
+            self.text,
+            justify=self.justify,
+            overflow=self.overflow,
+            no_wrap=self.no_wrap,
+            end=self.end,
+            spans=spans,
+        )
+
+    def frame_segments(self, frame: int) -> List[Segment]:
+        """Build the segments of a frame of text that needs no wrapping.
+
+        Each run of characters of one color becomes one segment, found \
+            from the frame's palette indexes without building any spans.
+
+        Args:
+            frame (int): The index of the frame.
+
+        Returns:
+            List[Segment]: The segments of the frame, ending with `end`.
+        """
+        text = self.text
+        if not text:
+            return [Segment(self.end)] if self.end else []
+        styles = self.frame_styles(frame)
+        codes = self.frame_ids(frame).astype(np.int64)
+        newlines = self._newlines
+        if newlines is None:
+            newlines = self._newlines = np.flatnonzero(
+                np.frombuffer(text.encode("utf-32-le", "surrogatepass"), np.uint32)
+                == ord("\n")
+            )
+        codes[newlines] = NEWLINE
+        bounds = [0, *(np.flatnonzero(np.diff(codes)) + 1).tolist(), len(text)]
+        segments: List[Segment] = []
+        for start, end, code in zip(bounds, bounds[1:], codes[bounds[:-1]].tolist()):
+            if code == NEWLINE:
+                segments.extend(Segment.line() for _ in range(end - start))
+            else:
+                segments.append(Segment(text[start:end], styles[code]))
+        if self.end:
+            segments.append(Segment(self.end))
+        return segments
+
+    def render_frame(
+        self, frame: int, console: Console, options: ConsoleOptions
+    ) -> List[Segment]:
+        """Render a frame, reusing the segments of earlier cycles.
+
+        Args:
+            frame (int): The index of the frame.
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+
+        Returns:
+            List[Segment]: The segments of the frame.
+        """
+        justify = self.justify or options.justify or DEFAULT_JUSTIFY
+        overflow = self.overflow or options.overflow or DEFAULT_OVERFLOW
+        no_wrap = pick_bool(self.no_wrap, options.no_wrap, False)
+        key: FrameKey = (
+            frame % self.frames,
+            options.max_width,
+            justify,
+            overflow,
+            no_wrap,
+        )
+        try:
+            return self._frame_cache[key]
+        except KeyError:
+            pass
+        measurement = self.__rich_measure__(console, options)
+        if (
+            justify == "default"
+            and measurement.maximum <= options.max_width
+            and "\t" not in self.text
+        ):
+            segments = self.frame_segments(frame)
+        else:
+            lines = self.frame(frame).wrap(
+                console,
+                options.max_width,
+                justify=justify,
+                overflow=overflow,
+                tab_size=console.tab_size,
+                no_wrap=no_wrap,
+            )
+            segments = list(Text("\n").join(lines).render(console, end=self.end))
+        if len(self._frame_cache) >= self.frames * 2:
+            # The width changed, so frames of the old width are stale
+            self._frame_cache.clear()
+        self._frame_cache[key] = segments
+        return segments
+
+    def live(
+        self,
+        console: Optional[Console] = None,
+        fps: Union[int, float] = DEFAULT_FPS,
+        **kwargs,
+    ) -> Live:
+        """Create a `rich.live.Live` display that animates the gradient.
+
+        Args:
+            console (Console, optional): The console to display on. Defaults \
+                to the global console.
+            fps (int|float, optional): Refreshes per second. Defaults to 30.
+            **kwargs: Other keyword arguments for `rich.live.Live`, such as \
+                `transient`.
+
+        Returns:
+            Live: The live display. Use it as a context manager.
+        """
+        return Live(self, console=console, refresh_per_second=fps, **kwargs)
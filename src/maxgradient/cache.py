@@ -0,0 +1,375 @@
+"""An opt-in disk cache of gradient spans shared between processes.
+
+Command line tools print the same banners and help texts in every \
+    short-lived process. With the cache enabled, the spans of a gradient are \
+    stored on disk, keyed by a hash of its text and options, so later \
+    processes load them rather than computing them again.
+
+Enable the cache with `enable_cache()`, or by setting the \
+    `MAXGRADIENT_CACHE` environment variable to `1`. Set \
+    `MAXGRADIENT_CACHE_DIR` to use a directory other than the user cache \
+    directory.
+"""
+
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, Union
+
+import numpy as np
+from rich.style import Style
+
+from maxgradient.easing import EASINGS, EasingFunction
+
+FORMAT_VERSION = 1
+MAGIC = b"MGSP"
+HEADER = struct.Struct("<4sBBxxIII")
+"""Magic, format version, style id size, then palette, span and index counts."""
+SUFFIX = ".spans"
+DEFAULT_MAX_SIZE = 16 * 1024 * 1024
+STALE_TEMP_SECONDS = 3600
+EVICT_INTERVAL = 64
+"""Stores between scans, which pick up entries written by other processes."""
+ENABLE_VARIABLE = "MAXGRADIENT_CACHE"
+DIRECTORY_VARIABLE = "MAXGRADIENT_CACHE_DIR"
+EASING_NAMES = {function: name for name, function in EASINGS.items()}
+
+PathType = Union[str, "os.PathLike[str]"]
+
+
+class SpanTable(NamedTuple):
+    """The spans of a gradient in columnar form."""
+
+    palette: np.ndarray
+    """The distinct colors of the gradient, packed as `0xRRGGBB`."""
+    style_ids: np.ndarray
+    """The index into `palette` of each colored character's color."""
+    indexes: Optional[np.ndarray]
+    """The offset of each colored character, or None if every character is \
+        colored."""
+
+
+def default_cache_dir() -> Path:
+    """Get the directory of the cache.
+
+    Returns:
+        Path: `MAXGRADIENT_CACHE_DIR` if set, otherwise a `maxgradient` \
+            directory in the user cache directory of the platform.
+    """
+    directory = os.environ.get(DIRECTORY_VARIABLE)
+    if directory:
+        return Path(directory)
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData/Local")
+        return base / "maxgradient" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "maxgradient"
+    base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "maxgradient"
+
+
+class SpanCache:
+    """A size-bounded, content-addressed store of gradient spans on disk.
+
+    Each entry is a small binary file named by the hash of the text and \
+        options of a gradient. Entries are written to a temporary file and \
+        renamed into place, so concurrent processes never read a partial \
+        entry. When the cache grows past `max_size`, the least recently used \
+        entries are removed. The size of the cache is tracked as entries are \
+        stored, so the directory is only scanned once it may be too large, \
+        or every `EVICT_INTERVAL` stores.
+
+    Args:
+        directory (str|PathLike, optional): The directory of the cache. \
+            Defaults to `default_cache_dir()`.
+        max_size (int, optional): The most bytes to keep. Defaults to 16 MiB.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[PathType] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_size = max_size
+        self._size: Optional[int] = None
+        self._stores = 0
+
+    def __repr__(self) -> str:
+        return f"SpanCache({str(self.directory)!r}, max_size={self.max_size})"
+
+    @staticmethod
+    def key(
+        text: str,
+        stops: Iterable[int],
+        *,
+        style: Style,
+        easing: Optional[EasingFunction] = None,
+        mode: str = "default",
+        angle: float = 45.0,
+        skip_whitespace: bool = False,
+        advance_whitespace: bool = True,
+    ) -> Optional[str]:
+        """Hash the text and options of a gradient.
+
+        Args:
+            text (str): The text of the gradient.
+            stops (Iterable[int]): The colors, packed as `0xRRGGBB`.
+            style (Style): The base style.
+            easing (EasingFunction, optional): The easing curve. Defaults to None.
+            mode (str, optional): The gradient mode. Defaults to "default".
+            angle (float, optional): The angle of a diagonal gradient. \
+                Defaults to 45.0.
+            skip_whitespace (bool, optional): Whether whitespace is left \
+                uncolored. Defaults to False.
+            advance_whitespace (bool, optional): Whether skipped whitespace \
+                advances the gradient. Defaults to True.
+
+        Returns:
+            Optional[str]: The key, or None if the gradient uses a custom \
+                easing curve, which cannot be identified across processes.
+        """
+        easing_name = None
+        if easing is not None:
+            easing_name = EASING_NAMES.get(easing)
+            if easing_name is None:
+                return None
+        options = (
+            FORMAT_VERSION,
+            tuple(stops),
+            str(style),
+            easing_name,
+            mode,
+            angle if mode == "diagonal" else None,
+            skip_whitespace,
+            advance_whitespace,
+        )
+        digest = hashlib.blake2b(repr(options).encode(), digest_size=20)
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Get the path of the entry of a key."""
+        return self.directory / f"{key}{SUFFIX}"
+
+    def load(self, key: str) -> Optional[SpanTable]:
+        """Load the spans of a key.
+
+        Args:
+            key (str): The key from `SpanCache.key`.
+
+        Returns:
+            Optional[SpanTable]: The spans, or None if they are not cached.
+        """
+        path = self.path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        table = decode(data)
+        if table is None:
+            # A corrupt entry, perhaps from an older format
+            self._remove(path)
+            return None
+        try:
+            # Mark the entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return table
+
+    def store(self, key: str, table: SpanTable) -> None:
+        """Store the spans of a key.
+
+        Failures to write are ignored, as the spans can always be computed.
+
+        Args:
+            key (str): The key from `SpanCache.key`.
+            table (SpanTable): The spans to store.
+        """
+        data = encode(table)
+        temporary: Optional[str] = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            handle, temporary = tempfile.mkstemp(
+                dir=self.directory, prefix=".", suffix=".tmp"
+            )
+            with os.fdopen(handle, "wb") as file:
+                file.write(data)
+            os.replace(temporary, self.path(key))
+            temporary = None
+        except OSError:
+            return
+        finally:
+            if temporary is not None:
+                self._remove(Path(temporary))
+        self._stores += 1
+        if self._size is not None:
+            self._size += len(data)
+        if (
+            self._size is None
+            or self._size > self.max_size
+            or self._stores >= EVICT_INTERVAL
+        ):
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until within `max_size`.
+
+        Temporary files left behind by interrupted writes are removed too.
+        """
+        entries = []
+        total = 0
+        now = time.time()
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    if entry.name.endswith(SUFFIX):
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total += stat.st_size
+                    elif (
+                        entry.name.endswith(".tmp")
+                        and now - stat.st_mtime > STALE_TEMP_SECONDS
+                    ):
+                        self._remove(Path(entry.path))
+        except OSError:
+            return
+        self._stores = 0
+        if total > self.max_size:
+            for _, size, path in sorted(entries):
+                self._remove(Path(path))
+                total -= size
+                if total <= self.max_size:
+                    break
+        self._size = total
+
+    def clear(self) -> None:
+        """Remove every entry of the cache."""
+        try:
+            with os.scandir(self.directory) as scan:
+                for entry in scan:
+                    if entry.name.endswith(SUFFIX):
+                        self._remove(Path(entry.path))
+        except OSError:
+            pass
+        self._size = 0
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            # Already removed, perhaps by another process
+            pass
+
+
+def encode(table: SpanTable) -> bytes:
+    """Pack spans into the binary format of the cache.
+
+    Args:
+        table (SpanTable): The spans to pack.
+
+    Returns:
+        bytes: A header followed by the palette, style ids and indexes as \
+            little-endian arrays.
+    """
+    id_type = "<u2" if len(table.palette) <= 0xFFFF else "<u4"
+    indexes = table.indexes
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        np.dtype(id_type).itemsize,
+        len(table.palette),
+        len(table.style_ids),
+        0 if indexes is None else len(indexes),
+    )
+    parts = [
+        header,
+        table.palette.astype("<u4").tobytes(),
+        table.style_ids.astype(id_type).tobytes(),
+    ]
+    if indexes is not None:
+        parts.append(indexes.astype("<u4").tobytes())
+    return b"".join(parts)
+
+
+def decode(data: bytes) -> Optional[SpanTable]:
+    """Unpack spans from the binary format of the cache.
+
+    Args:
+        data (bytes): The contents of an entry.
+
+    Returns:
+        Optional[SpanTable]: The spans, or None if the data is not valid.
+    """
+    if len(data) < HEADER.size:
+        return None
+    magic, version, id_size, colors, spans, index_count = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION or id_size not in (2, 4):
+        return None
+    if index_count not in (0, spans):
+        return None
+    expected = HEADER.size + 4 * colors + id_size * spans + 4 * index_count
+    if len(data) != expected:
+        return None
+    offset = HEADER.size
+    palette = np.frombuffer(data, "<u4", colors, offset)
+    offset += 4 * colors
+    style_ids = np.frombuffer(data, f"<u{id_size}", spans, offset)
+    offset += id_size * spans
+    indexes = np.frombuffer(data, "<u4", index_count, offset) if index_count else None
+    if spans and int(style_ids.max()) >= colors:
+        return None
+    return SpanTable(palette, style_ids, indexes)
+
+
+_cache: Optional[SpanCache] = None
+_checked_environment = False
+
+
+def enable_cache(
+    directory: Optional[PathType] = None, max_size: int = DEFAULT_MAX_SIZE
+) -> SpanCache:
+    """Store the spans of gradients in a disk cache from now on.
+
+    Args:
+        directory (str|PathLike, optional): The directory of the cache. \
+            Defaults to `default_cache_dir()`.
+        max_size (int, optional): The most bytes to keep. Defaults to 16 MiB.
+
+    Returns:
+        SpanCache: The enabled cache.
+    """
+    global _cache, _checked_environment
+    _cache = SpanCache(directory, max_size)
+    _checked_environment = True
+    return _cache
+
+
+def disable_cache() -> None:
+    """Stop using the disk cache. Entries already stored are kept."""
+    global _cache, _checked_environment
+    _cache = None
+    _checked_environment = True
+
+
+def get_cache() -> Optional[SpanCache]:
+    """Get the enabled disk cache.
+
+    Returns:
+        Optional[SpanCache]: The cache, or None if it is not enabled.
+    """
+    global _checked_environment
+    if not _checked_environment:
+        _checked_environment = True
+        if os.environ.get(ENABLE_VARIABLE, "").lower() in ("1", "true", "yes", "on"):
+            enable_cache()
+    return _cache
@@ -1,8 +1,8 @@
 
 from itertools import cycle
 from pathlib import Path
-from random import randint
-from typing import Any, List, Tuple
+from random import Random, randrange
+from typing import Any, List, Optional, Tuple
 
 from rich.columns import Columns
 from rich.console import Console
@@ -11,7 +11,6 @@ from rich.text import Text
 from rich.traceback import install as tr_install
 
 from maxgradient.color import Color
-from maxgradient.spectrum import Spectrum
 
 console = Console()
 tr_install(console=console)
@@ -20,9 +19,19 @@ tr_install(console=console)
 class ColorList(List[Color]):
     """Generate a list of colors for a gradient.
 
+    The colors are adjacent colors of the spectrum, starting from a random \
+        one. Pass a `seed`, an `rng` or an `offset` to pick the same colors \
+        every time, so gradients made from them can be cached and compared.
+
     Args:
         hues (int, optional): The number of colors in the gradient. Defaults to 4.
         title (str, optional): The title of the gradient. Defaults to "ColorList".
+        seed (int, optional): Seed a random number generator of its own to \
+            pick the first color. Defaults to None.
+        rng (Random, optional): The random number generator to pick the \
+            first color with. Defaults to None, for the global generator.
+        offset (int, optional): The index of the first color in `COLORS`, \
+            instead of a random one. Defaults to None.
 
     Returns:
         List[Color]: A list of colors for the gradient.
@@ -47,8 +56,25 @@ class ColorList(List[Color]):
         "#ff00af",
     )
 
-    def __init__(self, hues: int = 4, title: str = "ColorList"):
-        self.start_index: int = randint(0, len(Spectrum.HEX))
+    def __init__(
+        self,
+        hues: int = 4,
+        title: str = "ColorList",
+        *,
+        seed: Optional[int] = None,
+        rng: Optional[Random] = None,
+        offset: Optional[int] = None,
+    ):
+        if sum(option is not None for option in (seed, rng, offset)) > 1:
+            raise ValueError("Pass only one of seed, rng or offset.")
+        if offset is not None:
+            self.start_index: int = offset % len(self.COLORS)
+        elif rng is not None:
+            self.start_index = rng.randrange(len(self.COLORS))
+        elif seed is not None:
+            self.start_index = Random(seed).randrange(len(self.COLORS))
+        else:
+            self.start_index = randrange(len(self.COLORS))
         self.hues: int = hues
         self.title: str = title
         _color_list1: List[str] = list(self.COLORS[self.start_index :])
@@ -0,0 +1,124 @@
+"""Easing curves that shape how a gradient progresses through its colors.
+
+Each curve maps an array of blend values from `0.0` to `1.0` onto a new \
+    array of blend values, so a whole gradient is eased with a single NumPy \
+    call.
+"""
+
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+EasingFunction = Callable[[np.ndarray], np.ndarray]
+Easing = Union[str, EasingFunction]
+
+
+def linear(blend: np.ndarray) -> np.ndarray:
+    """Progress at a constant rate."""
+    return blend
+
+
+def ease_in(blend: np.ndarray) -> np.ndarray:
+    """Start slowly and accelerate (quadratic)."""
+    return blend * blend
+
+
+def ease_out(blend: np.ndarray) -> np.ndarray:
+    """Start quickly and decelerate (quadratic)."""
+    return blend * (2.0 - blend)
+
+
+def ease_in_out(blend: np.ndarray) -> np.ndarray:
+    """Accelerate through the first half and decelerate through the second."""
+    return np.where(
+        blend < 0.5, 2.0 * blend * blend, 1.0 - (-2.0 * blend + 2.0) ** 2 / 2.0
+    )
+
+
+def ease_in_cubic(blend: np.ndarray) -> np.ndarray:
+    """Start slowly and accelerate (cubic)."""
+    return blend**3
+
+
+def ease_out_cubic(blend: np.ndarray) -> np.ndarray:
+    """Start quickly and decelerate (cubic)."""
+    return 1.0 - (1.0 - blend) ** 3
+
+
+def ease_in_out_cubic(blend: np.ndarray) -> np.ndarray:
+    """Accelerate and then decelerate (cubic)."""
+    return np.where(
+        blend < 0.5, 4.0 * blend**3, 1.0 - (-2.0 * blend + 2.0) ** 3 / 2.0
+    )
+
+
+def ease_in_sine(blend: np.ndarray) -> np.ndarray:
+    """Start slowly and accelerate along a sine curve."""
+    return 1.0 - np.cos(blend * np.pi / 2.0)
+
+
+def ease_out_sine(blend: np.ndarray) -> np.ndarray:
+    """Start quickly and decelerate along a sine curve."""
+    return np.sin(blend * np.pi / 2.0)
+
+
+def ease_in_out_sine(blend: np.ndarray) -> np.ndarray:
+    """Accelerate and then decelerate along a sine curve."""
+    return (1.0 - np.cos(np.pi * blend)) / 2.0
+
+
+def steps(count: int) -> EasingFunction:
+    """Create a curve that jumps between `count` evenly spaced blend values.
+
+    Args:
+        count (int): The number of steps. Must be at least 2.
+
+    Returns:
+        EasingFunction: The stepped easing curve.
+    """
+    if count < 2:
+        raise ValueError("Steps must have a count of at least 2.")
+
+    def _steps(blend: np.ndarray) -> np.ndarray:
+        return np.minimum(np.floor(blend * count), count - 1) / (count - 1)
+
+    return _steps
+
+
+EASINGS: Dict[str, EasingFunction] = {
+    "linear": linear,
+    "ease-in": ease_in,
+    "ease-out": ease_out,
+    "ease-in-out": ease_in_out,
+    "ease-in-cubic": ease_in_cubic,
+    "ease-out-cubic": ease_out_cubic,
+    "ease-in-out-cubic": ease_in_out_cubic,
+    "ease-in-sine": ease_in_sine,
+    "ease-out-sine": ease_out_sine,
+    "ease-in-out-sine": ease_in_out_sine,
+}
+
+
+def get_easing(easing: Optional[Easing]) -> EasingFunction:
+    """Look up an easing curve.
+
+    Args:
+        easing (str|EasingFunction, optional): The name of an easing curve or \
+            a callable that eases an array of blend values. Defaults to linear.
+
+    Returns:
+        EasingFunction: The easing curve.
+
+    Raises:
+        ValueError: If the name is not a known easing curve.
+    """
+    if easing is None:
+        return linear
+    if callable(easing):
+        return easing
+    try:
+        return EASINGS[easing.replace("_", "-").lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown easing {easing!r}. Expected one of: {', '.join(EASINGS)}"
+        ) from None
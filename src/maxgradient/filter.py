@@ -0,0 +1,176 @@
+"""Color any renderable with a gradient after it has been rendered."""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from rich.cells import get_character_cell_size
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.jupyter import JupyterMixin
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
+
+from maxgradient._ramp import (
+    GRADIENT_MODES,
+    GradientMode,
+    grid_blend,
+    interpolate,
+    palette_styles,
+    palette_table,
+    stops_array,
+)
+from maxgradient.color import Color, ColorType
+from maxgradient.color_list import ColorList
+from maxgradient.easing import Easing, get_easing
+
+
+class GradientFilter(JupyterMixin):
+    """Recolor the output of any renderable with a gradient.
+
+    The child is rendered once, and the foreground color of every cell of \
+        its segments is replaced with the color of the gradient at that \
+        cell. Backgrounds, attributes such as bold, and links are kept, so \
+        a `Panel`, `Table`, `Tree` or `Syntax` can be colored as a whole \
+        without building a `Gradient` for each of its cells.
+
+    Args:
+        renderable (RenderableType): The renderable to color.
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+            Four random adjacent colors if None.
+        mode (GradientMode, optional): "default" for left to right, \
+            "vertical", "diagonal" or "radial". Defaults to "default".
+        angle (float, optional): The direction of a diagonal gradient in \
+            degrees. Defaults to 45.0.
+        easing (str|EasingFunction, optional): The easing curve of the \
+            gradient. Defaults to None (linear).
+        skip_whitespace (bool, optional): Leave whitespace with its original \
+            style. A foreground color does not show on a space, so this only \
+            makes a difference to underlined or struck through spaces. \
+            Defaults to True.
+    """
+
+    def __init__(
+        self,
+        renderable: RenderableType,
+        colors: Optional[Sequence[ColorType]] = None,
+        *,
+        mode: GradientMode = "default",
+        angle: float = 45.0,
+        easing: Optional[Easing] = None,
+        skip_whitespace: bool = True,
+    ) -> None:
+        if mode not in GRADIENT_MODES:
+            raise ValueError(
+                f"Mode must be one of {', '.join(GRADIENT_MODES)}, not {mode!r}."
+            )
+        if not colors:
+            colors = ColorList(4).color_list
+        validated = [
+            color if isinstance(color, Color) else Color(color) for color in colors
+        ]
+        if len(validated) < 2:
+            raise ValueError("Gradient must have at least two colors.")
+        self.renderable = renderable
+        self.colors = validated
+        self.mode: GradientMode = mode
+        self.angle = angle
+        self.easing = None if easing is None else get_easing(easing)
+        self.skip_whitespace = skip_whitespace
+        self._stops = stops_array(validated)
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        return Measurement.get(console, options, self.renderable)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        lines = console.render_lines(self.renderable, options, pad=False)
+        new_line = Segment.line()
+        for line in self.recolor(lines):
+            yield from line
+            yield new_line
+
+    def cell_styles(self, width: int, height: int) -> Tuple[List[Style], np.ndarray]:
+        """Compute the color of every cell of the rendered output.
+
+        Args:
+            width (int): The number of cells of the longest line.
+            height (int): The number of lines.
+
+        Returns:
+            Tuple[List[Style], np.ndarray]: One style per distinct color, and \
+                a `(height, width)` array of the index of each cell's style.
+        """
+        if self.mode == "default":
+            blend = np.arange(width) / max(width - 1, 1)
+            shape = (1, width)
+        else:
+            rows, columns = np.indices((height, width))
+            blend = grid_blend(
+                rows.reshape(-1), columns.reshape(-1), self.mode, self.angle
+            )
+            shape = (height, width)
+        if self.easing is not None:
+            blend = self.easing(blend)
+        palette, style_ids = palette_table(interpolate(self._stops, blend))
+        styles = palette_styles(palette, Style.null())
+        return styles, np.broadcast_to(style_ids.reshape(shape), (height, width))
+
+    def recolor(self, lines: List[List[Segment]]) -> List[List[Segment]]:
+        """Recolor rendered lines, one cell at a time.
+
+        Runs of cells that end up with the same style are joined into one \
+            segment, so a vertical gradient yields a segment per line.
+
+        Args:
+            lines (List[List[Segment]]): The lines of the rendered child.
+
+        Returns:
+            List[List[Segment]]: The recolored lines.
+        """
+        width = max((Segment.get_line_length(line) for line in lines), default=0)
+        if not width:
+            return lines
+        styles, cell_ids = self.cell_styles(width, len(lines))
+        last_column = width - 1
+        skip_whitespace = self.skip_whitespace
+        combined: Dict[Tuple[Optional[Style], int], Style] = {}
+        recolored: List[List[Segment]] = []
+        for line, line_ids in zip(lines, cell_ids.tolist()):
+            new_line: List[Segment] = []
+            append = new_line.append
+            column = 0
+            for segment in line:
+                text, style, control = segment
+                if control:
+                    append(segment)
+                    continue
+                if skip_whitespace and text.isspace():
+                    append(segment)
+                    column += segment.cell_length
+                    continue
+                run: List[str] = []
+                run_style: Optional[Style] = None
+                for character in text:
+                    if skip_whitespace and character.isspace():
+                        cell_style = style
+                    else:
+                        style_id = line_ids[min(column, last_column)]
+                        key = (style, style_id)
+                        cell_style = combined.get(key)
+                        if cell_style is None:
+                            cell_style = combined[key] = (
+                                style + styles[style_id] if style else styles[style_id]
+                            )
+                    if cell_style is not run_style and run:
+                        append(Segment("".join(run), run_style))
+                        run.clear()
+                    run.append(character)
+                    run_style = cell_style
+                    column += get_character_cell_size(character)
+                if run:
+                    append(Segment("".join(run), run_style))
+            recolored.append(new_line)
+        return recolored
@@ -1,10 +1,21 @@
 import re
 from pathlib import Path
-from typing import List, Literal, Optional, Tuple, TypeAlias, Union
+from random import Random
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeAlias,
+    Union,
+    cast,
+)
 
 import numpy as np
 from pydantic_core import PydanticCustomError
-from pydantic_extra_types.color import ColorType
 from rich.console import Console, JustifyMethod, OverflowMethod
 from rich.control import strip_control_codes
 from rich.panel import Panel
@@ -12,9 +23,36 @@ from rich.style import Style, StyleType
 from rich.text import Span, Text
 from rich.traceback import install as tr_install
 
-from maxgradient._simple_gradient import SimpleGradient
-from maxgradient.color import Color
+from maxgradient._base import BaseGradient
+from maxgradient._ramp import (
+    GRADIENT_MODES,
+    RAINBOW_STYLES,
+    GradientMode,
+    RainbowStyle,
+    grid_blend,
+    grid_positions,
+    interpolate,
+    palette_styles,
+    palette_table,
+    periodic_blend,
+    rainbow_rgb,
+    ramp_columns,
+    stops_array,
+    style_table,
+    visible_mask,
+)
+from maxgradient._spans import SpanArray, overlay_spans
+from maxgradient.cache import SpanCache, SpanTable, get_cache
+from maxgradient.color import Color, ColorType
 from maxgradient.color_list import ColorList
+from maxgradient.easing import Easing, EasingFunction, get_easing
+from maxgradient.ramp import GradientRamp, compile_ramp, pack_color
+from maxgradient.streaming import (
+    DEFAULT_PERIOD,
+    FILE_CHUNK_SIZE,
+    GradientStream,
+    MappedFile,
+)
 from maxgradient.theme import GRADIENT_TERMINAL_THEME, GradientTheme
 
 GradientMethod = Literal["default", "list", "mono", "rainbow"]
@@ -28,6 +66,7 @@ tr_install(console=console, show_locals=True)
 VERBOSE: bool = False
 
 GradientColors: TypeAlias = Union[
+    Optional[GradientRamp],
     Optional[List[ColorType]],
     Optional[List[Color]],
     Optional[List[str]],
@@ -37,15 +76,39 @@ GradientColors: TypeAlias = Union[
 ]
 
 
-class Gradient(Text):
+def color_sequence(colors: GradientColors) -> Optional[Sequence[ColorType]]:
+    """Narrow `GradientColors` to the sequence of colors it holds.
+
+    Args:
+        colors (GradientColors): A ramp, a list or tuple of colors, or None.
+
+    Returns:
+        Sequence[ColorType], optional: The colors, or None for random colors.
+
+    Raises:
+        TypeError: If `colors` is neither a ramp, a list, a tuple nor None.
+    """
+    if isinstance(colors, GradientRamp):
+        return colors.colors
+    if colors is None or isinstance(colors, list):
+        return colors
+    if isinstance(colors, tuple):
+        # A tuple of colors, like a list, rather than a single RGB color
+        return cast(Sequence[ColorType], colors)
+    raise TypeError(f"Colors must be a list or tuple, not {type(colors)}.")
+
+
+class Gradient(BaseGradient):
     """Text styled with gradient color.
 
     Args:
         text ( `str` | `rich.text.Text` ): The text to print. Defaults to `""`.
         colors ( `GradientColors`, optional ): An optional list of colors [1]_ from 
             which to make the Gradient. Defaults to None.
-        rainbow ( `bool` ): Whether to print the gradient text in rainbow colors
-            across the spectrum. Defaults to False.
+        rainbow ( `bool` | `RainbowStyle` ): Whether to print the gradient text
+            in rainbow colors across the spectrum. "sine" and "hue" compute a
+            lolcat-style rainbow directly from each character's position,
+            without a palette. Defaults to False.
         hues ( `int` ): The number of colors in the gradient. Defaults to `3`.
         style ( `StyleType` ): The style of the gradient text. Defaults to None.
         verbose ( `bool` ): Whether to print verbose output. Defaults to False.
@@ -60,13 +123,43 @@ class Gradient(Text):
             `console.tab_size`. Defaults to 4.
         spans (List[Span], optional): A list of predefined style spans.
             Defaults to None.
+        period (int, optional): Color each character by its absolute index
+            modulo `period`, looping through the colors and back to the first.
+            Appending to a periodic gradient only colors the new characters.
+            Defaults to None.
+        skip_whitespace (bool, optional): Leave whitespace characters without
+            a color span. Defaults to False.
+        advance_whitespace (bool, optional): Whether skipped whitespace still
+            advances the gradient. Defaults to True.
+        easing (str|EasingFunction, optional): The easing curve, by name or
+            as a callable on an array of blend values, that shapes how the
+            gradient progresses. Defaults to None (linear).
+        mode (GradientMode, optional): "default" colors the text as one run.
+            "vertical", "diagonal" and "radial" color multi-line text by row
+            and column, so every line shares one coherent gradient. Defaults
+            to "default".
+        angle (float, optional): The direction of a "diagonal" gradient, in
+            degrees clockwise from left-to-right. Defaults to 45.0.
+        frequency (float, optional): How quickly an analytic rainbow changes
+            color. Defaults to 0.1.
+        spread (float, optional): How many columns each step of an analytic
+            rainbow spreads across. Defaults to 3.0.
+        phase (float, optional): The phase of the first character of an
+            analytic rainbow. Defaults to None, to pick it with `seed`.
+        seed (int, optional): Seed the random phase of an analytic rainbow,
+            as lolcat does, so it starts at the same color on every run.
+            Defaults to None, for a different phase each time.
+        line_offset (float, optional): How far each line of an analytic
+            rainbow is shifted from the line above. Defaults to 1.0.
 
             
-            .. [1] colors: List[Optional[Color|Tuple|str|int]
+            .. [1] colors: List[Optional[Color|Tuple|str|int] or a compiled
+                `GradientRamp`, whose colors, style and easing are used.
     """
 
     __slots__ = [
         "_colors",
+        "_stops",
         "_text",
         "_length",
         "length",
@@ -78,8 +171,17 @@ class Gradient(Text):
         "_overflow",
         "style",
         "_style",
-        "_spans",
         "_rainbow",
+        "_rainbow_options",
+        "_rng",
+        "_color_offset",
+        "_period",
+        "_skip_whitespace",
+        "_advance_whitespace",
+        "_ramp_position",
+        "_easing",
+        "_mode",
+        "_angle",
         "verbose",
     ]
 
@@ -88,7 +190,7 @@ class Gradient(Text):
         text: Optional[str | Text] = "",
         colors: GradientColors = None,
         *,
-        rainbow: bool = False,
+        rainbow: Union[bool, RainbowStyle] = False,
         hues: int = 4,
         style: StyleType = Style.null(),
         justify: Optional[JustifyMethod] = DEFAULT_JUSTIFY,
@@ -98,12 +200,26 @@ class Gradient(Text):
         tab_size: Optional[int] = 4,
         verbose: bool = False,
         spans: Optional[List[Span]] = None,
+        period: Optional[int] = None,
+        skip_whitespace: bool = False,
+        advance_whitespace: bool = True,
+        easing: Optional[Easing] = None,
+        mode: GradientMode = "default",
+        angle: float = 45.0,
+        frequency: float = 0.1,
+        spread: float = 3.0,
+        phase: Optional[float] = None,
+        seed: Optional[int] = None,
+        line_offset: float = 1.0,
+        rng: Union[int, Random, None] = None,
+        color_offset: Optional[int] = None,
     ) -> None:
         """
         Text styled with gradient color.
 
         Args:
-            text (text): The text to print. Defaults to `""`.\n
+            text (text): The text to print. The styles of a `Text`, such as \
+                markup, are kept beneath the gradient colors. Defaults to `""`.\n
             colors (List[Optional[Color|Tuple|str|int]]): A list of colors to use \
                 for the gradient. Defaults to None.\n
             rainbow (bool): Whether to print the gradient text in rainbow colors\
@@ -120,48 +236,132 @@ class Gradient(Text):
                 Defaults to None.\n
             tab_size (int): Number of spaces per tab, or `None` to use\
                 `console.tab_size`. Defaults to 4.\n
-            spans (List[Span], optional): A list of predefined style spans.\
+            spans (List[Span], optional): A list of predefined style spans,\
+                kept beneath the gradient colors. Defaults to None.\n
+            period (int, optional): The number of characters in one cycle of \
+                a periodic gradient. Defaults to None.\n
+            skip_whitespace (bool, optional): Leave whitespace characters \
+                without a color span. Defaults to False.\n
+            advance_whitespace (bool, optional): Whether skipped whitespace \
+                still advances the gradient. Defaults to True.\n
+            easing (str|EasingFunction, optional): The easing curve that \
+                shapes the gradient's progression. Defaults to None.\n
+            mode (GradientMode, optional): "default", "vertical", "diagonal" \
+                or "radial". Defaults to "default".\n
+            angle (float, optional): The direction of a diagonal gradient in \
+                degrees. Defaults to 45.0.\n
+            frequency (float, optional): How quickly an analytic rainbow \
+                changes color. Defaults to 0.1.\n
+            spread (float, optional): How many columns each step of an \
+                analytic rainbow spreads across. Defaults to 3.0.\n
+            phase (float, optional): The phase of the first character of an \
+                analytic rainbow. Defaults to None, to pick it with `seed`.\n
+            seed (int, optional): Seed the random phase of an analytic \
+                rainbow, as lolcat does. Defaults to None, for a different \
+                phase each time.\n
+            line_offset (float, optional): The phase shift of each line of an \
+                analytic rainbow. Defaults to 1.0.\n
+            rng (int|Random, optional): A seed or a random number generator to \
+                pick random colors with, so they are the same on every run. \
+                Defaults to None.\n
+            color_offset (int, optional): The index in `ColorList.COLORS` of \
+                the first random color, instead of picking it at random. \
                 Defaults to None.\n
 
         """
 
         self.verbose = verbose or False
+        if period is not None and period < 1:
+            raise ValueError("Period must be a positive integer.")
+        if mode not in GRADIENT_MODES:
+            raise ValueError(
+                f"Mode must be one of {', '.join(GRADIENT_MODES)}, not {mode!r}."
+            )
+        if mode != "default" and period is not None:
+            raise ValueError("Periodic gradients must use the default mode.")
+        if isinstance(rainbow, str):
+            if rainbow not in RAINBOW_STYLES:
+                raise ValueError(
+                    f"Rainbow must be a bool or one of {', '.join(RAINBOW_STYLES)}, \
+not {rainbow!r}."
+                )
+            if mode != "default" or period is not None:
+                raise ValueError(
+                    "Analytic rainbows set their own positions, so cannot be \
+combined with a mode or period."
+                )
+            if spread <= 0:
+                raise ValueError("Spread must be positive.")
+            if phase is None:
+                # Like lolcat, start at one of 256 phases picked at random
+                phase = float(Random(seed).randrange(256))
+        self._rainbow: Optional[RainbowStyle] = (
+            rainbow if isinstance(rainbow, str) else None  # type: ignore
+        )
+        self._rainbow_options = (frequency, spread, phase or 0.0, line_offset)
+        self._rng = Random(rng) if isinstance(rng, int) else rng
+        self._color_offset = color_offset
+        self._mode: GradientMode = mode
+        self._angle = angle
+        self._period = period
+        self._skip_whitespace = skip_whitespace
+        self._advance_whitespace = advance_whitespace
+        self._ramp_position = 0
+        self._stops: Optional[Tuple[int, ...]] = None
+        if isinstance(colors, GradientRamp):
+            style = colors.style
+            easing = colors.easing
+            self._stops = colors.stops
+            colors = colors.colors
+        self._easing = None if easing is None else get_easing(easing)
         self.text = text  # type: ignore
         self.hues = hues
-        self.justify = justify or DEFAULT_JUSTIFY
-        self.overflow = overflow or DEFAULT_OVERFLOW
         self.style = Style.parse(style) if isinstance(style, str) else style
-        self.colors = self.validate_colors(colors or [], rainbow=rainbow)  # type: ignore
-        if len(self.colors) > 2:
-            self.hues = len(self.colors)
+        if self._rainbow is not None:
+            # Analytic rainbows are computed without any colors
+            self._colors: List[Color] = []
         else:
-            self.hues = hues
-        self.verbose = verbose
-
-        super().__init__(
-            text=self.text,
-            style=style,
-            justify=justify,
-            overflow=overflow,
-            no_wrap=no_wrap,
-            end=end or "\n",
-            tab_size=tab_size or 4,
-            spans=spans,
-        )
-        indexes = self.generate_indexes()
-        substrings = self.generate_substrings(indexes)
-        subgradients = self.generate_subgradients(substrings)
-        self._spans = self.join_subgradients(subgradients).spans
+            self._colors = self.validate_colors(
+                color_sequence(colors), rainbow=bool(rainbow)
+            )
+            self.hues = len(self._colors)
+        if self.verbose:
+            console.log(f"Gradient with {self.hues} colors:", self._colors)
+
+        # `text` has already been sanitized, so set the remaining attributes
+        # of `rich.text.Text` directly rather than processing it again.
+        self.justify = justify  # type: ignore
+        self.overflow = overflow
+        self.no_wrap = no_wrap
+        self.end = end or "\n"
+        self.tab_size = tab_size or 4
+        if self._period is not None:
+            generated = self.generate_periodic_spans(0, self.plain)
+        else:
+            generated = self.generate_spans()
+        # Keep the styles of a `Text` and of predefined spans, such as bold
+        # or links from markup, beneath the gradient colors.
+        markup: List[Span] = []
+        if isinstance(text, Text):
+            if text.style:
+                markup.append(Span(0, text._length, text.style))
+            markup.extend(text.spans)
+        if spans:
+            markup.extend(spans)
+        if markup:
+            self._spans = overlay_spans(generated.to_spans(), markup)
+        else:
+            self.set_span_array(generated)
 
     @property
     def text(self) -> str:
         """
-        Returns the concatenated string representation of the `_text` attribute.
+        The plain text of the gradient.
 
         Returns:
-            str: The concatenated string representation of the `_text` attribute.
+            str: The plain text of the gradient.
         """
-        return "".join(self._text) if isinstance(self._text, list) else self._text
+        return self.plain
 
     @text.setter
     def text(self, value: Optional[str] | Optional[Text]) -> None:
@@ -176,17 +376,32 @@ class Gradient(Text):
         """
         if isinstance(value, Text):
             self._length = value._length
-            self._text = value._text
+            self._text = [value.plain]
             self._spans = value.spans
         elif isinstance(value, str):
             sanitized_text = strip_control_codes(value)
             self._length = len(sanitized_text)
-            self._text = list(sanitized_text)
+            self._text = [sanitized_text]
         elif value is None:
             raise ValueError("Text cannot be None.")
         else:
             raise TypeError(f"Text must be a string or Text, not {type(value)}")
 
+    @property
+    def period(self) -> Optional[int]:
+        """The number of characters in one cycle of a periodic gradient."""
+        return self._period
+
+    @property
+    def easing(self) -> Optional[EasingFunction]:
+        """The easing curve of the gradient, or None if it is linear."""
+        return self._easing
+
+    @property
+    def mode(self) -> GradientMode:
+        """How the gradient maps characters onto its colors."""
+        return self._mode
+
     @property
     def hues(self) -> int:
         """The number of colors in the gradient."""
@@ -253,11 +468,12 @@ class Gradient(Text):
         _colors = self.validate_colors(colors)
         if self.verbose:
             console.log(f"Gradient with {self.hues} colors:", _colors)
-        self._colors: List[Color] = _colors
+        self._colors = _colors
+        self._stops = None
 
     def validate_colors(
         self,
-        colors: Optional[List[ColorType]] | Optional[List[Color]],
+        colors: Optional[Sequence[ColorType]],
         rainbow: bool = False,
     ) -> List[Color]:
         """Validate input colors, and convert them into `Color` objects.
@@ -277,7 +493,9 @@ class Gradient(Text):
         _colors: List[Color] = []
         if colors is None or colors == []:
             if not rainbow:
-                color_list = ColorList(self.hues)
+                color_list = ColorList(
+                    self.hues, rng=self._rng, offset=self._color_offset
+                )
                 for index, color in enumerate(color_list):
                     if self.verbose:
                         console.rule(
@@ -296,8 +514,10 @@ class Gradient(Text):
             else:
                 self.hues = 20
                 if self._length < 20:
-                    self.hues = self._length
-                color_list = ColorList(self.hues)
+                    self.hues = max(self._length, 2)
+                color_list = ColorList(
+                    self.hues, rng=self._rng, offset=self._color_offset
+                )
                 for index, color in enumerate(color_list):
                     if self.verbose:
                         console.rule(
@@ -315,6 +535,9 @@ class Gradient(Text):
                 return _colors
         elif isinstance(colors, tuple):
             for color in colors:
+                if isinstance(color, Color):
+                    _colors.append(color)
+                    continue
                 try:
                     color = Color(color)
                 except PydanticCustomError as pce:
@@ -330,6 +553,9 @@ class Gradient(Text):
             return _colors
         elif isinstance(colors, list):
             for color in colors:  # type: ignore
+                if isinstance(color, Color):
+                    _colors.append(color)
+                    continue
                 try:
                     color = Color(color)
                 except PydanticCustomError as pce:
@@ -364,107 +590,314 @@ class Gradient(Text):
         """
         self._spans = spans
 
-    def generate_indexes(self) -> List[List[int]]:
-        """Chunk the text into a list of strings.
+    def generate_spans(self) -> SpanArray:
+        """Generate the gradient's spans in a single vectorized pass.
+
+        Every character's position along the ramp is blended between the \
+            adjacent pair of colors at once, so the cost does not depend on \
+            the number of colors. Positions are measured in terminal cells, \
+            so wide characters get as much of the ramp as they take up on \
+            screen. Ramps are cached, so gradients with the same colors, \
+            length and options share one computation. If the disk cache is \
+            enabled, spans computed by an earlier process are loaded from it.
 
         Returns:
-            List[str]: The list of strings.
+            SpanArray: One span per colored character.
         """
-        if self.verbose:
-            console.log(f"Text: {self.text}")
-            console.log(f"Length: {self._length}")
-            console.log(f"Hues: {self.hues}")
-        result = np.array_split(np.arange(self._length), self.hues - 1)  # noqa: F722
+        cache = get_cache()
+        key: Optional[str] = None
+        if cache is not None and self._rainbow is None:
+            key = SpanCache.key(
+                self.plain,
+                self.packed_stops(),
+                style=self.base_style,
+                easing=self._easing,
+                mode=self._mode,
+                angle=self._angle,
+                skip_whitespace=self._skip_whitespace,
+                advance_whitespace=self._advance_whitespace,
+            )
+            cached = None if key is None else cache.load(key)
+            if cached is not None:
+                return SpanArray.from_table(
+                    palette_styles(cached.palette, self.base_style),
+                    cached.style_ids,
+                    indexes=cached.indexes,
+                )
+        table, styles = self.span_table()
+        if cache is not None and key is not None:
+            cache.store(key, table)
+        return SpanArray.from_table(styles, table.style_ids, indexes=table.indexes)
 
-        indexes: List[List[int]] = [sublist.tolist() for sublist in result]
-        if self.verbose:
-            index_text = Text(" ".join([f"{index}" for index in indexes]))
-            console.print(index_text)
-        return indexes
+    def span_table(self) -> Tuple[SpanTable, Sequence[Style]]:
+        """Compute the color of every character of the gradient.
+
+        Returns:
+            Tuple[SpanTable, Sequence[Style]]: The palette of the gradient, \
+                the index into it of each colored character's color and the \
+                offsets of the colored characters, along with the pooled \
+                style of each color of the palette.
+        """
+        if self._rainbow is not None:
+            return self.rainbow_span_table()
+        if self._mode != "default":
+            return self.grid_span_table()
+        text = self.plain
+        if not self._skip_whitespace and text.isascii() and text.isprintable():
+            ramp = self.ramp(self._length)
+            return SpanTable(ramp.palette, ramp.style_ids, None), ramp.styles
+        columns, indexes, cells = ramp_columns(
+            text,
+            skip_whitespace=self._skip_whitespace,
+            advance_whitespace=self._advance_whitespace,
+        )
+        ramp = self.ramp(max(cells, 1))
+        # Zero-width characters at the end sit on the last column
+        columns = np.minimum(columns, len(ramp) - 1)
+        return SpanTable(ramp.palette, ramp.style_ids[columns], indexes), ramp.styles
+
+    def grid_span_table(self) -> Tuple[SpanTable, Sequence[Style]]:
+        """Compute the colors of a two-dimensional gradient.
 
-    def generate_substrings(self, indexes: List[List[int]]) -> List[str]:
-        """Split the text into substrings based on the indexes.
+        The color of each character is a function of its row and cell \
+            column, computed in one pass over the grid of the text.
+
+        Returns:
+            Tuple[SpanTable, Sequence[Style]]: The colors of the characters \
+                and the pooled style of each color, as for `span_table`.
+        """
+        text = self.plain
+        rows, columns = grid_positions(text)
+        indexes: Optional[np.ndarray] = None
+        if self._skip_whitespace:
+            indexes = np.flatnonzero(visible_mask(text))
+            rows, columns = rows[indexes], columns[indexes]
+        blend = grid_blend(rows, columns, self._mode, self._angle)
+        if self._easing is not None:
+            blend = self._easing(blend)
+        palette, style_ids = palette_table(interpolate(stops_array(self.colors), blend))
+        styles = palette_styles(palette, self.base_style)
+        return SpanTable(palette, style_ids, indexes), styles
+
+    def rainbow_span_table(self) -> Tuple[SpanTable, Sequence[Style]]:
+        """Compute the colors of an analytic rainbow.
+
+        Colors are computed directly from each character's row and cell \
+            column, like lolcat, so there is no palette to build and the \
+            cost grows linearly with the length of the text.
+
+        Returns:
+            Tuple[SpanTable, Sequence[Style]]: The colors of the characters \
+                and the pooled style of each color, as for `span_table`.
+        """
+        assert self._rainbow is not None, "Gradient is not an analytic rainbow."
+        text = self.plain
+        if not text:
+            empty = np.zeros(0, dtype=np.int64)
+            return SpanTable(np.zeros(0, dtype=np.uint32), empty, None), []
+        rows, columns = grid_positions(text)
+        indexes: Optional[np.ndarray] = None
+        if self._skip_whitespace:
+            indexes = np.flatnonzero(visible_mask(text))
+            rows, columns = rows[indexes], columns[indexes]
+        frequency, spread, phase, line_offset = self._rainbow_options
+        rgb = rainbow_rgb(
+            rows,
+            columns,
+            self._rainbow,
+            frequency=frequency,
+            spread=spread,
+            phase=phase,
+            line_offset=line_offset,
+        )
+        palette, style_ids = palette_table(rgb)
+        styles = palette_styles(palette, self.base_style)
+        return SpanTable(palette, style_ids, indexes), styles
+
+    @property
+    def base_style(self) -> Style:
+        """The style of the gradient, parsed if it was set as a string."""
+        style = self.style
+        return Style.parse(style) if isinstance(style, str) else style
+
+    def packed_stops(self) -> Tuple[int, ...]:
+        """The colors of the gradient, packed as `0xRRGGBB`."""
+        if self._stops is None:
+            self._stops = tuple(pack_color(color) for color in self.colors)
+        return self._stops
+
+    def ramp(self, length: int) -> GradientRamp:
+        """Get the compiled ramp of the gradient's colors and options.
 
         Args:
-            indexes (List[List[int]]): The indexes to split the text on.
+            length (int): The number of characters in the ramp.
 
         Returns:
-            List[str]: The list of substrings.
+            GradientRamp: The cached ramp.
         """
-        substrings: List[str] = []
-        slices: List[Tuple[int, int]] = []
-
-        # For each index get the first and last element
-        for index in indexes:
-            start = index[0]
-            end = index[-1] + 1
-            slices.append((start, end))  #  # Slice the text
-
-        # If the text is a list, join it into a single string
-        if isinstance(self.text, list):
-            text = " ".join(self.text)
-        elif isinstance(self.text, str):
-            text = self.text
-        else:
-            raise TypeError(f"Text must be a string or list, not {type(self.text)}")
+        return compile_ramp(self.packed_stops(), length, self.base_style, self._easing)
 
-        # split the text into substrings
-        for index, (start, end) in enumerate(slices, 1):  # type: ignore
-            substring = text[start:end]
-            substrings.append(substring)
-        return substrings
+    @classmethod
+    def compile(
+        cls,
+        colors: GradientColors,
+        length: int,
+        *,
+        style: Optional[StyleType] = None,
+        easing: Optional[Easing] = None,
+    ) -> GradientRamp:
+        """Compile colors into a reusable ramp for text of a given length.
 
-    def generate_subgradients(self, substrings: List[str]) -> List[SimpleGradient]:
-        """Generate simple gradients.
+        The ramp validates the colors and computes the style of every \
+            position once. It is cached by its colors, length and options, \
+            and can be applied to many texts of that length.
 
         Args:
-            substrings (List[str]): The substrings to generate gradients for.
+            colors (GradientColors): The colors of the gradient.
+            length (int): The number of characters in the ramp.
+            style (StyleType, optional): The base style. Defaults to None.
+            easing (str|EasingFunction, optional): The easing curve. Defaults \
+                to None (linear).
 
         Returns:
-            List[SimpleGradient]: The list of simple gradients.
+            GradientRamp: The compiled ramp.
         """
-        subgradients: List[SimpleGradient] = []
-
-        for index, substring in enumerate(substrings):
-            # Get the colors for the gradient
-            color_1 = self.colors[index]
-            color_2 = self.colors[index + 1]
-
-            assert self.overflow is not None, "Overflow must be set."
-
-            # Create a simple gradient
-            gradient = SimpleGradient(
-                substring,  # type: ignore
-                color1=color_1.hex,
-                color2=color_2.hex,
-                justify=self.justify,
-                overflow=self.overflow,
-                style=self.style,
-                no_wrap=self.no_wrap or False,
-                end=self.end or "\n",
-                spans=self.spans,
+        if isinstance(colors, GradientRamp):
+            return colors.resample(length)
+        return GradientRamp.compile(
+            color_sequence(colors), length, style=style, easing=easing
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, Path],
+        colors: GradientColors = None,
+        *,
+        encoding: str = "utf-8",
+        errors: str = "replace",
+        period: Optional[int] = None,
+        style: Optional[StyleType] = None,
+        easing: Optional[Easing] = None,
+        skip_whitespace: bool = False,
+        advance_whitespace: bool = True,
+        chunk_size: int = FILE_CHUNK_SIZE,
+    ) -> GradientStream:
+        """Color a file of any size without reading it into memory.
+
+        The file is memory-mapped and decoded a block at a time. Without a \
+            `period`, the gradient spans the whole file: its length in cells \
+            is counted first, straight from the bytes of ASCII blocks. Memory \
+            use stays flat however large the file is.
+
+        Args:
+            path (str|Path): The path of the file.
+            colors (GradientColors): The colors of the gradient. Defaults to \
+                four random adjacent colors.
+            encoding (str, optional): The encoding of the file. Defaults to \
+                "utf-8".
+            errors (str, optional): How to handle decoding errors. Defaults \
+                to "replace".
+            period (int, optional): Repeat the gradient every `period` cells \
+                rather than spreading it across the whole file, which skips \
+                the counting pass. Defaults to None.
+            style (StyleType, optional): The base style. Defaults to None.
+            easing (str|EasingFunction, optional): The easing curve. Defaults \
+                to None (linear).
+            skip_whitespace (bool, optional): Leave whitespace characters \
+                without a color. Defaults to False.
+            advance_whitespace (bool, optional): Whether skipped whitespace \
+                still advances the gradient. Defaults to True.
+            chunk_size (int, optional): The number of bytes to decode at a \
+                time. Defaults to 1 MiB.
+
+        Returns:
+            GradientStream: The colored file. Render it to an output stream \
+                with `write`, or print it with a console.
+        """
+        if isinstance(colors, GradientRamp):
+            style = colors.style
+            easing = colors.easing
+        stream_colors = color_sequence(colors)
+        text = MappedFile(path, encoding, errors, chunk_size)
+        length = None
+        if period is None:
+            length = text.measure(
+                skip_whitespace=skip_whitespace,
+                advance_whitespace=advance_whitespace,
             )
+        return GradientStream(
+            text,
+            stream_colors,
+            period=period or DEFAULT_PERIOD,
+            length=length,
+            style=style,
+            easing=easing,
+            skip_whitespace=skip_whitespace,
+            advance_whitespace=advance_whitespace,
+        )
 
-            subgradients.append(gradient)
-        return subgradients
+    def generate_periodic_spans(self, start: int, text: str) -> SpanArray:
+        """Generate the spans of a run of text in a periodic gradient.
 
-    def join_subgradients(self, subgradients: List[SimpleGradient]) -> Text:
-        """Join the subgradients into a single gradient.
+        The color of each character only depends on its absolute position, \
+            so the spans of any run can be generated without touching the \
+            rest of the text.
 
         Args:
-            subgradients (List[SimpleGradient]): The list of subgradients.
+            start (int): The offset of the first character of the run.
+            text (str): The text of the run.
 
         Returns:
-            Text: The joined gradient.
+            SpanArray: The spans of the run.
         """
-        result = Text()
-        for gradient in subgradients:
-            result.append(gradient)
-        return result
+        assert self._period is not None, "Gradient is not periodic."
+        columns, indexes, cells = ramp_columns(
+            text,
+            skip_whitespace=self._skip_whitespace,
+            advance_whitespace=self._advance_whitespace,
+        )
+        positions = columns + self._ramp_position
+        self._ramp_position += cells
+        blend = periodic_blend(positions, self._period)
+        if self._easing is not None:
+            blend = self._easing(blend)
+        stops = stops_array(self.colors, cyclic=True)
+        styles, style_ids = style_table(interpolate(stops, blend), self.base_style)
+        return SpanArray.from_table(styles, style_ids, start, indexes)
+
+    def append(
+        self, text: Union[str, Text], style: Optional[Union[str, Style]] = None
+    ) -> "Gradient":
+        """Add text with an optional style.
+
+        A periodic gradient colors the appended characters in constant time \
+            per character. Other gradients append the text without recoloring.
+
+        Args:
+            text (str|Text): A str or Text to append.
+            style (str, optional): A style name. Defaults to None.
+
+        Returns:
+            Gradient: Returns self for chaining.
+        """
+        offset = self._length
+        span_count = len(self._spans)
+        super().append(text, style)
+        if self._period is not None and self._length > offset:
+            appended = text.plain if isinstance(text, Text) else self._text[-1]
+            # Insert beneath the appended styles so they keep precedence
+            self._spans[span_count:span_count] = self.generate_periodic_spans(
+                offset, appended
+            )
+        return self
 
     def as_text(self) -> Text:
         """Convert the gradient to a `Text`.
 
+        The `Text` gets a list of spans of its own, so either can be changed \
+            without changing the other.
+
         Returns:
             Text: The gradient as a `rich.text.Text` object.
         """
@@ -482,7 +915,7 @@ class Gradient(Text):
             no_wrap=self.no_wrap,
             end=self.end or "\n",
             tab_size=self.tab_size,
-            spans=self._spans,
+            spans=self.copy_spans(),
         )
 
     @classmethod
@@ -610,6 +1043,47 @@ class Gradient(Text):
         Gradient.rainbow_gradient_example()
 
 
+def gradient_many(
+    texts: Iterable[Union[str, Text]],
+    colors: GradientColors = None,
+    *,
+    style: Optional[StyleType] = None,
+    easing: Optional[Easing] = None,
+    **kwargs: Any,
+) -> List[Gradient]:
+    """Color many texts with the same gradient in one call.
+
+    The colors are validated once rather than once per text, and the texts \
+        are colored in order of length, so the ramp of each length is \
+        computed once and shared by every text of that length.
+
+    Args:
+        texts (Iterable[str|Text]): The texts to color.
+        colors (GradientColors): The colors of the gradient, or a compiled \
+            `GradientRamp`. Defaults to four random adjacent colors, shared \
+            by every text.
+        style (StyleType, optional): The base style. Defaults to None.
+        easing (str|EasingFunction, optional): The easing curve. Defaults to \
+            None (linear).
+        **kwargs: Other keyword arguments for `Gradient`, such as `justify` \
+            or `skip_whitespace`.
+
+    Returns:
+        List[Gradient]: One gradient per text, in the order of `texts`.
+    """
+    texts = list(texts)
+    gradients: List[Gradient] = [None] * len(texts)  # type: ignore
+    ramp: Optional[GradientRamp] = None
+    for index in sorted(range(len(texts)), key=lambda index: len(texts[index])):
+        text = texts[index]
+        if ramp is None:
+            ramp = Gradient.compile(colors, len(text), style=style, easing=easing)
+        else:
+            ramp = ramp.resample(len(text))
+        gradients[index] = Gradient(text, colors=ramp, **kwargs)
+    return gradients
+
+
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
     from rich.traceback import install as tr_install
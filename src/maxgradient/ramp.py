@@ -0,0 +1,325 @@
+"""Compiled gradient ramps that can be reused across many texts."""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from rich.style import Style, StyleType
+from rich.text import Span, Text
+
+from maxgradient._ramp import interpolate, palette_styles, palette_table, style_spans
+from maxgradient._spans import id_array, read_only
+from maxgradient.color import Color, ColorType
+from maxgradient.color_list import ColorList
+from maxgradient.easing import Easing, EasingFunction, get_easing
+
+if TYPE_CHECKING:  # pragma: no cover
+    from maxgradient.gradient import Gradient
+
+RAMP_CACHE_SIZE = 4 * 1024 * 1024
+"""The most bytes of ramp arrays to keep in the cache of `compile_ramp`."""
+RampKey = Tuple[Tuple[int, ...], int, Style, Optional[EasingFunction]]
+
+
+class GradientRamp:
+    """An immutable gradient precomputed for a fixed number of characters.
+
+    A ramp holds the style of every position, as an index in the smallest \
+        unsigned type into a small table of shared styles. It can be applied \
+        to any text of its length, or resampled to another length. Use \
+        `GradientRamp.compile` or `Gradient.compile` to get a cached ramp.
+
+    Args:
+        stops (Sequence[int]): The colors of the gradient, packed as `0xRRGGBB`.
+        length (int): The number of characters in the ramp.
+        style (Style, optional): The base style of the gradient. Defaults to \
+            `Style.null()`.
+        easing (EasingFunction, optional): The easing curve of the gradient. \
+            Defaults to None (linear).
+    """
+
+    __slots__ = (
+        "_stops",
+        "_length",
+        "_style",
+        "_easing",
+        "_styles",
+        "_style_ids",
+        "_palette",
+        "_colors",
+    )
+
+    def __init__(
+        self,
+        stops: Sequence[int],
+        length: int,
+        *,
+        style: Style = Style.null(),
+        easing: Optional[EasingFunction] = None,
+    ) -> None:
+        if len(stops) < 2:
+            raise ValueError("Gradient must have at least two colors.")
+        if length < 0:
+            raise ValueError("Length must not be negative.")
+        self._stops: Tuple[int, ...] = tuple(stops)
+        self._length = length
+        self._style = style
+        self._easing = easing
+        self._colors: Optional[Tuple[Color, ...]] = None
+
+        blend = np.arange(length) / max(length - 1, 1)
+        if easing is not None:
+            blend = easing(blend)
+        rgb = interpolate(self.stops_array(), blend)
+        palette, style_ids = palette_table(rgb)
+        self._palette: np.ndarray = read_only(palette)
+        self._styles: Tuple[Style, ...] = tuple(palette_styles(palette, style))
+        self._style_ids: np.ndarray = read_only(id_array(style_ids, len(palette)))
+
+    def __repr__(self) -> str:
+        stops = ", ".join(f"#{stop:06x}" for stop in self._stops)
+        return f"GradientRamp([{stops}], length={self._length})"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, GradientRamp):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    @property
+    def key(self) -> RampKey:
+        """The stops, length and options that identify the ramp."""
+        return (self._stops, self._length, self._style, self._easing)
+
+    @property
+    def nbytes(self) -> int:
+        """The bytes of the ramp's arrays."""
+        return self._palette.nbytes + self._style_ids.nbytes
+
+    @property
+    def stops(self) -> Tuple[int, ...]:
+        """The colors of the ramp, packed as `0xRRGGBB`."""
+        return self._stops
+
+    @property
+    def colors(self) -> List[Color]:
+        """The colors of the ramp."""
+        if self._colors is None:
+            self._colors = tuple(Color(f"#{stop:06x}") for stop in self._stops)
+        return list(self._colors)
+
+    @property
+    def style(self) -> Style:
+        """The base style of the ramp."""
+        return self._style
+
+    @property
+    def easing(self) -> Optional[EasingFunction]:
+        """The easing curve of the ramp, or None if it is linear."""
+        return self._easing
+
+    @property
+    def styles(self) -> Tuple[Style, ...]:
+        """The distinct styles of the ramp."""
+        return self._styles
+
+    @property
+    def palette(self) -> np.ndarray:
+        """The color of each of `styles`, packed as `0xRRGGBB`. Read-only."""
+        return self._palette
+
+    @property
+    def style_ids(self) -> np.ndarray:
+        """The index into `styles` of each position. Read-only."""
+        return self._style_ids
+
+    def stops_array(self) -> np.ndarray:
+        """The stops of the ramp as a `(stops, 3)` float array."""
+        stops = np.array(self._stops, dtype=np.uint32)
+        return np.stack(
+            [(stops >> 16) & 0xFF, (stops >> 8) & 0xFF, stops & 0xFF], axis=1
+        ).astype(np.float64)
+
+    def spans(
+        self,
+        offset: int = 0,
+        indexes: Optional[np.ndarray] = None,
+    ) -> List[Span]:
+        """Generate one span per position of the ramp.
+
+        Args:
+            offset (int, optional): The offset of the first character. \
+                Defaults to 0.
+            indexes (np.ndarray, optional): The offset of each position, for \
+                text with characters that are not colored. Defaults to \
+                consecutive offsets.
+
+        Returns:
+            List[Span]: The spans.
+        """
+        return style_spans(self._styles, self._style_ids, offset, indexes)
+
+    def resample(self, length: int) -> "GradientRamp":
+        """Get the ramp with the same colors and options for another length.
+
+        Args:
+            length (int): The number of characters of the new ramp.
+
+        Returns:
+            GradientRamp: The resampled ramp.
+        """
+        if length == self._length:
+            return self
+        return compile_ramp(self._stops, length, self._style, self._easing)
+
+    def apply(self, text: str | Text, **kwargs: Any) -> "Gradient":
+        """Color text with the ramp.
+
+        Args:
+            text (str|Text): Text with exactly as many characters as the ramp.
+            **kwargs: Other keyword arguments for `Gradient`, such as \
+                `justify` or `end`.
+
+        Returns:
+            Gradient: The text colored with the ramp.
+
+        Raises:
+            ValueError: If the length of the text does not match the ramp.
+        """
+        from maxgradient.gradient import Gradient
+
+        if len(text) != self._length:
+            raise ValueError(
+                f"Text of length {len(text)} does not match a ramp of length \
+{self._length}. Use `resample` to get a ramp of the right length."
+            )
+        return Gradient(text, colors=self, **kwargs)
+
+    @classmethod
+    def compile(
+        cls,
+        colors: Optional[Sequence[ColorType]],
+        length: int,
+        *,
+        style: Optional[StyleType] = None,
+        easing: Optional[Easing] = None,
+    ) -> "GradientRamp":
+        """Validate colors and get the cached ramp for them.
+
+        Args:
+            colors (Sequence[ColorType], optional): The colors of the gradient. \
+                Four random adjacent colors if None.
+            length (int): The number of characters in the ramp.
+            style (StyleType, optional): The base style. Defaults to None.
+            easing (str|EasingFunction, optional): The easing curve. Defaults \
+                to None (linear).
+
+        Returns:
+            GradientRamp: The compiled ramp.
+        """
+        if not colors:
+            colors = ColorList(4).color_list
+        stops = tuple(pack_color(color) for color in colors)
+        if style is None:
+            _style = Style.null()
+        elif isinstance(style, str):
+            _style = Style.parse(style)
+        else:
+            _style = style
+        _easing = None if easing is None else get_easing(easing)
+        return compile_ramp(stops, length, _style, _easing)
+
+
+def pack_color(color: ColorType) -> int:
+    """Validate a color and pack it as `0xRRGGBB`.
+
+    Args:
+        color (ColorType): The color to pack.
+
+    Returns:
+        int: The packed color.
+    """
+    if not isinstance(color, Color):
+        color = Color(color)
+    red, green, blue = color.triplet
+    return (red << 16) | (green << 8) | blue
+
+
+class RampCache:
+    """A cache of compiled ramps, bounded by the bytes of their arrays.
+
+    The arrays of a ramp grow with its length, so the cache counts their \
+        bytes rather than the ramps. Once they pass `max_size`, the least \
+        recently used ramps are dropped.
+
+    Args:
+        max_size (int, optional): The most bytes to keep. Defaults to 4 MiB.
+    """
+
+    def __init__(self, max_size: int = RAMP_CACHE_SIZE) -> None:
+        if max_size < 0:
+            raise ValueError(f"max_size must not be negative, not {max_size}.")
+        self.max_size = max_size
+        self.size = 0
+        self._ramps: Dict[RampKey, GradientRamp] = {}
+
+    def __len__(self) -> int:
+        return len(self._ramps)
+
+    def get(self, key: RampKey) -> Optional[GradientRamp]:
+        """Get a ramp, or None if it is not cached."""
+        ramp = self._ramps.pop(key, None)
+        if ramp is not None:
+            # Move the ramp to the end, as the most recently used
+            self._ramps[key] = ramp
+        return ramp
+
+    def put(self, ramp: GradientRamp) -> None:
+        """Store a ramp, dropping the least recently used to make room."""
+        key = ramp.key
+        if key in self._ramps:
+            return
+        self._ramps[key] = ramp
+        self.size += ramp.nbytes
+        while self.size > self.max_size and self._ramps:
+            dropped = self._ramps.pop(next(iter(self._ramps)))
+            self.size -= dropped.nbytes
+
+    def clear(self) -> None:
+        """Drop every cached ramp."""
+        self._ramps.clear()
+        self.size = 0
+
+
+ramp_cache = RampCache()
+
+
+def compile_ramp(
+    stops: Tuple[int, ...],
+    length: int,
+    style: Style = Style.null(),
+    easing: Optional[EasingFunction] = None,
+) -> GradientRamp:
+    """Get the cached ramp for packed stops, a length and options.
+
+    Ramps are kept in `ramp_cache`, until the bytes of their arrays pass \
+        `RAMP_CACHE_SIZE`.
+
+    Args:
+        stops (Tuple[int, ...]): The colors of the gradient, packed as `0xRRGGBB`.
+        length (int): The number of characters in the ramp.
+        style (Style, optional): The base style. Defaults to `Style.null()`.
+        easing (EasingFunction, optional): The easing curve. Defaults to None.
+
+    Returns:
+        GradientRamp: The ramp.
+    """
+    ramp = ramp_cache.get((stops, length, style, easing))
+    if ramp is None:
+        ramp = GradientRamp(stops, length, style=style, easing=easing)
+        ramp_cache.put(ramp)
+    return ramp
@@ -1,25 +1,66 @@
 """Rule class for maxgradient package."""
 
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from random import Random
+from typing import Dict, Hashable, Iterable, List, Literal, Optional, Tuple, Union
 
 from rich.align import AlignMethod
 from rich.cells import cell_len, set_cell_size
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.jupyter import JupyterMixin
 from rich.measure import Measurement
+from rich.segment import Segment
 from rich.text import Text
 
 from maxgradient.color import Color
 from maxgradient.color_list import ColorList
+from maxgradient.easing import Easing
 from maxgradient.gradient import Gradient
 
 # # from maxgradient.log import log
 Thickness = Literal["thin", "medium", "thick"]
+RuleKey = Tuple[Hashable, ...]
+RULE_CACHE_SIZE = 16
 
 console = Console()
 
 
+class RuleCache:
+    """A bounded cache of the segments of rendered rules.
+
+    Every rule has a cache of its own. Rules that are drawn with the same \
+        settings, such as the rules of a dashboard, can share one instead, so \
+        only the first of them is rendered.
+
+    Args:
+        size (int, optional): The most renders to keep. The oldest is dropped \
+            to make room for a new one. Defaults to 16.
+    """
+
+    def __init__(self, size: int = RULE_CACHE_SIZE) -> None:
+        if size < 1:
+            raise ValueError(f"size must be at least 1, not {size}.")
+        self.size = size
+        self._segments: Dict[RuleKey, List[Segment]] = {}
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def get(self, key: RuleKey) -> Optional[List[Segment]]:
+        """Get the segments of a rendered rule, or None if it is not cached."""
+        return self._segments.get(key)
+
+    def put(self, key: RuleKey, segments: List[Segment]) -> None:
+        """Store the segments of a rendered rule."""
+        if key not in self._segments and len(self._segments) >= self.size:
+            del self._segments[next(iter(self._segments))]
+        self._segments[key] = segments
+
+    def clear(self) -> None:
+        """Drop every cached render."""
+        self._segments.clear()
+
+
 class GradientRule(JupyterMixin):
     """A console renderable to draw a horizontal rule (line).
 
@@ -30,6 +71,14 @@ class GradientRule(JupyterMixin):
         end (str, optional): Character at end of Rule. defaults to "\\\\n"
         align (str, optional): How to align the title, one of "left",
             "center", or "right". Defaults to "center".
+        easing (str|EasingFunction, optional): The easing curve of the rule's
+            gradients. Defaults to None (linear).
+        rng (int|Random, optional): A seed or a random number generator to
+            pick the colors of the rule with. Defaults to None.
+        color_offset (int, optional): The index in `ColorList.COLORS` of the
+            first color, instead of picking it at random. Defaults to None.
+        cache (RuleCache, optional): A cache of rendered rules to share with
+            other rules. Defaults to a cache of this rule's own.
     """
 
     def __init__(
@@ -40,6 +89,10 @@ class GradientRule(JupyterMixin):
         thickness: Thickness = "medium",
         end: str = "\n",
         align: AlignMethod = "center",
+        easing: Optional[Easing] = None,
+        rng: Union[int, Random, None] = None,
+        color_offset: Optional[int] = None,
+        cache: Optional[RuleCache] = None,
     ) -> None:
         self.gradient: bool = gradient
         assert thickness in ["thin", "medium", "thick"], "Invalid thickness"
@@ -61,8 +114,11 @@ class GradientRule(JupyterMixin):
         self.title: str | Text = title
         self.end = end
         self.align = align
+        self.easing = easing
 
-        rule_color_list = ColorList(10).color_list
+        if isinstance(rng, int):
+            rng = Random(rng)
+        rule_color_list = ColorList(10, rng=rng, offset=color_offset).color_list
         self.left_colors: List[Color] = [
             rule_color_list[0],
             rule_color_list[1],
@@ -77,6 +133,7 @@ class GradientRule(JupyterMixin):
             rule_color_list[7],
             rule_color_list[8],
         ]
+        self.cache = RuleCache() if cache is None else cache
 
     def __repr__(self) -> str:
         return f"Rule<{self.title!r}, {self.characters!r}>"
@@ -85,6 +142,74 @@ class GradientRule(JupyterMixin):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
+        key = self.cache_key(console, options)
+        segments = self.cache.get(key)
+        if segments is None:
+            segments = []
+            for renderable in self.render_rule(console, options):
+                segments.extend(console.render(renderable, options))
+            self.cache.put(key, segments)
+        yield from segments
+
+    def cache_key(self, console: Console, options: ConsoleOptions) -> RuleKey:
+        """Identify a render of the rule by everything its segments depend on.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+
+        Returns:
+            RuleKey: The key of the render in the cache.
+        """
+        title: Hashable
+        if isinstance(self.title, Text):
+            title = (
+                self.title.plain,
+                self.title.style,
+                tuple(self.title.spans),
+                self.title.end,
+            )
+        else:
+            # A str title is rendered with the console's markup, emoji and
+            # highlighter settings, so key it by them rather than parsing it
+            title = (
+                self.title,
+                console._markup,
+                console._emoji,
+                console._emoji_variant,
+                console._highlight,
+                console.highlighter,
+            )
+        return (
+            options.max_width,
+            title,
+            # Style names are looked up in the styles of the current theme.
+            # Its bound `get` compares by identity and keeps them alive.
+            console._theme_stack.get,
+            self.align,
+            self.thickness,
+            self.characters,
+            options.ascii_only,
+            console.color_system,
+            self.gradient,
+            self.end,
+            self.easing,
+            tuple(color.hex for color in self.left_colors),
+            tuple(color.hex for color in self.right_colors),
+        )
+
+    def render_rule(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterable[Text]:
+        """Build the text of the rule, without the cache.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+
+        Returns:
+            Iterable[Text]: The text of the rule.
+        """
         width = options.max_width
 
         characters = (
@@ -95,21 +220,12 @@ class GradientRule(JupyterMixin):
 
         chars_len = cell_len(characters)
         if not self.title:
-            color_list = ColorList(5)
-            yield Gradient(
-                self._rule_line(chars_len, width),
-                colors=[
-                    color_list[0],
-                    color_list[1],
-                    color_list[2],
-                    color_list[3],
-                    color_list[4],
-                ],
-            )
+            yield self._rule_line(chars_len, width)
             return
 
         if isinstance(self.title, Text):
-            self.title_text: Text = self.title
+            # Truncating the title must not change the rule's own title
+            self.title_text: Text = self.title.copy()
         else:
             self.title_text = console.render_str(self.title, style="rule.text")
 
@@ -129,27 +245,22 @@ class GradientRule(JupyterMixin):
             rule_text = self.center_rule(rule_text, truncate_width, chars_len, width)
         elif self.align == "left":
             self.title_text.truncate(truncate_width, overflow="ellipsis")
-            rule_text.append(self.title_text)
-            rule_text.append(" ")
-            if self.gradient:
-                rule_text.append(
-                    Gradient(
-                        characters * (width - self.title_text.cell_len - 1),
-                        colors=self.right_colors,  # type: ignore
-                    )
-                )
-            else:
-                rule_text.append(characters * (width - rule_text.cell_len))
+            line = self._side_line(
+                characters * (width - self.title_text.cell_len - 1), self.right_colors
+            )
+            rule_text = Gradient.concat(
+                [rule_text, self.title_text, " ", line], end=rule_text.end
+            )
         elif self.align == "right":
             self.title_text.truncate(truncate_width, overflow="ellipsis")
-            rule_text.append(
-                Gradient(
-                    characters * (width - self.title_text.cell_len - 1),
-                    colors=self.left_colors,  # type: ignore
-                )
+            line = Gradient(
+                characters * (width - self.title_text.cell_len - 1),
+                colors=self.left_colors,  # type: ignore
+                easing=self.easing,
+            )
+            rule_text = Gradient.concat(
+                [rule_text, line, " ", self.title_text], end=rule_text.end
             )
-            rule_text.append(" ")
-            rule_text.append(self.title_text)
 
         rule_text.plain = set_cell_size(rule_text.plain, width)
         yield rule_text
@@ -158,6 +269,7 @@ class GradientRule(JupyterMixin):
         rule_text = Gradient(
             self.characters * ((width // chars_len) + 1),
             colors=self.left_colors,  # type: ignore
+            easing=self.easing,
         )
         rule_text.truncate(width)
         rule_text.plain = set_cell_size(rule_text.plain, width)
@@ -178,36 +290,37 @@ class GradientRule(JupyterMixin):
             rule_text = Text()
         self.title_text.truncate(truncate_width, overflow="ellipsis")
         self.side_width: int = (width - cell_len(self.title_text.plain)) // 2
-        if self.gradient:
-            rule_text.append(
-                Gradient(
-                    self.characters * (self.side_width // chars_len + 1),
-                    colors=self.left_colors,  # type: ignore
-                    end="",
-                )
-            )
-        else:
-            rule_text.append(
-                Text(self.characters * (self.side_width // chars_len + 1), end="")
-            )
-        rule_text.append(" ")
-        rule_text.append(self.title_text)
-        rule_text.append(" ")
-        if self.gradient:
-            rule_text.append(
-                Gradient(
-                    self.characters * (self.side_width // chars_len + 1),
-                    colors=self.right_colors,  # type: ignore
-                    end=" ",
-                )
-            )
-        else:
-            rule_text.append(
-                Text(self.characters * (self.side_width // chars_len + 1), end=" ")
-            )
+        side = self.characters * (self.side_width // chars_len + 1)
+        rule_text = Gradient.concat(
+            [
+                rule_text,
+                self._side_line(side, self.left_colors),
+                " ",
+                self.title_text,
+                " ",
+                self._side_line(side, self.right_colors),
+            ],
+            end=rule_text.end,
+        )
         rule_text.truncate(width)
         return rule_text
 
+    def _side_line(self, characters: str, colors: List[Color]) -> Text:
+        """Color the line on one side of the title, if the rule has gradients.
+
+        Args:
+            characters (str): The characters of the line.
+            colors (List[Color]): The colors of the line's gradient.
+
+        Returns:
+            Text: The line.
+        """
+        if self.gradient:
+            return Gradient(
+                characters, colors=colors, easing=self.easing  # type: ignore
+            )
+        return Text(characters)
+
     def __rich_measure__(
         self, console: Console, options: ConsoleOptions
     ) -> Measurement:
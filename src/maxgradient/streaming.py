@@ -0,0 +1,355 @@
+"""Color text of any length with a gradient as it is read."""
+
+import codecs
+import mmap
+import os
+import sys
+from itertools import chain
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+from rich.color import ColorSystem
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.control import strip_control_codes
+from rich.segment import Segment
+from rich.style import Style, StyleType
+
+from maxgradient._ramp import (
+    interpolate,
+    pack_rgb,
+    periodic_blend,
+    pooled_style,
+    ramp_columns,
+    stops_array,
+)
+from maxgradient.color import Color, ColorType
+from maxgradient.color_list import ColorList
+from maxgradient.easing import Easing, get_easing
+
+DEFAULT_PERIOD = 80
+MAX_CHUNK_SIZE = 8192
+"""Longer chunks are colored in slices, so memory does not grow with them."""
+UNCOLORED = -1
+NEWLINE = -2
+FILE_CHUNK_SIZE = 1 << 20
+ASCII_COMPATIBLE_ENCODINGS = ("ascii", "utf-8", "latin-1", "iso8859-1", "cp1252")
+COLOR_SYSTEMS = {
+    "standard": ColorSystem.STANDARD,
+    "256": ColorSystem.EIGHT_BIT,
+    "truecolor": ColorSystem.TRUECOLOR,
+    "windows": ColorSystem.WINDOWS,
+}
+
+
+class GradientStream:
+    """Color an iterable of strings with a periodic gradient, chunk by chunk.
+
+    The color of each character only depends on its position in the stream, \
+        so every chunk is colored as it arrives and then released. Memory \
+        does not grow with the length of the input, and output starts before \
+        the input has been read to the end.
+
+    Args:
+        chunks (Iterable[str]): The text to color, such as a file or a \
+            generator of lines.
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+            Four random adjacent colors if None.
+        period (int, optional): The number of cells in one cycle of the \
+            gradient. Defaults to 80.
+        length (int, optional): The number of cells to spread a single pass \
+            of the gradient across, instead of repeating it every `period` \
+            cells. Defaults to None.
+        style (StyleType, optional): The base style. Defaults to None.
+        easing (str|EasingFunction, optional): The easing curve of each cycle. \
+            Defaults to None (linear).
+        skip_whitespace (bool, optional): Leave whitespace characters without \
+            a color. Defaults to False.
+        advance_whitespace (bool, optional): Whether skipped whitespace still \
+            advances the gradient. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[str],
+        colors: Optional[Sequence[ColorType]] = None,
+        *,
+        period: int = DEFAULT_PERIOD,
+        length: Optional[int] = None,
+        style: Optional[StyleType] = None,
+        easing: Optional[Easing] = None,
+        skip_whitespace: bool = False,
+        advance_whitespace: bool = True,
+    ) -> None:
+        if period < 1:
+            raise ValueError("Period must be a positive integer.")
+        if length is not None and length < 0:
+            raise ValueError("Length must not be negative.")
+        if not colors:
+            colors = ColorList(4).color_list
+        validated = [
+            color if isinstance(color, Color) else Color(color) for color in colors
+        ]
+        if len(validated) < 2:
+            raise ValueError("Gradient must have at least two colors.")
+        self.chunks = chunks
+        self.colors = validated
+        self.period = period
+        self.length = length
+        if style is None:
+            self.style = Style.null()
+        elif isinstance(style, str):
+            self.style = Style.parse(style)
+        else:
+            self.style = style
+        self.easing = None if easing is None else get_easing(easing)
+        self.skip_whitespace = skip_whitespace
+        self.advance_whitespace = advance_whitespace
+        self._stops = stops_array(validated, cyclic=length is None)
+        self._position = 0
+
+    def __iter__(self) -> Iterator[Segment]:
+        return self.segments()
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        yield from self.segments()
+
+    def feed(self, chunk: str) -> List[Segment]:
+        """Color the next chunk of the stream.
+
+        Args:
+            chunk (str): The text that follows everything fed so far.
+
+        Returns:
+            List[Segment]: One segment per run of characters of the same \
+                color. Newlines get segments of their own, without a style.
+        """
+        text = strip_control_codes(chunk)
+        if not text:
+            return []
+        columns, indexes, cells = ramp_columns(
+            text,
+            skip_whitespace=self.skip_whitespace,
+            advance_whitespace=self.advance_whitespace,
+        )
+        positions = columns + self._position
+        if self.length is None:
+            blend = periodic_blend(positions, self.period)
+        else:
+            blend = positions / max(self.length - 1, 1)
+        self._position += cells
+        if self.easing is not None:
+            blend = self.easing(blend)
+        packed = pack_rgb(interpolate(self._stops, blend)).astype(np.int64)
+        if indexes is None:
+            codes = packed
+        else:
+            codes = np.full(len(text), UNCOLORED, dtype=np.int64)
+            codes[indexes] = packed
+        if "\n" in text:
+            newlines = np.frombuffer(
+                text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+            ) == ord("\n")
+            codes[newlines] = NEWLINE
+
+        starts = np.flatnonzero(np.diff(codes)) + 1
+        bounds = [0, *starts.tolist(), len(text)]
+        base_style = self.style or None
+        segments: List[Segment] = []
+        for start, end, code in zip(bounds, bounds[1:], codes[bounds[:-1]].tolist()):
+            if code == NEWLINE:
+                segments.append(Segment(text[start:end]))
+            elif code == UNCOLORED:
+                segments.append(Segment(text[start:end], base_style))
+            else:
+                segments.append(
+                    Segment(text[start:end], pooled_style(code, self.style))
+                )
+        return segments
+
+    def segments(self) -> Iterator[Segment]:
+        """Color the stream, yielding segments as each chunk is read.
+
+        Yields:
+            Segment: One run of characters of the same color.
+        """
+        self._position = 0
+        for chunk in self.chunks:
+            for start in range(0, len(chunk), MAX_CHUNK_SIZE):
+                yield from self.feed(chunk[start : start + MAX_CHUNK_SIZE])
+
+    def ansi(self, color_system: str = "truecolor") -> Iterator[str]:
+        """Color the stream, yielding a string of ANSI codes per chunk.
+
+        Args:
+            color_system (str, optional): "standard", "256", "truecolor" or \
+                "windows". Defaults to "truecolor".
+
+        Yields:
+            str: The colored text of one chunk.
+        """
+        system = COLOR_SYSTEMS[color_system]
+        self._position = 0
+        for chunk in self.chunks:
+            for start in range(0, len(chunk), MAX_CHUNK_SIZE):
+                yield "".join(
+                    segment.style.render(segment.text, color_system=system)
+                    if segment.style
+                    else segment.text
+                    for segment in self.feed(chunk[start : start + MAX_CHUNK_SIZE])
+                )
+
+    def write(
+        self, file: Optional[IO[str]] = None, color_system: str = "truecolor"
+    ) -> None:
+        """Color the stream into a file, flushing after every chunk.
+
+        Args:
+            file (IO[str], optional): The file to write to. Defaults to \
+                `sys.stdout`.
+            color_system (str, optional): "standard", "256", "truecolor" or \
+                "windows". Defaults to "truecolor".
+        """
+        output = sys.stdout if file is None else file
+        for text in self.ansi(color_system):
+            output.write(text)
+            output.flush()
+
+
+class MappedFile:
+    """The text of a file, decoded incrementally from a memory map.
+
+    Each iteration maps the file again and yields its text one block at a \
+        time, so the text is never held in memory as a whole.
+
+    Args:
+        path (str|os.PathLike): The path of the file.
+        encoding (str, optional): The encoding of the file. Defaults to "utf-8".
+        errors (str, optional): How to handle decoding errors. Defaults to \
+            "replace".
+        chunk_size (int, optional): The number of bytes to decode at a time. \
+            Defaults to 1 MiB.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        encoding: str = "utf-8",
+        errors: str = "replace",
+        chunk_size: int = FILE_CHUNK_SIZE,
+    ) -> None:
+        self.path = path
+        self.encoding = codecs.lookup(encoding).name
+        self.errors = errors
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(self.encoding)(self.errors)
+        for block in self.blocks():
+            text = decoder.decode(block)
+            if text:
+                yield text
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
+    def blocks(self, start: int = 0) -> Iterator[memoryview]:
+        """Read the raw bytes of the file one block at a time.
+
+        Args:
+            start (int, optional): The byte offset to start at. Defaults to 0.
+
+        Yields:
+            memoryview: A view of the next block of the memory map.
+        """
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # Empty files cannot be memory-mapped
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    for offset in range(start, len(mapped), self.chunk_size):
+                        with view[offset : offset + self.chunk_size] as block:
+                            yield block
+
+    def measure(
+        self, *, skip_whitespace: bool = False, advance_whitespace: bool = True
+    ) -> int:
+        """Count the number of cells the text advances a gradient by.
+
+        Blocks of plain ASCII in an ASCII-compatible encoding are counted \
+            straight from their bytes, one cell per printable byte. The rest \
+            of the file is decoded and measured a block at a time.
+
+        Args:
+            skip_whitespace (bool, optional): Whether whitespace is left \
+                uncolored. Defaults to False.
+            advance_whitespace (bool, optional): Whether skipped whitespace \
+                still advances the gradient. Defaults to True.
+
+        Returns:
+            int: The number of cells.
+        """
+        counts_bytes = self.encoding in ASCII_COMPATIBLE_ENCODINGS and (
+            advance_whitespace or not skip_whitespace
+        )
+        cells = 0
+        offset = 0
+        if counts_bytes:
+            for block in self.blocks():
+                data = np.frombuffer(block, dtype=np.uint8)
+                is_ascii = bool(data.max() < 0x80)
+                if is_ascii:
+                    cells += int(np.count_nonzero((data >= 0x20) & (data < 0x7F)))
+                # Release the buffer before the memory map is closed
+                del data
+                if not is_ascii:
+                    break
+                offset += len(block)
+        # Blocks of ASCII end on a character boundary, so decoding can
+        # resume from the first block that is not plain ASCII.
+        decoder = codecs.getincrementaldecoder(self.encoding)(self.errors)
+        texts = (decoder.decode(block) for block in self.blocks(offset))
+        for text in chain(texts, (decoder.decode(b"", final=True),)):
+            _, _, text_cells = ramp_columns(
+                strip_control_codes(text),
+                skip_whitespace=skip_whitespace,
+                advance_whitespace=advance_whitespace,
+            )
+            cells += text_cells
+        return cells
+
+
+def stream(
+    chunks: Iterable[str],
+    colors: Optional[Sequence[ColorType]] = None,
+    *,
+    period: int = DEFAULT_PERIOD,
+    ansi: bool = False,
+    color_system: str = "truecolor",
+    **kwargs,
+) -> Iterator[Union[Segment, str]]:
+    """Color an iterable of strings of any length with a periodic gradient.
+
+    Args:
+        chunks (Iterable[str]): The text to color, such as a file or a \
+            generator of lines.
+        colors (Sequence[ColorType], optional): The colors of the gradient. \
+            Four random adjacent colors if None.
+        period (int, optional): The number of cells in one cycle of the \
+            gradient. Defaults to 80.
+        ansi (bool, optional): Yield strings of ANSI codes, one per chunk, \
+            rather than rich segments. Defaults to False.
+        color_system (str, optional): The color system of ANSI output. \
+            Defaults to "truecolor".
+        **kwargs: Other keyword arguments for `GradientStream`, such as \
+            `style` or `easing`.
+
+    Returns:
+        Iterator[Segment|str]: The colored text.
+    """
+    gradient_stream = GradientStream(chunks, colors, period=period, **kwargs)
+    if ansi:
+        return gradient_stream.ansi(color_system)
+    return gradient_stream.segments()
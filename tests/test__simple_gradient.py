@@ -4,7 +4,7 @@ from maxgradient._simple_gradient import SimpleGradient
 from rich import console
 from rich.style import Style
 from maxgradient.color import Color
-from rich.text import Span
+from rich.text import Span, Text
 from rich.color import ColorType, ColorTriplet
 
 
@@ -41,6 +41,31 @@ class TestSimpleGradient(unittest.TestCase):
         )
         self.assertEqual(gradient.style, Style())
 
+    def test_skip_whitespace(self):
+        gradient = SimpleGradient(
+            "Hello World", color1="red", color2="blue", skip_whitespace=True
+        )
+        self.assertEqual(len(gradient.spans), 10)
+        self.assertNotIn(5, [span.start for span in gradient.spans])
+
+    def test_measure_matches_text(self):
+        sample = "Hello World\nThis is a much longer line of text\n  indented"
+        gradient = SimpleGradient(sample, color1="red", color2="blue")
+        options = self.console.options
+        self.assertEqual(
+            gradient.__rich_measure__(self.console, options),
+            Text(sample).__rich_measure__(self.console, options),
+        )
+
+    def test_measure_is_cached_until_text_changes(self):
+        gradient = SimpleGradient("Hello World", color1="red", color2="blue")
+        options = self.console.options
+        first = gradient.__rich_measure__(self.console, options)
+        self.assertIs(gradient.__rich_measure__(self.console, options), first)
+        gradient.append(" and everyone else")
+        measurement = gradient.__rich_measure__(self.console, options)
+        self.assertEqual(measurement.maximum, 29)
+
 
 if __name__ == "__main__":
     unittest.main()
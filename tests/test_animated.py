@@ -0,0 +1,118 @@
+import io
+import unittest
+
+import numpy as np
+from rich.console import Console
+from rich.segment import Segment
+from rich.text import Text
+
+from maxgradient.animated import AnimatedGradient
+
+COLORS = ["red", "blue", "green"]
+
+
+class FrameClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAnimatedGradient(unittest.TestCase):
+    def setUp(self):
+        self.console = Console(file=io.StringIO(), width=80, color_system="truecolor")
+
+    def test_shift_frames_are_views_of_one_ramp(self):
+        animation = AnimatedGradient("x" * 40, COLORS, frames=40)
+        first, second = animation.frame_ids(0), animation.frame_ids(1)
+        self.assertTrue(np.shares_memory(first, second))
+        np.testing.assert_array_equal(first[1:], second[:-1])
+
+    def test_shift_cycle_repeats(self):
+        animation = AnimatedGradient("Hello World", COLORS, frames=11)
+        np.testing.assert_array_equal(animation.frame_ids(0), animation.frame_ids(11))
+
+    def test_short_period_repeats_along_text(self):
+        animation = AnimatedGradient("x" * 30, COLORS, period=10, frames=5)
+        ids = animation.frame_ids(3)
+        np.testing.assert_array_equal(ids[:10], ids[10:20])
+
+    def test_hue_and_pulse_keep_palette_indexes(self):
+        for effect in ("hue", "pulse"):
+            animation = AnimatedGradient("Hello World", COLORS, effect=effect)
+            np.testing.assert_array_equal(animation.frame_ids(0), animation.frame_ids(7))
+            self.assertNotEqual(animation.frame_styles(0), animation.frame_styles(15))
+
+    def test_pulse_dims_colors(self):
+        animation = AnimatedGradient("ab", ["#ff0000", "#ff0000"], effect="pulse", frames=4)
+        dimmed = animation.frame_styles(2)[0].color.triplet
+        self.assertEqual(tuple(dimmed), (128, 0, 0))
+
+    def test_frame_follows_clock(self):
+        clock = FrameClock()
+        animation = AnimatedGradient("Hello", COLORS, frames=10, duration=1.0, clock=clock)
+        clock.now = 0.35
+        self.assertEqual(animation.current_frame(), 3)
+        clock.now = 1.05
+        self.assertEqual(animation.current_frame(), 0)
+
+    def test_rendered_frames_are_cached(self):
+        animation = AnimatedGradient("Hello\nWorld", COLORS)
+        options = self.console.options
+        segments = animation.render_frame(3, self.console, options)
+        self.assertIs(animation.render_frame(3, self.console, options), segments)
+        self.assertEqual("".join(segment.text for segment in segments), "Hello\nWorld\n")
+
+    def test_fast_path_matches_text_render(self):
+        animation = AnimatedGradient("Hello there\nWorld", COLORS, effect="hue")
+        fast = animation.frame_segments(5)
+        text = animation.frame(5)
+        expected = list(text.render(self.console, end="\n"))
+        self.assertEqual(
+            [(segment.text, segment.style) for segment in Segment_split(fast)],
+            [(segment.text, segment.style) for segment in Segment_split(expected)],
+        )
+
+    def test_wraps_when_too_wide(self):
+        console = Console(file=io.StringIO(), width=10, record=True)
+        console.print(AnimatedGradient("The quick brown fox", COLORS))
+        self.assertEqual(console.export_text(), "The quick \nbrown fox\n")
+
+    def test_empty_text(self):
+        animation = AnimatedGradient("", COLORS)
+        self.assertEqual(animation.frame_segments(0), [Segment("\n")])
+        self.assertEqual(animation.frame(3).plain, "")
+        self.console.print(animation)
+        self.assertEqual(self.console.file.getvalue(), "\n")
+
+    def test_live(self):
+        animation = AnimatedGradient("Loading", COLORS)
+        with animation.live(console=self.console, auto_refresh=False) as live:
+            live.refresh()
+        output = Text.from_ansi(self.console.file.getvalue()).plain
+        self.assertIn("Loading", output)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            AnimatedGradient("Hello", COLORS, effect="spin")
+        with self.assertRaises(ValueError):
+            AnimatedGradient("Hello", COLORS, frames=0)
+        with self.assertRaises(ValueError):
+            AnimatedGradient("Hello", COLORS, depth=2.0)
+
+
+def Segment_split(segments):
+    """Split segments into one segment per visible character, for comparison."""
+    from rich.segment import Segment
+
+    return [
+        Segment(character, segment.style)
+        for segment in segments
+        for character in segment.text
+        if character != "\n"
+    ]
+
+
+if __name__ == "__main__":
+    unittest.main()
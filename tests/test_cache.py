@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import maxgradient.cache as cache_module
+from maxgradient.cache import (
+    SpanCache,
+    SpanTable,
+    decode,
+    disable_cache,
+    enable_cache,
+    encode,
+    get_cache,
+)
+from maxgradient.easing import steps
+from maxgradient.gradient import Gradient
+
+COLORS = ["red", "blue", "green"]
+
+
+class TestSpanCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(disable_cache)
+        self.directory = directory.name
+        self.cache = enable_cache(self.directory)
+
+    def entries(self):
+        return [name for name in os.listdir(self.directory) if name.endswith(".spans")]
+
+    def test_encode_round_trip(self):
+        table = SpanTable(
+            np.array([0xFF0000, 0x0000FF], dtype=np.uint32),
+            np.array([0, 1, 1, 0]),
+            np.array([0, 2, 3, 5]),
+        )
+        decoded = decode(encode(table))
+        np.testing.assert_array_equal(decoded.palette, table.palette)
+        np.testing.assert_array_equal(decoded.style_ids, table.style_ids)
+        np.testing.assert_array_equal(decoded.indexes, table.indexes)
+
+    def test_decode_rejects_truncated_data(self):
+        table = SpanTable(np.array([1, 2], dtype=np.uint32), np.array([0, 1]), None)
+        self.assertIsNone(decode(encode(table)[:-1]))
+        self.assertIsNone(decode(b"not a cache entry"))
+
+    def test_gradient_spans_are_stored_and_loaded(self):
+        text = "Hello World, from the disk cache"
+        expected = Gradient(text, colors=COLORS, skip_whitespace=True).spans
+        self.assertEqual(len(self.entries()), 1)
+        with mock.patch.object(Gradient, "span_table") as span_table:
+            loaded = Gradient(text, colors=COLORS, skip_whitespace=True).spans
+        span_table.assert_not_called()
+        self.assertEqual(loaded, expected)
+
+    def test_options_change_the_key(self):
+        Gradient("Hello World", colors=COLORS)
+        Gradient("Hello World", colors=COLORS, style="bold")
+        Gradient("Hello World", colors=COLORS, mode="radial")
+        Gradient("Hello World", colors=COLORS, easing="ease-in")
+        self.assertEqual(len(self.entries()), 4)
+
+    def test_custom_easing_is_not_cached(self):
+        Gradient("Hello World", colors=COLORS, easing=steps(3))
+        self.assertEqual(self.entries(), [])
+
+    def test_corrupt_entry_is_removed(self):
+        gradient = Gradient("Hello World", colors=COLORS)
+        (name,) = self.entries()
+        with open(os.path.join(self.directory, name), "wb") as file:
+            file.write(b"corrupt")
+        self.assertEqual(Gradient("Hello World", colors=COLORS).spans, gradient.spans)
+        self.assertEqual(len(self.entries()), 1)
+        self.assertIsNotNone(decode(open(os.path.join(self.directory, name), "rb").read()))
+
+    def test_eviction_keeps_the_cache_within_its_size(self):
+        self.cache.max_size = 1024
+        for index in range(20):
+            Gradient(f"Banner number {index} " * 4, colors=COLORS)
+        sizes = [
+            os.path.getsize(os.path.join(self.directory, name))
+            for name in self.entries()
+        ]
+        self.assertLessEqual(sum(sizes), 1024)
+        self.assertGreater(len(sizes), 0)
+
+    def test_stores_scan_only_when_the_cache_may_be_full(self):
+        with mock.patch.object(
+            SpanCache, "evict", autospec=True, side_effect=SpanCache.evict
+        ) as evict:
+            for index in range(10):
+                Gradient(f"Banner number {index}", colors=COLORS)
+            # The first store measures the cache, and the rest fit within it
+            self.assertEqual(evict.call_count, 1)
+            for index in range(cache_module.EVICT_INTERVAL):
+                Gradient(f"Another banner {index}", colors=COLORS)
+            self.assertEqual(evict.call_count, 2)
+        self.assertEqual(len(self.entries()), 10 + cache_module.EVICT_INTERVAL)
+
+    def test_disabled_cache_is_not_used(self):
+        disable_cache()
+        Gradient("Hello World", colors=COLORS)
+        self.assertEqual(self.entries(), [])
+
+    def test_environment_enables_cache(self):
+        environment = {"MAXGRADIENT_CACHE": "1", "MAXGRADIENT_CACHE_DIR": self.directory}
+        with mock.patch.dict(os.environ, environment):
+            with mock.patch.object(cache_module, "_checked_environment", False):
+                cache = get_cache()
+        self.assertIsInstance(cache, SpanCache)
+        self.assertEqual(str(cache.directory), self.directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from random import Random
+
+from maxgradient.color_list import ColorList
+
+
+class TestColorList(unittest.TestCase):
+    def test_seed_is_reproducible(self):
+        self.assertEqual(ColorList(4, seed=3)(), ColorList(4, seed=3)())
+
+    def test_rng_is_drawn_from(self):
+        rng = Random(5)
+        expected = Random(5)
+        for _ in range(3):
+            index = expected.randrange(len(ColorList.COLORS))
+            self.assertEqual(ColorList(4, rng=rng).start_index, index)
+
+    def test_offset(self):
+        colors = ColorList(3, offset=len(ColorList.COLORS) + 2)()
+        self.assertEqual([color.hex for color in colors], list(ColorList.COLORS[2:5]))
+
+    def test_offset_wraps_around(self):
+        colors = ColorList(3, offset=15)()
+        self.assertEqual(
+            [color.hex for color in colors],
+            [ColorList.COLORS[15], ColorList.COLORS[0], ColorList.COLORS[1]],
+        )
+
+    def test_random_start_is_a_color(self):
+        for _ in range(100):
+            self.assertLess(ColorList().start_index, len(ColorList.COLORS))
+
+    def test_only_one_source(self):
+        with self.assertRaises(ValueError):
+            ColorList(seed=1, offset=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import io
+import unittest
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
+
+from maxgradient.filter import GradientFilter
+
+COLORS = ["#ff0000", "#0000ff"]
+
+
+class TestGradientFilter(unittest.TestCase):
+    def setUp(self):
+        self.console = Console(
+            file=io.StringIO(), width=20, color_system="truecolor", record=True
+        )
+
+    def render(self, renderable):
+        self.console.print(renderable)
+        return self.console.export_text()
+
+    def test_text_is_unchanged(self):
+        panel = Panel("Hello", expand=False)
+        self.assertEqual(self.render(GradientFilter(panel, COLORS)), self.render(panel))
+
+    def test_colors_span_the_widest_line(self):
+        lines = self.console.render_lines(
+            GradientFilter(Text("abcde"), COLORS), pad=False
+        )
+        styles = [segment.style for segment in lines[0]]
+        self.assertEqual(len(styles), 5)
+        self.assertEqual(styles[0].color.triplet, (255, 0, 0))
+        self.assertEqual(styles[-1].color.triplet, (0, 0, 255))
+
+    def test_background_and_attributes_are_kept(self):
+        text = Text("ab", style=Style(bgcolor="green", bold=True, color="yellow"))
+        lines = self.console.render_lines(GradientFilter(text, COLORS), pad=False)
+        for segment in lines[0]:
+            self.assertEqual(segment.style.bgcolor.name, "green")
+            self.assertTrue(segment.style.bold)
+            self.assertNotEqual(segment.style.color.name, "yellow")
+
+    def test_whitespace_is_skipped(self):
+        lines = self.console.render_lines(
+            GradientFilter(Text("a b", style="bold"), COLORS), pad=False
+        )
+        self.assertEqual(lines[0][1].text, " ")
+        self.assertEqual(lines[0][1].style, Style(bold=True))
+
+    def test_vertical_mode_joins_runs(self):
+        lines = self.console.render_lines(
+            GradientFilter(Text("ab cd\nef gh"), COLORS, mode="vertical"),
+            pad=False,
+        )
+        self.assertEqual([len(line) for line in lines], [3, 3])
+        self.assertNotEqual(lines[0][0].style, lines[-1][0].style)
+
+    def test_measure_delegates_to_child(self):
+        panel = Panel("Hello", expand=False)
+        self.assertEqual(
+            self.console.measure(GradientFilter(panel, COLORS)),
+            self.console.measure(panel),
+        )
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            GradientFilter("Hello", COLORS, mode="spiral")
+        with self.assertRaises(ValueError):
+            GradientFilter("Hello", ["red"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,583 @@
+import unittest
+from unittest import mock
+from random import Random
+
+import numpy as np
+
+from rich.console import Console
+from rich.highlighter import ReprHighlighter
+from rich.style import Style
+from rich.text import Span, Text
+
+from maxgradient._spans import SpanArray, overlay_spans
+from maxgradient.color import Color
+from maxgradient.easing import get_easing, steps
+from maxgradient.gradient import Gradient, gradient_many
+from maxgradient.ramp import GradientRamp, RampCache
+from maxgradient.rule import GradientRule
+
+COLORS = ["red", "blue", "green"]
+
+
+class TestGradient(unittest.TestCase):
+    def setUp(self):
+        self.console = Console()
+
+    def test_periodic_colors_repeat(self):
+        gradient = Gradient("x" * 30, colors=["red", "blue"], period=10)
+        styles = [span.style for span in gradient.spans]
+        self.assertEqual(styles[:10], styles[10:20])
+        self.assertEqual(styles[:10], styles[20:])
+
+    def test_periodic_append_matches_full_gradient(self):
+        gradient = Gradient("Hello", colors=["red", "blue", "green"], period=8)
+        gradient.append(" World")
+        full = Gradient("Hello World", colors=["red", "blue", "green"], period=8)
+        self.assertEqual(gradient.plain, full.plain)
+        self.assertEqual(gradient.spans, full.spans)
+
+    def test_periodic_append_keeps_style(self):
+        gradient = Gradient("", colors=["red", "blue"], period=4)
+        gradient.append("abc", style="bold")
+        self.assertEqual(len(gradient.spans), 4)
+        self.assertEqual(gradient.spans[-1].style, "bold")
+
+    def test_periodic_append_parses_string_style(self):
+        gradient = Gradient("ab", colors=["red", "blue"], period=4)
+        gradient.style = "italic"
+        gradient.append("cd")
+        self.assertTrue(gradient.spans[-1].style.italic)
+
+    def test_skip_whitespace_leaves_spaces_uncolored(self):
+        gradient = Gradient(
+            "a b\tc\nd", colors=["red", "blue", "green"], skip_whitespace=True
+        )
+        self.assertEqual([span.start for span in gradient.spans], [0, 2, 4, 6])
+
+    def test_skip_whitespace_advance(self):
+        text = "ab  cd"
+        colors = ["red", "blue", "green"]
+        advancing = Gradient(text, colors=colors, skip_whitespace=True)
+        compact = Gradient(
+            text, colors=colors, skip_whitespace=True, advance_whitespace=False
+        )
+        self.assertEqual(advancing.spans[-1].style, compact.spans[-1].style)
+        self.assertNotEqual(advancing.spans[1].style, compact.spans[1].style)
+
+    def test_periodic_skip_whitespace_append(self):
+        gradient = Gradient(
+            "ab ",
+            colors=["red", "blue"],
+            period=6,
+            skip_whitespace=True,
+            advance_whitespace=False,
+        )
+        gradient.append("cd")
+        full = Gradient(
+            "ab cd",
+            colors=["red", "blue"],
+            period=6,
+            skip_whitespace=True,
+            advance_whitespace=False,
+        )
+        self.assertEqual(gradient.spans, full.spans)
+
+    def test_stepped_easing(self):
+        gradient = Gradient("x" * 40, colors=["red", "blue"], easing=steps(4))
+        self.assertEqual(len({span.style for span in gradient.spans}), 4)
+
+    def test_named_easing_keeps_endpoints(self):
+        colors = ["red", "blue", "green"]
+        linear = Gradient("x" * 20, colors=colors, easing="linear")
+        eased = Gradient("x" * 20, colors=colors, easing="ease-in-out-sine")
+        self.assertEqual(linear.spans[0], eased.spans[0])
+        self.assertEqual(linear.spans[-1], eased.spans[-1])
+        self.assertNotEqual(linear.spans[5], eased.spans[5])
+
+    def test_unknown_easing(self):
+        with self.assertRaises(ValueError):
+            get_easing("bounce")
+
+    def test_rule_easing(self):
+        console = Console(width=40, record=True)
+        console.print(GradientRule("Title", easing="ease-out"))
+        self.assertIn("Title", console.export_text())
+
+    def test_styles_are_shared_between_gradients(self):
+        colors = ["red", "blue", "green"]
+        first = Gradient("Hello World", colors=colors, easing="linear")
+        second = Gradient("Hello World", colors=colors, easing="linear")
+        for first_span, second_span in zip(first.spans, second.spans):
+            self.assertIs(first_span.style, second_span.style)
+
+    def test_compile_is_cached(self):
+        colors = ["red", "blue", "green"]
+        ramp = Gradient.compile(colors, 11, style="bold")
+        self.assertIs(Gradient.compile(colors, 11, style="bold"), ramp)
+        self.assertIs(ramp.resample(20).resample(11), ramp)
+
+    def test_ramp_style_ids_are_compact(self):
+        ramp = Gradient.compile(["red", "blue", "green"], 200)
+        self.assertEqual(ramp.style_ids.dtype, np.uint8)
+        self.assertFalse(ramp.style_ids.flags.writeable)
+        self.assertEqual(ramp.nbytes, ramp.palette.nbytes + 200)
+
+    def test_ramp_cache_is_bounded_by_size(self):
+        ramps = [GradientRamp((0xFF0000, 0x0000FF), 100 + index) for index in range(3)]
+        cache = RampCache(max_size=ramps[1].nbytes + ramps[2].nbytes)
+        for ramp in ramps:
+            cache.put(ramp)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(ramps[0].key))
+        self.assertIs(cache.get(ramps[1].key), ramps[1])
+        cache.put(ramps[0])
+        # The ramp used least recently is dropped first
+        self.assertIsNone(cache.get(ramps[2].key))
+        self.assertIs(cache.get(ramps[1].key), ramps[1])
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_ramp_apply_matches_gradient(self):
+        colors = ["red", "blue", "green"]
+        ramp = Gradient.compile(colors, 11)
+        self.assertEqual(
+            ramp.apply("Hello World").spans,
+            Gradient("Hello World", colors=colors).spans,
+        )
+
+    def test_ramp_apply_requires_matching_length(self):
+        ramp = Gradient.compile(["red", "blue"], 5)
+        with self.assertRaises(ValueError):
+            ramp.apply("Hello World")
+
+    def test_wide_characters_use_cell_positions(self):
+        colors = ["red", "blue", "green"]
+        wide = Gradient("中文ab", colors=colors)
+        narrow = Gradient("xxxxab", colors=colors)
+        self.assertEqual(wide.spans[1].style, narrow.spans[2].style)
+        self.assertEqual(wide.spans[2].style, narrow.spans[4].style)
+        self.assertEqual(wide.spans[3].style, narrow.spans[5].style)
+
+    def test_vertical_mode_colors_rows(self):
+        gradient = Gradient("aaa\nbbb\nccc", colors=["red", "blue"], mode="vertical")
+        styles = [span.style for span in gradient.spans]
+        self.assertEqual(len(set(styles[0:3])), 1)
+        self.assertEqual(len(set(styles[8:11])), 1)
+        self.assertNotEqual(styles[0], styles[8])
+
+    def test_diagonal_mode_at_zero_degrees_aligns_columns(self):
+        gradient = Gradient(
+            "abcd\nefgh", colors=["red", "blue"], mode="diagonal", angle=0
+        )
+        styles = [span.style for span in gradient.spans]
+        self.assertEqual(styles[0:4], styles[5:9])
+
+    def test_radial_mode_is_symmetric(self):
+        gradient = Gradient("abcde", colors=["red", "blue"], mode="radial")
+        styles = [span.style for span in gradient.spans]
+        self.assertEqual(styles[0], styles[4])
+        self.assertEqual(styles[1], styles[3])
+        self.assertNotEqual(styles[0], styles[2])
+
+    def test_empty_text_in_every_mode(self):
+        for mode in ("vertical", "diagonal", "radial"):
+            gradient = Gradient("", colors=["red", "blue"], mode=mode)
+            self.assertEqual((gradient.plain, gradient.spans), ("", []))
+            self.console.print(gradient)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            Gradient("Hello", colors=["red", "blue"], mode="spiral")
+
+    def test_wrapped_lines_are_cached_per_width(self):
+        gradient = Gradient("The quick brown fox " * 5, colors=["red", "blue"])
+        options = dict(justify="left", overflow="fold", tab_size=8, no_wrap=False)
+        with mock.patch.object(
+            Gradient, "wrap", autospec=True, side_effect=Gradient.wrap
+        ) as wrap:
+            narrow = gradient.wrap_joined(self.console, 20, **options)
+            again = gradient.wrap_joined(self.console, 20, **options)
+            self.assertEqual(wrap.call_count, 1)
+            gradient.wrap_joined(self.console, 40, **options)
+            self.assertEqual(wrap.call_count, 2)
+            gradient.stylize("bold", 0, 3)
+            gradient.wrap_joined(self.console, 20, **options)
+            self.assertEqual(wrap.call_count, 3)
+        self.assertEqual((again.plain, again.spans), (narrow.plain, narrow.spans))
+
+    def test_wrapped_lines_are_cached_as_a_span_array(self):
+        gradient = Gradient("The quick brown fox " * 5, colors=["red", "blue"])
+        options = dict(justify="left", overflow="fold", tab_size=8, no_wrap=False)
+        joined = gradient.wrap_joined(self.console, 20, **options)
+        list(joined.render(self.console))
+        (cached,) = gradient._wrap_cache.values()
+        self.assertIsInstance(cached.stored_spans(), SpanArray)
+        expected = Text("\n").join(gradient.wrap(self.console, 20, **options))
+        self.assertEqual((joined.plain, joined.spans), (expected.plain, expected.spans))
+
+    def test_cached_render_matches_text(self):
+        gradient = Gradient("The quick brown fox " * 5, colors=["red", "blue"])
+        console = Console(width=30, record=True, color_system="truecolor")
+        console.print(gradient)
+        console.print(gradient)
+        console.print(gradient.as_text())
+        lines = console.export_text(styles=True).splitlines()
+        self.assertEqual(lines[0:4], lines[4:8])
+        self.assertEqual(lines[0:4], lines[8:12])
+
+    def test_invalid_period(self):
+        with self.assertRaises(ValueError):
+            Gradient("Hello", colors=["red", "blue"], period=0)
+
+    def test_text_is_stored_once(self):
+        gradient = Gradient("Hello\x07 World", colors=["red", "blue"])
+        self.assertEqual(gradient._text, ["Hello World"])
+        self.assertEqual(gradient.text, "Hello World")
+        self.assertEqual(len(gradient), 11)
+
+    def test_validated_colors_are_reused(self):
+        colors = [Color("red"), Color("blue")]
+        gradient = Gradient("Hello", colors=colors)
+        self.assertIs(gradient.colors[0], colors[0])
+        self.assertIs(gradient.colors[1], colors[1])
+
+    def test_adjacent_spans_share_boundaries(self):
+        spans = Gradient("x" * 1000, colors=["red", "blue"]).spans
+        self.assertEqual([(span.start, span.end) for span in spans[:2]], [(0, 1), (1, 2)])
+        self.assertIs(spans[400].end, spans[401].start)
+
+    def test_gradient_many_matches_gradients(self):
+        texts = ["Hello World", "ab", "Hello there", "a b c"]
+        gradients = gradient_many(texts, colors=COLORS, skip_whitespace=True)
+        self.assertEqual([gradient.plain for gradient in gradients], texts)
+        for text, gradient in zip(texts, gradients):
+            expected = Gradient(text, colors=COLORS, skip_whitespace=True)
+            self.assertEqual(gradient.spans, expected.spans)
+
+    def test_gradient_many_shares_ramps(self):
+        first, second = gradient_many(["abc", "xyz"], colors=COLORS, style="bold")
+        self.assertIs(first.spans[1].style, second.spans[1].style)
+        self.assertIs(first.ramp(3), second.ramp(3))
+
+    def test_gradient_many_from_ramp(self):
+        ramp = Gradient.compile(COLORS, 5, easing="ease-in")
+        gradients = gradient_many(["abcde", "abcdefgh"], colors=ramp)
+        self.assertEqual(gradients[0].spans, ramp.apply("abcde").spans)
+        self.assertEqual(gradients[1].easing, ramp.easing)
+
+    def test_gradient_many_empty(self):
+        self.assertEqual(gradient_many([], colors=COLORS), [])
+
+    def test_sine_rainbow_matches_lolcat(self):
+        gradient = Gradient("ab", rainbow="sine", phase=0.0)
+        first = gradient.spans[0].style.color.triplet
+        self.assertEqual(tuple(first), (128, 237, 18))
+
+    def test_hue_rainbow_starts_red(self):
+        gradient = Gradient("abc", rainbow="hue", phase=0.0)
+        self.assertEqual(tuple(gradient.spans[0].style.color.triplet), (255, 0, 0))
+
+    def test_rainbow_line_offset_shifts_lines(self):
+        gradient = Gradient("abc\nabc", rainbow="sine", spread=1.0, line_offset=1.0)
+        styles = [span.style for span in gradient.spans]
+        self.assertEqual(styles[1], styles[4])
+        flat = Gradient("abc\nabc", rainbow="sine", spread=1.0, line_offset=0.0)
+        flat_styles = [span.style for span in flat.spans]
+        self.assertEqual(flat_styles[0:3], flat_styles[4:7])
+
+    def test_rainbow_phase_shifts_colors(self):
+        shifted = Gradient("abcd", rainbow="sine", spread=1.0, phase=1.0)
+        plain = Gradient("abcd", rainbow="sine", spread=1.0, phase=0.0)
+        self.assertEqual(shifted.spans[0].style, plain.spans[1].style)
+
+    def test_rainbow_seed_picks_the_phase(self):
+        first = Gradient("abcd", rainbow="sine", seed=7)
+        second = Gradient("abcd", rainbow="sine", seed=7)
+        self.assertEqual(first.spans, second.spans)
+        phases = {
+            Gradient("abcd", rainbow="sine").spans[0].style for _ in range(8)
+        }
+        self.assertGreater(len(phases), 1)
+
+    def test_rainbow_skip_whitespace(self):
+        gradient = Gradient("a b", rainbow="hue", skip_whitespace=True)
+        self.assertEqual([span.start for span in gradient.spans], [0, 2])
+
+    def test_empty_rainbow(self):
+        for rainbow in ("sine", "hue"):
+            gradient = Gradient("", rainbow=rainbow)
+            self.assertEqual((gradient.plain, gradient.spans), ("", []))
+            self.console.print(gradient)
+
+    def test_string_style_is_parsed_for_every_mode(self):
+        for options in ({"rainbow": "sine"}, {"mode": "radial"}):
+            gradient = Gradient("Hello\nWorld", colors=["red", "blue"], **options)
+            gradient.style = "bold"
+            _, styles = gradient.span_table()
+            self.assertTrue(all(style.bold for style in styles))
+
+    def test_invalid_rainbow(self):
+        with self.assertRaises(ValueError):
+            Gradient("Hello", rainbow="spiral")
+        with self.assertRaises(ValueError):
+            Gradient("Hello", rainbow="sine", period=4)
+        with self.assertRaises(ValueError):
+            Gradient("Hello", rainbow="sine", spread=0)
+
+    def test_markup_is_kept(self):
+        text = Text.from_markup("ab[bold]cd[/bold][link=https://example.com]ef[/]")
+        gradient = Gradient(text, colors=COLORS)
+        plain = Gradient("abcdef", colors=COLORS)
+        self.assertEqual(len(gradient.spans), 6)
+        for index, (span, expected) in enumerate(zip(gradient.spans, plain.spans)):
+            self.assertEqual((span.start, span.end), (expected.start, expected.end))
+            self.assertEqual(span.style.color, expected.style.color)
+            self.assertEqual(bool(span.style.bold), index in (2, 3))
+        self.assertEqual(gradient.spans[4].style.link, "https://example.com")
+
+    def test_gradient_color_overrides_markup(self):
+        text = Text.from_markup("a[bold #00ff00 on red]b[/]c")
+        gradient = Gradient(text, colors=COLORS)
+        plain = Gradient("abc", colors=COLORS)
+        style = gradient.spans[1].style
+        self.assertEqual(style.color, plain.spans[1].style.color)
+        self.assertTrue(style.bold)
+        self.assertEqual(style.bgcolor.name, "red")
+
+    def test_gradient_recolors_gradient(self):
+        colors = ["white", "black"]
+        recolored = Gradient(Gradient("Hello", colors=COLORS), colors=colors)
+        expected = Gradient("Hello", colors=colors)
+        self.assertEqual(
+            [span.style.color for span in recolored.spans],
+            [span.style.color for span in expected.spans],
+        )
+
+    def test_text_style_and_predefined_spans_are_kept(self):
+        text = Text("abcd", style="italic")
+        gradient = Gradient(text, colors=COLORS, spans=[Span(1, 3, "underline")])
+        self.assertTrue(all(span.style.italic for span in gradient.spans))
+        self.assertEqual(
+            [bool(span.style.underline) for span in gradient.spans],
+            [False, True, True, False],
+        )
+
+    def test_overlay_splits_runs_at_boundaries(self):
+        red, blue = Style(color="red"), Style(color="blue")
+        spans = [Span(0, 4, red), Span(6, 8, blue)]
+        merged = overlay_spans(spans, [Span(2, 7, "bold"), Span(3, 5, "italic")])
+        self.assertEqual(
+            [(span.start, span.end) for span in merged],
+            [(0, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8)],
+        )
+        self.assertIs(merged[0].style, red)
+        self.assertEqual(merged[2].style, Style(bold=True, italic=True) + red)
+        self.assertEqual(merged[4].style, Style(bold=True))
+        self.assertIs(merged[6].style, blue)
+
+    def test_overlay_keeps_theme_styles(self):
+        spans = [Span(0, 1, Style(color="red"))]
+        merged = overlay_spans(spans, [Span(0, 1, "repr.number")])
+        self.assertEqual(merged, [Span(0, 1, "repr.number"), spans[0]])
+        colored = Span(0, 1, Style(color="blue", bold=True))
+        merged = overlay_spans(spans, [Span(0, 1, "repr.number"), colored])
+        self.assertEqual(merged[0], Span(0, 1, "repr.number"))
+        self.assertEqual(merged[1].style, Style(color="red", bold=True))
+
+    def test_overlay_layers_theme_styles_like_text(self):
+        console = Console(color_system="truecolor")
+        text = Text.from_markup("[italic]abc 1234 def[/]")
+        ReprHighlighter().highlight(text)
+        self.assertEqual(text.spans[-1].style, "repr.number")
+        gradient = [
+            Span(index, index + 1, Style(color=color))
+            for index, color in enumerate(["red", "blue"] * 6)
+        ]
+        merged = Text(text.plain, spans=overlay_spans(gradient, text.spans))
+        expected = Text(text.plain, spans=[*text.spans, *gradient])
+        self.assertEqual(list(merged.render(console)), list(expected.render(console)))
+
+    def test_seeded_random_colors(self):
+        first = Gradient("Hello World", rng=11)
+        second = Gradient("Hello World", rng=11)
+        self.assertEqual(first.colors, second.colors)
+        self.assertEqual(first.spans, second.spans)
+        self.assertEqual(
+            Gradient("Hello", rng=Random(11)).colors, Gradient("Hello", rng=11).colors
+        )
+
+    def test_color_offset(self):
+        gradient = Gradient("Hello", color_offset=4)
+        self.assertEqual([color.hex for color in gradient.colors][0], "#005fff")
+
+    def test_seeded_rule(self):
+        first = GradientRule("Title", rng=2)
+        second = GradientRule("Title", rng=2)
+        self.assertEqual(first.left_colors, second.left_colors)
+        self.assertEqual(first.right_colors, second.right_colors)
+
+    def assertSameLines(self, lines, expected):
+        self.assertEqual(
+            [(line.plain, line.spans) for line in lines],
+            [(line.plain, line.spans) for line in expected],
+        )
+
+    def test_divide_matches_text(self):
+        gradient = Gradient("The quick brown fox", colors=COLORS, skip_whitespace=True)
+        text = gradient.as_text()
+        for offsets in ([], [4], [3, 4, 10], [0, 19], [5, 5, 12]):
+            self.assertSameLines(gradient.divide(offsets), text.divide(offsets))
+
+    def test_slice_matches_text(self):
+        gradient = Gradient("The quick brown fox", colors=COLORS, skip_whitespace=True)
+        text = gradient.as_text()
+        for start, end in ((0, 5), (3, 4), (4, 19), (7, 7)):
+            sliced = gradient[start:end]
+            expected = text[start:end]
+            self.assertEqual(
+                (sliced.plain, sliced.spans), (expected.plain, expected.spans)
+            )
+
+    def test_wrap_matches_text(self):
+        gradient = Gradient(
+            "The quick brown fox\njumps over\n\nthe extraordinarily lazy dog",
+            colors=COLORS,
+        )
+        text = gradient.as_text()
+        for justify in ("default", "full", "right"):
+            for overflow in ("fold", "ellipsis"):
+                self.assertSameLines(
+                    gradient.wrap(self.console, 7, justify=justify, overflow=overflow),
+                    text.wrap(self.console, 7, justify=justify, overflow=overflow),
+                )
+
+    def test_overlapping_spans_are_not_indexed(self):
+        gradient = Gradient("Hello World", colors=COLORS)
+        self.assertIsNotNone(gradient.indexed_spans())
+        gradient.stylize("bold", 2, 8)
+        self.assertIsNone(gradient.indexed_spans())
+        self.assertSameLines(gradient.divide([4]), gradient.as_text().divide([4]))
+
+    def test_span_array_clips_ranges(self):
+        spans = Gradient("Hello World", colors=COLORS).spans
+        array = SpanArray.from_spans(spans)
+        self.assertEqual(array.clip(0, 5), spans[:5])
+        self.assertEqual(
+            [(span.start, span.end) for span in array.clip(3, 6)],
+            [(0, 1), (1, 2), (2, 3)],
+        )
+
+    def test_span_array_crops_long_spans(self):
+        style = Style(bold=True)
+        array = SpanArray.from_spans([Span(0, 10, style), Span(12, 20, style)])
+        self.assertEqual(array.clip(4, 14), [Span(0, 6, style), Span(8, 10, style)])
+        self.assertEqual(array.clip(5, 6), [Span(0, 1, style)])
+        self.assertEqual(array.clip(10, 12), [])
+        self.assertTrue(array.is_disjoint())
+        overlapping = SpanArray.from_spans([Span(0, 4, style), Span(2, 6, style)])
+        self.assertFalse(overlapping.is_disjoint())
+
+    def test_spans_are_stored_as_arrays(self):
+        gradient = Gradient("Hello World", colors=COLORS)
+        stored = gradient.stored_spans()
+        self.assertIsInstance(stored, SpanArray)
+        self.assertEqual(stored.starts.dtype, np.int32)
+        self.assertEqual(stored.style_ids.dtype, np.uint8)
+        self.assertEqual(len(gradient.wrap(self.console, 5)), 2)
+        self.assertIs(gradient.stored_spans(), stored)
+        spans = gradient.spans
+        self.assertEqual(spans, stored.to_spans())
+        self.assertIs(gradient.stored_spans(), spans)
+
+    def test_span_list_can_be_edited(self):
+        gradient = Gradient("Hello World", colors=COLORS)
+        gradient.stylize("bold", 0, 5)
+        self.assertEqual(len(gradient.spans), 12)
+        self.assertEqual(gradient.spans[-1], Span(0, 5, "bold"))
+        gradient.spans = []
+        self.assertEqual(gradient.spans, [])
+
+    def test_span_array_is_a_sequence(self):
+        spans = Gradient("Hello", colors=COLORS).spans
+        array = SpanArray.from_spans(spans)
+        self.assertEqual(len(array), 5)
+        self.assertEqual(array[2], spans[2])
+        self.assertEqual(array[-1], spans[-1])
+        self.assertEqual(list(array), spans)
+        self.assertEqual(array[1:3], spans[1:3])
+
+    def test_concat_matches_append(self):
+        parts = [
+            Gradient("Hello", colors=COLORS),
+            " ",
+            Text.from_markup("[b]big[/b] world", style="italic"),
+            ("!", "red"),
+            Gradient("Bye", colors=COLORS, skip_whitespace=True),
+        ]
+        expected = Text()
+        for part in parts:
+            if isinstance(part, tuple):
+                expected.append(*part)
+            else:
+                expected.append(part)
+        joined = Gradient.concat(parts)
+        self.assertEqual(joined.plain, expected.plain)
+        self.assertEqual(joined.spans, expected.spans)
+
+    def test_concat_keeps_span_arrays(self):
+        left = Gradient("Hello", colors=COLORS)
+        right = Gradient("World", colors=COLORS)
+        joined = Gradient.concat([left, (" ", "bold"), right], end="")
+        stored = joined.stored_spans()
+        self.assertIsInstance(stored, SpanArray)
+        self.assertIsInstance(left.stored_spans(), SpanArray)
+        self.assertEqual(joined.end, "")
+        self.assertEqual(stored[6], right.spans[0]._replace(start=6, end=7))
+        self.assertEqual(stored[5], Span(5, 6, "bold"))
+        self.assertEqual(len(stored), 11)
+
+    def test_concat_empty(self):
+        joined = Gradient.concat(["", Text()])
+        self.assertEqual((joined.plain, joined.spans), ("", []))
+
+    def test_copy_shares_span_array(self):
+        gradient = Gradient("Hello World", colors=COLORS)
+        expected = gradient.as_text().spans
+        copied = gradient.copy()
+        self.assertIs(copied.stored_spans(), gradient.stored_spans())
+        copied.stylize("bold", 0, 5)
+        self.assertIsInstance(gradient.stored_spans(), SpanArray)
+        self.assertEqual(copied.spans, [*expected, Span(0, 5, "bold")])
+        self.assertEqual(gradient.spans, expected)
+
+    def test_copy_of_edited_gradient(self):
+        gradient = Gradient("Hello World", colors=COLORS)
+        gradient.stylize("bold", 0, 5)
+        copied = gradient.copy()
+        copied.stylize("italic")
+        self.assertEqual(len(gradient.spans), 12)
+        self.assertEqual(copied.spans[:-1], gradient.spans)
+
+    def test_slice_shares_styles(self):
+        gradient = Gradient("Hello World", colors=COLORS)
+        stored = gradient.stored_spans()
+        sliced = gradient[3:8]
+        cropped = sliced.stored_spans()
+        self.assertIsInstance(cropped, SpanArray)
+        self.assertIs(cropped.styles, stored.styles)
+        self.assertTrue(np.shares_memory(cropped.style_ids, stored.style_ids))
+        self.assertEqual(cropped.to_spans(), stored.clip(3, 8))
+        sliced.stylize("bold")
+        self.assertIs(gradient.stored_spans(), stored)
+
+    def test_span_array_crop_matches_clip(self):
+        style = Style(bold=True)
+        array = SpanArray.from_spans([Span(0, 10, style), Span(12, 20, style)])
+        for start, end in ((4, 14), (5, 6), (10, 12), (0, 20)):
+            self.assertEqual(array.crop(start, end).to_spans(), array.clip(start, end))
+        with self.assertRaises(ValueError):
+            array.starts[0] = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
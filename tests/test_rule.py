@@ -0,0 +1,106 @@
+import io
+import unittest
+from unittest import mock
+
+from rich.console import Console
+from rich.text import Text
+from rich.theme import Theme
+
+from maxgradient.rule import GradientRule, RuleCache
+
+
+def render(rule: GradientRule, width: int = 40) -> str:
+    output = io.StringIO()
+    console = Console(file=output, width=width, color_system="truecolor")
+    console.print(rule)
+    return output.getvalue()
+
+
+class TestRuleCache(unittest.TestCase):
+    def test_redraw_is_a_cache_hit(self):
+        rule = GradientRule("Title", rng=1)
+        first = render(rule)
+        with mock.patch.object(rule, "render_rule") as render_rule:
+            self.assertEqual(render(rule), first)
+        render_rule.assert_not_called()
+        self.assertEqual(len(rule.cache), 1)
+
+    def test_redraw_does_not_parse_the_title(self):
+        rule = GradientRule("[bold]Title[/]", rng=1)
+        console = Console(file=io.StringIO(), width=40)
+        console.print(rule)
+        with mock.patch.object(console, "render_str") as render_str:
+            console.print(rule)
+        render_str.assert_not_called()
+
+    def test_width_and_settings_are_keys(self):
+        rule = GradientRule("Title", rng=1)
+        render(rule)
+        render(rule, width=30)
+        render(rule)
+        self.assertEqual(len(rule.cache), 2)
+        rule.title = "Other"
+        self.assertIn("Other", render(rule))
+        rule.align = "left"
+        render(rule)
+        self.assertEqual(len(rule.cache), 4)
+
+    def test_ascii_only_is_a_key(self):
+        rule = GradientRule(rng=1)
+        console = Console(width=40, color_system="truecolor")
+        ascii_options = console.options.copy()
+        ascii_options.encoding = "ascii"
+        self.assertNotEqual(
+            rule.cache_key(console, console.options),
+            rule.cache_key(console, ascii_options),
+        )
+
+    def test_console_title_settings_are_keys(self):
+        rule = GradientRule("[bold]Title[/] :star:", rng=1)
+        plain = Console(width=40, markup=False, emoji=False)
+        rich = Console(width=40)
+        self.assertNotEqual(
+            rule.cache_key(plain, plain.options), rule.cache_key(rich, rich.options)
+        )
+        rule = GradientRule("[warning]Title[/]", rng=1)
+        key = rule.cache_key(rich, rich.options)
+        with rich.use_theme(Theme({"warning": "italic"})):
+            self.assertNotEqual(rule.cache_key(rich, rich.options), key)
+        self.assertEqual(rule.cache_key(rich, rich.options), key)
+
+    def test_seeded_rule_without_title(self):
+        self.assertEqual(render(GradientRule(rng=4)), render(GradientRule(rng=4)))
+
+    def test_shared_cache(self):
+        shared = RuleCache()
+        first = GradientRule("Title", rng=3, cache=shared)
+        second = GradientRule("Title", rng=3, cache=shared)
+        expected = render(first)
+        with mock.patch.object(second, "render_rule") as render_rule:
+            self.assertEqual(render(second), expected)
+        render_rule.assert_not_called()
+        self.assertEqual(len(shared), 1)
+
+    def test_title_text_is_not_truncated(self):
+        title = Text("A title far too long for the width of this console")
+        rule = GradientRule(title, rng=1)
+        render(rule, width=20)
+        self.assertEqual(
+            title.plain, "A title far too long for the width of this console"
+        )
+
+    def test_cache_drops_oldest(self):
+        cache = RuleCache(2)
+        cache.put(("a",), [])
+        cache.put(("b",), [])
+        cache.put(("c",), [])
+        self.assertIsNone(cache.get(("a",)))
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            RuleCache(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import io
+import os
+import tempfile
+import unittest
+
+from rich.console import Console
+
+from maxgradient.gradient import Gradient
+from maxgradient.streaming import GradientStream, MappedFile, stream
+
+COLORS = ["red", "blue", "green"]
+
+
+def character_styles(segments):
+    return [segment.style for segment in segments for _ in segment.text]
+
+
+class TestStream(unittest.TestCase):
+    def test_matches_periodic_gradient(self):
+        text = "The quick brown fox jumps over the lazy dog. " * 4
+        chunks = [text[index : index + 7] for index in range(0, len(text), 7)]
+        streamed = character_styles(stream(chunks, COLORS, period=16))
+        gradient = Gradient(text, colors=COLORS, period=16)
+        self.assertEqual(streamed, [span.style for span in gradient.spans])
+
+    def test_chunking_does_not_change_colors(self):
+        text = "abcdefghij" * 10
+        whole = character_styles(stream([text], COLORS, period=30))
+        single = character_styles(stream(iter(text), COLORS, period=30))
+        self.assertEqual(whole, single)
+
+    def test_newlines_are_unstyled(self):
+        segments = list(stream(["ab\ncd\n"], COLORS, period=4))
+        newlines = [segment for segment in segments if segment.text == "\n"]
+        self.assertEqual(len(newlines), 2)
+        self.assertTrue(all(segment.style is None for segment in newlines))
+        self.assertEqual("".join(segment.text for segment in segments), "ab\ncd\n")
+
+    def test_runs_of_one_color_are_merged(self):
+        segments = list(stream(["x" * 100], ["red", "red"], period=10))
+        self.assertEqual(len(segments), 1)
+
+    def test_ansi_output(self):
+        chunks = list(stream(["Hello", " World"], COLORS, ansi=True))
+        self.assertEqual(len(chunks), 2)
+        self.assertIn("\x1b[38;2;", chunks[0])
+
+    def test_write(self):
+        output = io.StringIO()
+        GradientStream(["Hello\n"], COLORS, period=5).write(output, "256")
+        self.assertIn("\x1b[38;5;", output.getvalue())
+        self.assertTrue(output.getvalue().endswith("\n"))
+
+    def test_print(self):
+        console = Console(record=True, width=40)
+        console.print(GradientStream(["Hello ", "World"], COLORS), end="")
+        self.assertEqual(console.export_text(), "Hello World")
+
+    def test_invalid_period(self):
+        with self.assertRaises(ValueError):
+            GradientStream(["Hello"], COLORS, period=0)
+
+
+class TestFromFile(unittest.TestCase):
+    def write_file(self, data: bytes) -> str:
+        handle, path = tempfile.mkstemp()
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_matches_gradient(self):
+        text = "The quick brown fox jumps over the lazy dog. " * 20
+        path = self.write_file(text.encode())
+        streamed = character_styles(Gradient.from_file(path, COLORS, chunk_size=64))
+        gradient = Gradient(text, colors=COLORS)
+        self.assertEqual(streamed, [span.style for span in gradient.spans])
+
+    def test_decodes_characters_split_between_blocks(self):
+        text = "caf\u00e9 \u4e2d\u6587 " * 50
+        path = self.write_file(text.encode("utf-8"))
+        mapped = MappedFile(path, chunk_size=7)
+        self.assertEqual("".join(mapped), text)
+        self.assertEqual("".join(mapped), text)
+
+    def test_measure_counts_cells(self):
+        text = "ab\n" * 100 + "\u4e2d" + "cd\r\n" * 100
+        path = self.write_file(text.encode("utf-8"))
+        self.assertEqual(MappedFile(path, chunk_size=16).measure(), 402)
+
+    def test_periodic_file(self):
+        text = "abcdefghij\n" * 30
+        path = self.write_file(text.encode())
+        streamed = character_styles(Gradient.from_file(path, COLORS, period=12))
+        self.assertEqual(streamed, character_styles(stream([text], COLORS, period=12)))
+
+    def test_write(self):
+        path = self.write_file("Hello\nWorld\n".encode("latin-1"))
+        output = io.StringIO()
+        Gradient.from_file(path, COLORS, encoding="latin-1").write(output)
+        self.assertIn("\x1b[38;2;", output.getvalue())
+
+    def test_empty_file(self):
+        path = self.write_file(b"")
+        self.assertEqual(list(Gradient.from_file(path, COLORS)), [])
+
+    def test_single_color_is_rejected(self):
+        path = self.write_file(b"Hello")
+        with self.assertRaises(TypeError):
+            Gradient.from_file(path, "red")
+
+
+if __name__ == "__main__":
+    unittest.main()